@@ -1,23 +1,45 @@
 from typing import Dict, List, Optional
 import json
+import logging
 import os
 from pathlib import Path
 
+from services.chat_history_writer import get_chat_history_writer
+
+logger = logging.getLogger(__name__)
+
 # Gemini 우선, Ollama fallback
 USE_GEMINI = os.getenv("USE_GEMINI", "false").lower() == "true"
 
-if USE_GEMINI:
-    try:
-        from chatbot.gemini_client import gemini_client as ai_client
-        print("[OK] Using Gemini API")
-    except Exception as e:
-        print(f"[WARN] Gemini failed, falling back to Ollama: {e}")
-        from chatbot.ollama_client import ollama_client as ai_client
-else:
-    from chatbot.ollama_client import ollama_client as ai_client
-    print("[OK] Using Ollama")
-
-from services.comfyui_client import comfyui_client
+# AI 클라이언트는 첫 대화에서 선택/생성 (콜드 스타트에 SDK import 없음)
+_ai_client = None
+
+
+def get_ai_client():
+    """대화용 AI 클라이언트 반환 (Gemini 우선, 실패하면 Ollama)"""
+    global _ai_client
+    if _ai_client is None:
+        if USE_GEMINI:
+            try:
+                from chatbot.gemini_client import get_gemini_client
+                _ai_client = get_gemini_client()
+                if _ai_client is None:
+                    raise RuntimeError("GEMINI_API_KEY not set")
+                logger.info("Using Gemini API")
+            except Exception as e:
+                logger.warning(f"Gemini failed, falling back to Ollama: {e}")
+        if _ai_client is None:
+            from chatbot.ollama_client import get_ollama_client
+            _ai_client = get_ollama_client()
+            logger.info("Using Ollama")
+    return _ai_client
+
+
+def __getattr__(name: str):
+    # 기존 모듈 속성 ai_client 호환 (PEP 562, 첫 접근 시 생성)
+    if name == "ai_client":
+        return get_ai_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ConversationManager:
@@ -101,6 +123,8 @@ class ConversationManager:
         if not session:
             return {"error": "세션을 찾을 수 없습니다."}
 
+        history_writer = get_chat_history_writer()
+
         # 대화 기록 저장
         session["conversation_history"].append({
             "role": "user",
@@ -108,6 +132,12 @@ class ConversationManager:
         })
 
         current_step = session["current_step"]
+        history_writer.record(
+            session_id,
+            "user",
+            user_message,
+            {"step": current_step, "selected_option": selected_option}
+        )
 
         # 옵션 선택 처리
         if selected_option:
@@ -129,6 +159,12 @@ class ConversationManager:
                 "role": "assistant",
                 "content": response["message"]
             })
+            history_writer.record(
+                session_id,
+                "assistant",
+                response["message"],
+                {"step": session["current_step"]}
+            )
 
         return response
 
@@ -186,6 +222,7 @@ class ConversationManager:
                 }
 
             # AI 분석 수행
+            ai_client = get_ai_client()
             if hasattr(ai_client, 'analyze_consultation_data'):
                 analysis = await ai_client.analyze_consultation_data(
                     session["collected_data"]
@@ -247,7 +284,8 @@ class ConversationManager:
                     audio_prompt = await self._generate_audio_prompt(expected_activity)
 
                     # ComfyUI로 비디오 생성
-                    result = await comfyui_client.generate_cat_video_with_audio(
+                    from services.comfyui_client import get_comfyui_client
+                    result = await get_comfyui_client().generate_cat_video_with_audio(
                         text_prompt=text_prompt,
                         video_positive_prompt=video_prompt["positive"],
                         video_negative_prompt=video_prompt["negative"],
@@ -369,7 +407,7 @@ class ConversationManager:
         session = self.sessions[session_id]
 
         # AI를 통한 응답 생성
-        response_text = await ai_client.chat(
+        response_text = await get_ai_client().chat(
             message=user_message,
             chat_history=session["conversation_history"]
         )
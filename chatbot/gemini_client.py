@@ -5,10 +5,16 @@ Google Gemini API 클라이언트
 
 import os
 import json
+import logging
 from pathlib import Path
 from typing import Dict, Optional
 import google.generativeai as genai
 
+from services.product_catalog import get_product_catalog
+from utils.logger import log_sampled
+
+logger = logging.getLogger(__name__)
+
 
 class GeminiClient:
     """Google Gemini API를 사용한 AI 클라이언트"""
@@ -29,8 +35,8 @@ class GeminiClient:
 
         # Playcat 데이터 로드
         self.knowledge = self._load_knowledge()
-        self.products = self._load_products()
-        self.system_prompt = self._build_system_prompt()
+        self._prompt_version = None
+        self._system_prompt = None
 
     def _load_knowledge(self) -> Dict:
         """지식 베이스 로드"""
@@ -39,18 +45,24 @@ class GeminiClient:
             with open(knowledge_path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception as e:
-            print(f"Warning: Failed to load knowledge: {e}")
+            log_sampled(logger, logging.WARNING, "knowledge_load", f"Failed to load knowledge: {e}")
             return {}
 
-    def _load_products(self) -> Dict:
-        """제품 데이터 로드"""
-        try:
-            products_path = Path(__file__).parent.parent / "data" / "products_real.json"
-            with open(products_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Warning: Failed to load products: {e}")
-            return {}
+    @property
+    def products(self) -> Dict:
+        """제품 데이터 (공유 카탈로그 스냅샷, products_real.json 형태)"""
+        snapshot = get_product_catalog().snapshot
+        return snapshot.document if snapshot else {}
+
+    @property
+    def system_prompt(self) -> str:
+        """시스템 프롬프트 (카탈로그 버전이 바뀔 때만 다시 생성)"""
+        snapshot = get_product_catalog().snapshot
+        version = snapshot.version if snapshot else None
+        if self._system_prompt is None or version != self._prompt_version:
+            self._system_prompt = self._build_system_prompt()
+            self._prompt_version = version
+        return self._system_prompt
 
     def _build_system_prompt(self) -> str:
         """시스템 프롬프트 구성"""
@@ -140,8 +152,7 @@ class GeminiClient:
             return response.text.strip()
 
         except Exception as e:
-            error_msg = f"AI 응답 생성 중 오류 발생: {str(e)}"
-            print(error_msg)
+            log_sampled(logger, logging.ERROR, "generate_response", f"AI 응답 생성 중 오류 발생: {e}")
             return "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
 
     def get_product_info(self, product_id: str) -> Optional[Dict]:
@@ -164,11 +175,27 @@ class GeminiClient:
         return breed_tips.get(breed)
 
 
-# 싱글톤 인스턴스 (환경 변수가 있을 때만 생성)
-gemini_client = None
-if os.getenv("GEMINI_API_KEY"):
-    try:
-        gemini_client = GeminiClient()
-        print("[OK] Gemini API client initialized")
-    except Exception as e:
-        print(f"[WARN] Failed to initialize Gemini client: {e}")
+# 싱글톤 인스턴스 (환경 변수가 있을 때만, 첫 사용 시 생성)
+_gemini_client: Optional[GeminiClient] = None
+_gemini_initialized = False
+
+
+def get_gemini_client() -> Optional[GeminiClient]:
+    """GeminiClient 싱글톤 인스턴스 반환 (API 키가 없거나 초기화 실패 시 None)"""
+    global _gemini_client, _gemini_initialized
+    if not _gemini_initialized:
+        _gemini_initialized = True
+        if os.getenv("GEMINI_API_KEY"):
+            try:
+                _gemini_client = GeminiClient()
+                logger.info("Gemini API client initialized")
+            except Exception as e:
+                logger.warning(f"Failed to initialize Gemini client: {e}")
+    return _gemini_client
+
+
+def __getattr__(name: str):
+    # 기존 `from chatbot.gemini_client import gemini_client` 호환 (PEP 562)
+    if name == "gemini_client":
+        return get_gemini_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,8 @@ from typing import List, Dict, Optional
 import json
 from pathlib import Path
 
+from services.product_catalog import get_product_catalog
+
 
 class OllamaClient:
     """플레이캣 전문 상담 AI 클라이언트"""
@@ -13,8 +15,8 @@ class OllamaClient:
     def __init__(self, model: str = "qwen2.5:latest"):
         self.model = model
         self.knowledge = self._load_knowledge()
-        self.products = self._load_products()
-        self.system_prompt = self._build_system_prompt()
+        self._prompt_version = None
+        self._system_prompt = None
 
     def _load_knowledge(self) -> Dict:
         """상담 지식 베이스 로드"""
@@ -22,11 +24,21 @@ class OllamaClient:
         with open(knowledge_path, "r", encoding="utf-8") as f:
             return json.load(f)
 
-    def _load_products(self) -> Dict:
-        """제품 데이터 로드"""
-        products_path = Path(__file__).parent.parent / "data" / "products_real.json"
-        with open(products_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    @property
+    def products(self) -> Dict:
+        """제품 데이터 (공유 카탈로그 스냅샷, products_real.json 형태)"""
+        snapshot = get_product_catalog().snapshot
+        return snapshot.document if snapshot else {}
+
+    @property
+    def system_prompt(self) -> str:
+        """시스템 프롬프트 (카탈로그 버전이 바뀔 때만 다시 생성)"""
+        snapshot = get_product_catalog().snapshot
+        version = snapshot.version if snapshot else None
+        if self._system_prompt is None or version != self._prompt_version:
+            self._system_prompt = self._build_system_prompt()
+            self._prompt_version = version
+        return self._system_prompt
 
     def _build_system_prompt(self) -> str:
         """실제 데이터 기반 시스템 프롬프트 생성"""
@@ -351,5 +363,20 @@ FAQ:
             return f"답변 생성 중 오류가 발생했습니다: {str(e)}"
 
 
-# 전역 인스턴스
-ollama_client = OllamaClient()
+# 싱글톤 인스턴스 (첫 사용 시 생성, 지식 베이스 JSON 로드 포함)
+_ollama_client: Optional[OllamaClient] = None
+
+
+def get_ollama_client() -> OllamaClient:
+    """OllamaClient 싱글톤 인스턴스 반환"""
+    global _ollama_client
+    if _ollama_client is None:
+        _ollama_client = OllamaClient()
+    return _ollama_client
+
+
+def __getattr__(name: str):
+    # 기존 `from chatbot.ollama_client import ollama_client` 호환 (PEP 562)
+    if name == "ollama_client":
+        return get_ollama_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
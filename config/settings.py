@@ -35,8 +35,49 @@ class Settings(BaseSettings):
     KAKAO_WEBHOOK_URL: Optional[str] = None
     DISCORD_WEBHOOK_URL: Optional[str] = None
     
+    # Notification Dispatcher (알림 백그라운드 전송)
+    NOTIFICATION_QUEUE_SIZE: int = 1000  # 초과 시 알림 누락 (응답은 막지 않음)
+    NOTIFICATION_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_RETRY_BASE_SECONDS: float = 2.0  # 재시도 간격 2, 4, 8, ... 초
+    NOTIFICATION_RETRY_MAX_SECONDS: float = 120.0
+    NOTIFICATION_OUTBOX_ENABLED: bool = False  # 전송 전 DB 기록 (재시작 후 재전송)
+    NOTIFICATION_SHUTDOWN_TIMEOUT_SECONDS: float = 5.0  # 종료 시 남은 알림 전송 대기
+    NOTIFICATION_DIGEST_ENABLED: bool = True  # 채팅 알림을 세션별 요약 한 건으로 묶음
+    NOTIFICATION_DIGEST_QUIET_SECONDS: float = 120.0  # 마지막 메시지 후 이만큼 조용하면 전송
+    NOTIFICATION_DIGEST_MAX_WAIT_SECONDS: float = 900.0  # 대화가 계속돼도 이 간격마다 전송
+    NOTIFICATION_DIGEST_MAX_TURNS: int = 10  # 요약에 싣는 최근 대화 턴 수
+    NOTIFICATION_DEDUP_WINDOW_SECONDS: float = 600.0  # 같은 알림 재전송 억제 시간
+    NOTIFICATION_RATE_KAKAO_PER_MINUTE: int = 10  # 채널별 분당 전송 한도 (0이면 무제한)
+    NOTIFICATION_RATE_WEBHOOK_PER_MINUTE: int = 60
+    NOTIFICATION_RATE_DISCORD_PER_MINUTE: int = 25
+    NOTIFICATION_TIMEOUT_KAKAO_SECONDS: float = 5.0  # 채널별 요청 전체 timeout
+    NOTIFICATION_TIMEOUT_WEBHOOK_SECONDS: float = 5.0
+    NOTIFICATION_TIMEOUT_DISCORD_SECONDS: float = 5.0
+    NOTIFICATION_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    NOTIFICATION_BREAKER_FAILURES: int = 3  # 연속 실패 시 채널 차단
+    NOTIFICATION_BREAKER_COOLDOWN_SECONDS: float = 60.0  # 차단 후 재시도까지 대기
+    NOTIFICATION_MAX_INFLIGHT: int = 8  # 채널별 동시 전송 수 (채널끼리는 서로 막지 않음)
+    
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./playcat_chatbot.db"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 잠금 대기 시간
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256MB
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # 연결당 페이지 캐시 64MB
+    
+    # Chat History (대화 기록 지연 저장)
+    CHAT_HISTORY_FLUSH_INTERVAL_MS: int = 500  # 배치 최대 대기 시간
+    CHAT_HISTORY_BATCH_SIZE: int = 200  # 한 번에 삽입할 최대 행 수
+    CHAT_HISTORY_QUEUE_SIZE: int = 10000  # 초과 시 기록 누락 (응답은 막지 않음)
+    
+    # Admin API (X-Admin-Token 헤더, 비어 있으면 관리자 API 비활성화)
+    ADMIN_API_TOKEN: Optional[str] = None
+    ADMIN_PAGE_SIZE: int = 50
+    ADMIN_MAX_PAGE_SIZE: int = 200
+    
+    # Lead Analytics Rollups (일별 집계 주기)
+    ROLLUP_INTERVAL_SECONDS: int = 60
+    ROLLUP_MAX_DELTA_DAYS: int = 60  # 변경된 날짜가 이보다 많으면 전체 재계산
+    ROLLUP_LOCK_FILE: str = "./lead_rollups.lock"  # 워커 중 잠금을 얻은 한 프로세스만 갱신 (비우면 잠금 없음)
     
     # CORS
     CORS_ORIGINS: list = ["*"]
@@ -49,6 +90,43 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_UPLOAD_EXTENSIONS: set = {".jpg", ".jpeg", ".png", ".webp"}
     UPLOAD_DIR: str = "static/uploads"
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024  # 스트리밍 저장 청크 크기
+    UPLOAD_WORKING_MAX_EDGE: int = 2560  # 정규화 작업용 사본 긴 변
+    UPLOAD_THUMBNAIL_EDGE: int = 320
+    UPLOAD_MODERN_FORMAT: str = "webp"  # webp 또는 avif (미지원 시 webp)
+    
+    # Image Processing Pool (이미지 합성 워커 프로세스)
+    IMAGE_POOL_WORKERS: int = 2
+    IMAGE_POOL_MAX_PENDING: int = 8  # 초과 시 503 응답
+    
+    # PDF Quote Pool (견적서 렌더링 워커 프로세스)
+    PDF_POOL_WORKERS: int = 2
+    PDF_POOL_MAX_PENDING: int = 16  # 초과 시 503 응답
+    
+    # Quote PDF Cache (static/quotes 크기 제한)
+    QUOTE_CACHE_MAX_BYTES: int = 200 * 1024 * 1024  # 200MB
+    
+    # Bulk Quote Reissue (견적 일괄 재발행)
+    BULK_QUOTE_WORKERS: int = 0  # 0이면 CPU 코어 수
+    BULK_QUOTE_RENDER_CHUNK: int = 25  # 워커 작업 하나당 PDF 수
+    BULK_QUOTE_WRITE_BATCH: int = 500  # 트랜잭션 하나당 UPDATE 행 수
+    
+    # Composite Preview (축소본 미리보기)
+    PREVIEW_MAX_EDGE: int = 1280
+    PREVIEW_JPEG_QUALITY: int = 80
+    
+    # Composite Result Cache (static/composites 크기 제한)
+    COMPOSITE_CACHE_MAX_BYTES: int = 500 * 1024 * 1024  # 500MB
+    
+    # Qwen2-VL (사진 분석, 첫 사용 시 로드 / 유휴 시 언로드)
+    QWEN_MODEL_NAME: str = "Qwen/Qwen2-VL-7B-Instruct"  # GPU용 (float16)
+    QWEN_CPU_MODEL_NAME: str = "Qwen/Qwen2-VL-2B-Instruct"  # CPU에서는 작은 모델
+    QWEN_DEVICE: str = "auto"  # auto, cuda, cpu
+    QWEN_CPU_DTYPE: str = "bfloat16"  # bfloat16, int8 (Linear 동적 양자화), float32
+    QWEN_IDLE_UNLOAD_SECONDS: int = 900  # 마지막 사용 후 언로드 (0이면 유지)
+    QWEN_MAX_PIXELS: int = 1280 * 28 * 28  # 입력 이미지 최대 픽셀 (약 1MP, 28px 격자)
+    QWEN_BATCH_SIZE: int = 4  # 한 번의 generate()로 묶을 최대 요청 수
+    QWEN_BATCH_WAIT_MS: int = 50  # 배치를 모으는 최대 대기 시간
     
     # ComfyUI (이미지 생성)
     COMFYUI_SERVER_ADDRESS: str = "127.0.0.1:8188"
@@ -56,7 +134,12 @@ class Settings(BaseSettings):
     
     # Logging
     LOG_LEVEL: str = "INFO"
-    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"  # LOG_JSON=false일 때 콘솔 포맷
+    LOG_JSON: bool = True  # 콘솔도 JSON Lines로 출력 (파일은 항상 JSON)
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024  # 로그 파일 회전 크기
+    LOG_FILE_BACKUP_COUNT: int = 5  # 회전 파일 보관 개수
+    LOG_QUEUE_SIZE: int = 10000  # 쓰기 스레드 대기 큐 (가득 차면 버림)
+    LOG_SAMPLE_INTERVAL_SECONDS: float = 10.0  # 반복 로그 샘플링 간격
     
     class Config:
         env_file = ".env"
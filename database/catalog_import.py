@@ -0,0 +1,219 @@
+"""
+제품 카탈로그 import 파이프라인
+data/products_real.json + data/products.json → products 테이블
+"""
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+
+from database.models import Product
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# 판매 중인 실제 카탈로그 (우선)
+PRIMARY_CATALOG = DATA_DIR / "products_real.json"
+# 자동 배치/합성에서 쓰는 기존 제품 ID (실제 카탈로그에 없는 것만 비활성으로 추가, 판매/견적 제외)
+LEGACY_CATALOG = DATA_DIR / "products.json"
+
+SIZE_FIELDS = ("width", "depth", "height", "diameter")
+CORE_FIELDS = {"id", "name", "category", "size", "base_price", "description", "usage", "material", "image_path"}
+
+
+class CatalogSources:
+    """JSON 원본을 한 번 파싱한 결과"""
+
+    def __init__(
+        self,
+        products: List[Dict],
+        legacy_products: List[Dict],
+        pricing: Dict,
+        document: Dict,
+        mtimes: Tuple[int, ...]
+    ):
+        self.products = products
+        self.legacy_products = legacy_products
+        self.pricing = pricing
+        self.document = document
+        self.mtimes = mtimes
+
+
+def source_mtimes() -> Tuple[int, ...]:
+    """원본 파일 mtime (변경 감지용)"""
+    mtimes = []
+    for path in (PRIMARY_CATALOG, LEGACY_CATALOG):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
+def _read_json(path: Path) -> Dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_catalog_sources() -> CatalogSources:
+    """
+    카탈로그 원본 파싱 및 병합
+
+    - 제품: 실제 카탈로그 (판매 제품)
+    - 기존 제품: 기존 카탈로그 중 ID가 겹치지 않는 항목 (비활성으로 import)
+    - 가격 정책: 실제 카탈로그의 설치비/지역 할증/컬러 옵션만 사용
+    - 문서: 브랜드/FAQ 등 프롬프트용 정보 (products 제외)
+    """
+    mtimes = source_mtimes()
+    primary = _read_json(PRIMARY_CATALOG)
+    legacy = _read_json(LEGACY_CATALOG)
+
+    products = primary.get("products", [])
+    seen = {product["id"] for product in products}
+    legacy_products = [
+        product for product in legacy.get("products", [])
+        if product["id"] not in seen
+    ]
+
+    services = primary.get("installation_services", {})
+    pricing = {
+        "installation_fee": {
+            "base": services.get("base_fee", 0),
+            "per_product": services.get("per_product_fee", 0),
+            "regional_surcharge": dict(services.get("regional_surcharge", {}))
+        },
+        "color_options": primary.get("color_options", {})
+    }
+
+    document = {key: value for key, value in primary.items() if key != "products"}
+
+    return CatalogSources(products, legacy_products, pricing, document, mtimes)
+
+
+def product_to_row(product: Dict, sort_order: int, is_active: bool = True) -> Dict:
+    """카탈로그 JSON 항목 → products 테이블 컬럼 (기존 제품은 is_active=False)"""
+    size = product.get("size", {})
+    row = {
+        "product_id": product["id"],
+        "name": product.get("name"),
+        "category": product.get("category"),
+        "base_price": product.get("base_price"),
+        "description": product.get("description"),
+        "usage": product.get("usage"),
+        "material": product.get("material"),
+        "image_path": product.get("image_path"),
+        "attributes": {k: v for k, v in product.items() if k not in CORE_FIELDS} or None,
+        "sort_order": sort_order,
+        "is_active": is_active
+    }
+    for field in SIZE_FIELDS:
+        row[field] = size.get(field)
+    return row
+
+
+def _number(value):
+    """정수로 표현 가능한 Float 컬럼 값은 int로"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def row_to_product(row: Product) -> Dict:
+    """products 테이블 행 → API/프롬프트용 제품 딕셔너리"""
+    product = {
+        "id": row.product_id,
+        "name": row.name,
+        "category": row.category,
+        "size": {
+            field: _number(getattr(row, field))
+            for field in SIZE_FIELDS
+            if getattr(row, field) is not None
+        },
+        "base_price": _number(row.base_price),
+        "description": row.description,
+        "usage": row.usage
+    }
+    if row.material:
+        product["material"] = row.material
+    if row.image_path:
+        product["image_path"] = row.image_path
+    if row.attributes:
+        product.update(row.attributes)
+    return product
+
+
+async def import_catalog(session, sources: CatalogSources = None) -> Dict:
+    """
+    카탈로그를 products 테이블에 반영 (upsert)
+
+    - 변경된 행만 UPDATE
+    - 기존 카탈로그 전용 제품과 원본에서 사라진 제품은 is_active=False
+
+    Returns:
+        {"inserted": n, "updated": n, "deactivated": n}
+    """
+    sources = sources or load_catalog_sources()
+
+    result = await session.execute(select(Product))
+    existing = {row.product_id: row for row in result.scalars()}
+
+    stats = {"inserted": 0, "updated": 0, "deactivated": 0}
+    incoming = set()
+
+    entries = [(product, True) for product in sources.products]
+    entries += [(product, False) for product in sources.legacy_products]
+
+    for sort_order, (product, is_active) in enumerate(entries):
+        values = product_to_row(product, sort_order, is_active)
+        incoming.add(values["product_id"])
+
+        row = existing.get(values["product_id"])
+        if row is None:
+            session.add(Product(**values))
+            stats["inserted"] += 1
+            continue
+
+        if row.is_active and not is_active:
+            stats["deactivated"] += 1
+        changed = False
+        for column, value in values.items():
+            if getattr(row, column) != value:
+                setattr(row, column, value)
+                changed = True
+        if changed:
+            stats["updated"] += 1
+
+    for product_id, row in existing.items():
+        if product_id not in incoming and row.is_active:
+            row.is_active = False
+            stats["deactivated"] += 1
+
+    await session.commit()
+    return stats
+
+
+async def fetch_active_products(session) -> List[Dict]:
+    """활성 제품 목록 (표시 순서)"""
+    result = await session.execute(
+        select(Product)
+        .where(Product.is_active.is_(True))
+        .order_by(Product.sort_order, Product.id)
+    )
+    return [row_to_product(row) for row in result.scalars()]
+
+
+async def _main():
+    from database.connection import AsyncSessionLocal, init_db
+
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        stats = await import_catalog(session)
+    print(f"Catalog imported: {stats}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
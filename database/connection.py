@@ -1,26 +1,81 @@
-from sqlalchemy import create_engine
+# Database package
+import logging
+from contextlib import asynccontextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from database.models import Base
-import os
+from config.settings import get_settings
+from database.migrations import run_migrations
 
-# 데이터베이스 파일 경로
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "playcat.db")
-ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
-SYNC_DATABASE_URL = f"sqlite:///{DB_PATH}"
+settings = get_settings()
+
+
+def _async_database_url(url: str) -> str:
+    """DATABASE_URL을 비동기 드라이버 URL로 변환 (sqlite:// → sqlite+aiosqlite://)"""
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = _async_database_url(settings.DATABASE_URL)
+IS_SQLITE = make_url(ASYNC_DATABASE_URL).get_backend_name() == "sqlite"
+
+# SQLite 연결 옵션 (잠금 대기는 busy_timeout과 동일하게)
+_connect_args = {"timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000} if IS_SQLITE else {}
+
+# SQL 로그는 DEBUG에서만
+# echo=True는 sqlalchemy 로거에 동기 StreamHandler를 따로 붙이므로 레벨만 올려 큐 로깅으로 전달
+if settings.DEBUG:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
 # 비동기 엔진
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
-    echo=True,
-    future=True
+    echo=False,
+    future=True,
+    connect_args=_connect_args
 )
 
-# 동기 엔진 (테이블 생성용)
-sync_engine = create_engine(
-    SYNC_DATABASE_URL,
-    echo=True
-)
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    모든 SQLite 연결에 성능/동시성 PRAGMA 적용
+
+    - WAL: 읽기와 쓰기가 서로 막지 않음 (여러 uvicorn 워커)
+    - synchronous=NORMAL: WAL에서 안전하면서 커밋당 fsync 최소화
+    - busy_timeout: 잠금 시 즉시 실패하지 않고 대기
+    - mmap_size / cache_size: 읽기 I/O 감소
+    """
+    # 트랜잭션 시작은 아래 begin 이벤트에서 직접 제어
+    dbapi_connection.isolation_level = None
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _begin_sqlite_transaction(conn):
+    """
+    트랜잭션 시작
+
+    쓰기 세션은 BEGIN IMMEDIATE로 시작해 처음부터 쓰기 잠금을 잡음.
+    DEFERRED 트랜잭션이 읽기 → 쓰기로 승격할 때는 busy_timeout이 적용되지 않아
+    다중 워커에서 'database is locked'가 발생하므로 이를 피함
+    """
+    mode = conn.get_execution_options().get("sqlite_begin", "DEFERRED")
+    conn.exec_driver_sql(f"BEGIN {mode}")
+
+
+if IS_SQLITE:
+    event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "begin", _begin_sqlite_transaction)
 
 # 세션 팩토리
 AsyncSessionLocal = sessionmaker(
@@ -43,11 +98,33 @@ async def get_db():
             await session.close()
 
 
-def init_db():
-    """데이터베이스 테이블 생성"""
-    Base.metadata.create_all(bind=sync_engine)
-    print("Database tables created successfully!")
+@asynccontextmanager
+async def write_session():
+    """
+    쓰기 전용 세션 (단일 트랜잭션, SQLite는 BEGIN IMMEDIATE)
+
+    블록이 정상 종료되면 커밋, 예외 시 롤백
+    """
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+            yield session
+
+
+async def init_db():
+    """
+    스키마 초기화 및 마이그레이션 (비동기 엔진 사용)
+
+    저장된 스키마 버전이 최신이면 DDL 없이 바로 반환
+
+    Returns:
+        적용한 마이그레이션 버전 목록
+    """
+    return await run_migrations(async_engine)
 
 
 if __name__ == "__main__":
-    init_db()
+    import asyncio
+
+    applied = asyncio.run(init_db())
+    print(f"Database schema up to date (applied: {applied or 'none'})")
@@ -0,0 +1,170 @@
+"""
+스키마 마이그레이션
+비동기 엔진으로 버전별 증분 마이그레이션 실행 (SQLite PRAGMA user_version 기록)
+
+- 저장된 버전이 최신이면 PRAGMA 한 번만 읽고 종료 (콜드 스타트에 DDL 없음)
+- 빈 DB는 현재 모델로 전체 생성 후 최신 버전 기록
+- 기존 DB는 저장된 버전 이후의 마이그레이션만 순서대로 적용
+
+새 마이그레이션은 MIGRATIONS 끝에 (버전, 설명, 함수)로 추가하고,
+함수는 기존 DB에서 여러 번 실행돼도 안전하게 작성 (컬럼/인덱스 존재 확인)
+"""
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from database.models import Base, ChatDailyStat, LeadDailyStat, NotificationOutbox, RollupState
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== 헬퍼 ====================
+
+def add_column_if_missing(conn: Connection, table: str, column: str, ddl: str):
+    """테이블에 컬럼이 없으면 추가"""
+    columns = {c["name"] for c in inspect(conn).get_columns(table)}
+    if column not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+
+def create_index_if_missing(conn: Connection, name: str, table: str, columns: List[str]):
+    """인덱스가 없으면 생성"""
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+    ))
+
+
+def create_tables(conn: Connection, *models):
+    """모델 테이블이 없으면 생성 (인덱스 포함)"""
+    Base.metadata.create_all(conn, tables=[model.__table__ for model in models])
+
+
+# ==================== 마이그레이션 ====================
+
+def _v1_baseline(conn: Connection):
+    """기존 테이블 중 없는 것 생성"""
+    Base.metadata.create_all(conn)
+
+
+def _v2_product_catalog(conn: Connection):
+    """제품 카탈로그 컬럼 및 인덱스"""
+    add_column_if_missing(conn, "products", "material", "VARCHAR(100)")
+    add_column_if_missing(conn, "products", "attributes", "JSON")
+    add_column_if_missing(conn, "products", "sort_order", "INTEGER DEFAULT 0")
+    create_index_if_missing(conn, "ix_products_category", "products", ["category"])
+    create_index_if_missing(conn, "ix_products_is_active", "products", ["is_active"])
+
+
+def _v3_consultation_contact(conn: Connection):
+    """상담 세션 ID 및 이메일"""
+    add_column_if_missing(conn, "consultations", "session_id", "VARCHAR(200)")
+    add_column_if_missing(conn, "consultations", "contact_email", "VARCHAR(200)")
+    create_index_if_missing(conn, "ix_consultations_session_id", "consultations", ["session_id"])
+
+
+def _v4_admin_indexes(conn: Connection):
+    """관리자 목록 조회 인덱스"""
+    create_index_if_missing(conn, "ix_consultations_created_at", "consultations", ["created_at"])
+    create_index_if_missing(
+        conn, "ix_consultations_status_created_at", "consultations", ["status", "created_at"]
+    )
+    create_index_if_missing(
+        conn, "ix_consultations_channel_created_at", "consultations", ["channel", "created_at"]
+    )
+    create_index_if_missing(
+        conn, "ix_installations_consultation_region", "installations", ["consultation_id", "region"]
+    )
+    create_index_if_missing(
+        conn, "ix_chat_history_session_created_at", "chat_history", ["session_id", "created_at"]
+    )
+    conn.execute(text("ANALYZE"))
+
+
+def _v5_lead_rollups(conn: Connection):
+    """상담/대화 일별 집계 테이블"""
+    create_tables(conn, LeadDailyStat, ChatDailyStat, RollupState)
+    create_index_if_missing(conn, "ix_consultations_updated_at", "consultations", ["updated_at"])
+
+
+def _v6_notification_outbox(conn: Connection):
+    """관리자 알림 outbox 테이블"""
+    create_tables(conn, NotificationOutbox)
+
+
+def _v7_notification_outbox_channels(conn: Connection):
+    """outbox에 남은 채널 목록 (재시작 후 이미 성공한 채널로 재전송 방지)"""
+    add_column_if_missing(conn, "notification_outbox", "channels", "JSON")
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline schema", _v1_baseline),
+    (2, "product catalog columns and indexes", _v2_product_catalog),
+    (3, "consultation session and email", _v3_consultation_contact),
+    (4, "admin listing indexes", _v4_admin_indexes),
+    (5, "lead analytics rollups", _v5_lead_rollups),
+    (6, "notification outbox", _v6_notification_outbox),
+    (7, "notification outbox channels", _v7_notification_outbox_channels),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+# ==================== 실행 ====================
+
+def _get_version(conn: Connection) -> int:
+    return conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+
+def _apply(conn: Connection) -> List[int]:
+    """쓰기 잠금을 잡은 상태에서 버전 재확인 후 적용"""
+    version = _get_version(conn)
+    if version >= LATEST_VERSION:
+        return []
+
+    if version == 0 and not inspect(conn).get_table_names():
+        # 빈 DB: 현재 모델 그대로 생성
+        Base.metadata.create_all(conn)
+        applied = [LATEST_VERSION]
+    else:
+        applied = []
+        for migration_version, description, migrate in MIGRATIONS:
+            if migration_version > version:
+                logger.info(f"Applying migration {migration_version}: {description}")
+                migrate(conn)
+                applied.append(migration_version)
+
+    conn.exec_driver_sql(f"PRAGMA user_version = {LATEST_VERSION}")
+    return applied
+
+
+async def run_migrations(engine: AsyncEngine) -> List[int]:
+    """
+    스키마를 최신 버전으로 맞춤
+
+    Returns:
+        적용한 마이그레이션 버전 목록 (이미 최신이면 빈 목록)
+    """
+    if engine.dialect.name != "sqlite":
+        # user_version이 없는 DB는 누락 테이블만 생성
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        return []
+
+    # 빠른 경로: 읽기 한 번으로 최신 여부 확인
+    async with engine.connect() as conn:
+        version = await conn.run_sync(_get_version)
+    if version >= LATEST_VERSION:
+        return []
+
+    # 여러 워커가 동시에 시작해도 한 곳에서만 적용되도록 BEGIN IMMEDIATE
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(sqlite_begin="IMMEDIATE")
+        async with conn.begin():
+            applied = await conn.run_sync(_apply)
+
+    if applied:
+        logger.info(f"Database schema migrated to version {LATEST_VERSION}")
+    return applied
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, JSON, ForeignKey, Text, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -11,8 +11,10 @@ class Consultation(Base):
     __tablename__ = "consultations"
 
     id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(String(200), index=True)  # 챗봇 세션
     customer_name = Column(String(100))
     contact = Column(String(100))
+    contact_email = Column(String(200), nullable=True)
     channel = Column(String(50))  # kakao, instagram, web
     consultation_type = Column(String(50))  # detailed_quote, rough_quote, other_inquiry
     status = Column(String(50), default="pending")  # pending, processing, quoted, completed
@@ -24,6 +26,14 @@ class Consultation(Base):
     cats = relationship("Cat", back_populates="consultation")
     quote = relationship("Quote", back_populates="consultation", uselist=False)
 
+    # 관리자 목록 조회용 (필터 + 최신순 keyset 페이지)
+    __table_args__ = (
+        Index("ix_consultations_created_at", "created_at"),
+        Index("ix_consultations_status_created_at", "status", "created_at"),
+        Index("ix_consultations_channel_created_at", "channel", "created_at"),
+        Index("ix_consultations_updated_at", "updated_at"),
+    )
+
 
 class Installation(Base):
     """설치 정보"""
@@ -61,6 +71,11 @@ class Installation(Base):
 
     consultation = relationship("Consultation", back_populates="installation")
 
+    # 상담 → 설치 조인 및 지역 필터 (커버링 인덱스)
+    __table_args__ = (
+        Index("ix_installations_consultation_region", "consultation_id", "region"),
+    )
+
 
 class Cat(Base):
     """고양이 정보"""
@@ -118,7 +133,7 @@ class Product(Base):
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(String(100), unique=True, index=True)
     name = Column(String(200))
-    category = Column(String(100))
+    category = Column(String(100), index=True)
 
     # 사이즈
     width = Column(Float, nullable=True)
@@ -130,11 +145,20 @@ class Product(Base):
     description = Column(Text)
     usage = Column(Text)
 
+    # 소재
+    material = Column(String(100), nullable=True)
+
     # 제품 이미지 경로
     image_path = Column(String(500))
 
+    # 할인가, 옵션가 등 부가 정보
+    attributes = Column(JSON, nullable=True)
+
+    # 카탈로그 표시 순서
+    sort_order = Column(Integer, default=0)
+
     # 활성화 여부
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
 
 
 class ChatHistory(Base):
@@ -150,3 +174,57 @@ class ChatHistory(Base):
     message_metadata = Column(JSON, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # 세션별 대화 시간순 조회
+    __table_args__ = (
+        Index("ix_chat_history_session_created_at", "session_id", "created_at"),
+    )
+
+
+class LeadDailyStat(Base):
+    """일별 상담 집계 (유형/지역/상태/컬러별)"""
+    __tablename__ = "lead_daily_stats"
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, index=True)
+
+    consultation_type = Column(String(50), nullable=True)
+    region = Column(String(200), nullable=True)
+    status = Column(String(50), nullable=True)
+    product_color = Column(String(50), nullable=True)
+
+    consultations = Column(Integer, default=0)
+    quotes = Column(Integer, default=0)
+    quote_total = Column(Float, default=0.0)  # 견적 금액 합계 (평균 = quote_total / quotes)
+
+
+class ChatDailyStat(Base):
+    """일별 대화 집계 (대화 → 상담 전환)"""
+    __tablename__ = "chat_daily_stats"
+
+    day = Column(Date, primary_key=True)
+    messages = Column(Integer, default=0)
+    sessions = Column(Integer, default=0)
+    converted_sessions = Column(Integer, default=0)  # 상담 신청으로 이어진 세션
+
+
+class RollupState(Base):
+    """집계 작업 워터마크"""
+    __tablename__ = "rollup_state"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(String(100))
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class NotificationOutbox(Base):
+    """미전송 관리자 알림 (NOTIFICATION_OUTBOX_ENABLED일 때만 사용)"""
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50))  # consultation, quote_request
+    message = Column(Text)
+    attempts = Column(Integer, default=0)
+    channels = Column(JSON, nullable=True)  # 남은 채널 (None이면 전체, failed_at이 있으면 실패한 채널)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    failed_at = Column(DateTime, nullable=True)  # 재시도 소진 시각 (재적재 대상에서 제외)
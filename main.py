@@ -7,9 +7,12 @@ Playcat Chatbot API - Modular Architecture
 날짜: 2025-01-XX
 """
 import os
+import re
+import uuid
+import asyncio
+from pathlib import Path
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
@@ -18,14 +21,23 @@ import uvicorn
 from config.settings import get_settings
 
 # Utils
-from utils.logger import setup_logger
+from utils.logger import request_id_var, setup_logger, shutdown_logging
 from utils.error_handler import handle_api_error
+from utils.static_assets import CachedStaticFiles, RenderedPage, precompress_static
 
 # Database
 from database.connection import init_db
 
 # Routers
-from routers import chat, consultation, image, products
+from routers import admin, chat, consultation, image, products, quote
+
+# Services
+from services.process_pool import shutdown_pools
+from services.chat_history_writer import get_chat_history_writer
+from services.lead_rollups import get_lead_rollups
+from services.notification_dispatcher import get_notification_dispatcher
+from services.qwen_model_manager import shutdown_qwen_model_manager
+from services.product_catalog import get_product_catalog
 
 # Settings
 settings = get_settings()
@@ -36,6 +48,16 @@ logger = setup_logger("playcat_chatbot")
 
 # ==================== Application Lifecycle ====================
 
+def _sweep_quote_cache():
+    """견적서 PDF 캐시 크기 제한 초과분 정리 (reportlab import 포함)"""
+    from services.quote_generator import quote_generator
+
+    try:
+        quote_generator.quote_cache.sweep()
+    except OSError as e:
+        logger.warning(f"Quote cache sweep skipped: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 이벤트 처리"""
@@ -44,14 +66,50 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENV}")
     logger.info(f"AI Model: {'Gemini' if settings.USE_GEMINI else 'Anthropic'}")
     
-    # Initialize database
-    init_db()
-    logger.info("Database initialized")
+    # Initialize database (스키마 버전이 최신이면 DDL 없이 통과)
+    applied = await init_db()
+    if applied:
+        logger.info(f"Database migrations applied: {applied}")
+    else:
+        logger.info("Database schema up to date")
+    
+    # Product catalog: JSON → products 테이블 import 후 메모리 적재
+    catalog = get_product_catalog()
+    await catalog.sync()
+    catalog_watch_task = asyncio.create_task(catalog.watch())
+    
+    # Chat history write-behind
+    chat_history_writer = get_chat_history_writer()
+    chat_history_writer.start()
+    
+    # Admin notifications (백그라운드 전송 + 재시도)
+    notification_dispatcher = get_notification_dispatcher()
+    await notification_dispatcher.start()
+    
+    # Lead analytics rollups (주기적 delta scan)
+    rollup_task = asyncio.create_task(get_lead_rollups().run())
+    
+    # Precompress static assets (최신이면 건너뜀)
+    try:
+        precompress_static()
+    except OSError as e:
+        logger.warning(f"Static precompression skipped: {e}")
+    
+    # Quote PDF cache: 크기 제한 초과분 정리 (콜드 스타트를 막지 않도록 백그라운드 스레드)
+    quote_cache_sweep = asyncio.create_task(asyncio.to_thread(_sweep_quote_cache))
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    catalog_watch_task.cancel()
+    quote_cache_sweep.cancel()
+    rollup_task.cancel()
+    await chat_history_writer.stop()
+    await notification_dispatcher.stop(settings.NOTIFICATION_SHUTDOWN_TIMEOUT_SECONDS)
+    await shutdown_qwen_model_manager()
+    shutdown_pools()
+    shutdown_logging()
 
 
 # ==================== FastAPI App Creation ====================
@@ -77,6 +135,56 @@ app.add_middleware(
 )
 
 
+# 업로드 크기 사전 검사 (multipart 파싱 전에 Content-Length로 차단)
+UPLOAD_PATHS = {"/api/image/upload"}
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """선언된 본문 크기가 업로드 제한을 넘으면 본문을 읽기 전에 413 응답"""
+    if request.method == "POST" and request.url.path in UPLOAD_PATHS:
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > settings.MAX_UPLOAD_SIZE + MULTIPART_OVERHEAD:
+                return JSONResponse(
+                    status_code=413,
+                    content={
+                        "error": True,
+                        "message": "File too large",
+                        "status_code": 413
+                    }
+                )
+    return await call_next(request)
+
+
+# 요청 ID (마지막에 등록해야 가장 바깥에서 실행되어 413 응답에도 부여됨)
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """
+    요청 ID를 contextvar에 설정 (X-Request-ID가 유효하면 그대로 사용) → 로그/응답 헤더에 기록
+
+    처리되지 않은 예외는 이 미들웨어 바깥(ServerErrorMiddleware)에서 전역 핸들러로 가므로
+    contextvar가 이미 복원된 뒤임 → request.state에도 남겨 handle_api_error가 사용
+    """
+    request_id = request.headers.get("x-request-id", "")
+    if not REQUEST_ID_PATTERN.match(request_id):
+        request_id = uuid.uuid4().hex
+
+    request.state.request_id = request_id
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
 # ==================== Error Handlers ====================
 
 @app.exception_handler(Exception)
@@ -88,7 +196,8 @@ async def global_exception_handler(request: Request, exc: Exception):
 # ==================== Static Files ====================
 
 # Static files (CSS, JS, images)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# content hash URL(?v=)은 immutable 캐시, .br/.gz 사전 압축본 우선 전송
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 
 
 # ==================== Include Routers ====================
@@ -105,13 +214,26 @@ app.include_router(image.router)
 # Product catalog endpoints
 app.include_router(products.router)
 
+# Quote estimate endpoints
+app.include_router(quote.router)
+
+# Admin endpoints (X-Admin-Token)
+app.include_router(admin.router)
+
 
 # ==================== Root Endpoints ====================
 
+# 정적 자산 URL에 content hash를 붙여 한 번만 렌더링한 챗봇 UI
+_index_page = None
+
+
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """루트 페이지 - 챗봇 UI"""
-    return FileResponse("static/index.html")
+    global _index_page
+    if _index_page is None:
+        _index_page = RenderedPage(Path("static/index.html"))
+    return _index_page.response(request.headers)
 
 
 @app.get("/api")
@@ -0,0 +1,400 @@
+"""
+Admin API Router
+상담/대화 기록 관리자 조회 엔드포인트 모듈
+
+- 필터 + 최신순 keyset(cursor) 페이지네이션 (OFFSET 없음)
+- 목록에 필요한 컬럼만 조회 (ORM 객체/관계 적재 없음)
+- 통계는 일별 집계 테이블만 조회 (services.lead_rollups)
+"""
+import base64
+import json
+import secrets
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Integer, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.settings import get_settings
+from database.connection import get_db
+from database.models import ChatDailyStat, ChatHistory, Consultation, Installation, LeadDailyStat, RollupState
+from services.bulk_quotes import reissue_quotes
+from services.lead_rollups import REFRESHED_AT
+from services.qwen_model_manager import get_qwen_model_manager
+
+settings = get_settings()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """X-Admin-Token 검사 (토큰 미설정 시 관리자 API 비활성화)"""
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=503, detail="Admin API is not configured")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+# Router 생성
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+# ==================== 응답 스키마 ====================
+
+class ConsultationListItem(BaseModel):
+    id: int
+    created_at: Optional[datetime] = None
+    status: Optional[str] = None
+    channel: Optional[str] = None
+    consultation_type: Optional[str] = None
+    customer_name: Optional[str] = None
+    contact: Optional[str] = None
+    session_id: Optional[str] = None
+    region: Optional[str] = None
+    product_color: Optional[str] = None
+
+
+class ConsultationPage(BaseModel):
+    items: List[ConsultationListItem]
+    next_cursor: Optional[str] = None
+
+
+class ChatHistoryItem(BaseModel):
+    id: int
+    created_at: Optional[datetime] = None
+    role: Optional[str] = None
+    message: Optional[str] = None
+
+
+class ChatHistoryPage(BaseModel):
+    session_id: str
+    items: List[ChatHistoryItem]
+    next_cursor: Optional[str] = None
+
+
+class LeadStatRow(BaseModel):
+    period: str
+    consultation_type: Optional[str] = None
+    region: Optional[str] = None
+    status: Optional[str] = None
+    product_color: Optional[str] = None
+    consultations: int
+    quotes: int
+    avg_quote_total: Optional[float] = None
+
+
+class ChatStatRow(BaseModel):
+    period: str
+    messages: int
+    sessions: int
+    converted_sessions: int
+    conversion_rate: float
+
+
+class StatsResponse(BaseModel):
+    granularity: str
+    date_from: date
+    date_to: date
+    refreshed_at: Optional[datetime] = None
+    leads: List[LeadStatRow]
+    chat: List[ChatStatRow]
+
+
+# ==================== 커서 ====================
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    """마지막 행의 (created_at, id) → 불투명 커서"""
+    raw = json.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 → (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset_after(created_at_column, id_column, cursor: Tuple[datetime, int], descending: bool):
+    """(created_at, id) row-value 비교 (인덱스 범위 검색으로 실행됨)"""
+    key = tuple_(created_at_column, id_column)
+    value = tuple_(literal(cursor[0], DateTime()), literal(cursor[1], Integer()))
+    return key < value if descending else key > value
+
+
+# ==================== 쿼리 ====================
+
+def consultation_list_query(
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+    channel: Optional[str] = None,
+    consultation_type: Optional[str] = None,
+    region: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> Select:
+    """
+    상담 목록 쿼리 (최신순, limit + 1행 조회로 다음 페이지 여부 판단)
+
+    사용 인덱스: (status, created_at), (channel, created_at), (created_at),
+    installations (consultation_id, region)
+    """
+    query = (
+        select(
+            Consultation.id,
+            Consultation.created_at,
+            Consultation.status,
+            Consultation.channel,
+            Consultation.consultation_type,
+            Consultation.customer_name,
+            Consultation.contact,
+            Consultation.session_id,
+            Installation.region,
+            Installation.product_color
+        )
+        .outerjoin(Installation, Installation.consultation_id == Consultation.id)
+    )
+
+    if status:
+        query = query.where(Consultation.status == status)
+    if channel:
+        query = query.where(Consultation.channel == channel)
+    if consultation_type:
+        query = query.where(Consultation.consultation_type == consultation_type)
+    if region:
+        query = query.where(Installation.region == region)
+    if created_from:
+        query = query.where(Consultation.created_at >= created_from)
+    if created_to:
+        query = query.where(Consultation.created_at < created_to)
+    if cursor:
+        query = query.where(
+            _keyset_after(Consultation.created_at, Consultation.id, cursor, descending=True)
+        )
+
+    return query.order_by(Consultation.created_at.desc(), Consultation.id.desc()).limit(limit + 1)
+
+
+def chat_history_query(
+    session_id: str,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    """세션 대화 기록 쿼리 (시간순, 인덱스: (session_id, created_at))"""
+    query = (
+        select(ChatHistory.id, ChatHistory.created_at, ChatHistory.role, ChatHistory.message)
+        .where(ChatHistory.session_id == session_id)
+    )
+    if cursor:
+        query = query.where(
+            _keyset_after(ChatHistory.created_at, ChatHistory.id, cursor, descending=False)
+        )
+    return query.order_by(ChatHistory.created_at, ChatHistory.id).limit(limit + 1)
+
+
+def _page(rows, limit: int):
+    """limit + 1행 결과 → (항목, 다음 커서)"""
+    items = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return items, next_cursor
+
+
+def _page_size(limit: Optional[int]) -> int:
+    return min(limit or settings.ADMIN_PAGE_SIZE, settings.ADMIN_MAX_PAGE_SIZE)
+
+
+# ==================== 엔드포인트 ====================
+
+@router.get("/consultations", response_model=ConsultationPage)
+async def list_consultations(
+    status: Optional[str] = None,
+    channel: Optional[str] = None,
+    consultation_type: Optional[str] = None,
+    region: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db)
+):
+    """상담 목록 (필터: 상태/채널/유형/지역/기간)"""
+    page_size = _page_size(limit)
+    query = consultation_list_query(
+        page_size,
+        cursor=decode_cursor(cursor) if cursor else None,
+        status=status,
+        channel=channel,
+        consultation_type=consultation_type,
+        region=region,
+        created_from=created_from,
+        created_to=created_to
+    )
+    rows = (await db.execute(query)).all()
+    items, next_cursor = _page(rows, page_size)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/chat-history/{session_id}", response_model=ChatHistoryPage)
+async def list_chat_history(
+    session_id: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db)
+):
+    """세션 대화 기록 (시간순)"""
+    page_size = _page_size(limit)
+    query = chat_history_query(
+        session_id,
+        page_size,
+        cursor=decode_cursor(cursor) if cursor else None
+    )
+    rows = (await db.execute(query)).all()
+    items, next_cursor = _page(rows, page_size)
+    return {"session_id": session_id, "items": items, "next_cursor": next_cursor}
+
+
+# 집계 기간 단위 (Python strftime, 주는 월요일 시작 %W)
+PERIOD_FORMATS = {"day": "%Y-%m-%d", "week": "%Y-W%W", "month": "%Y-%m"}
+LEAD_DIMENSIONS = {
+    "consultation_type": LeadDailyStat.consultation_type,
+    "region": LeadDailyStat.region,
+    "status": LeadDailyStat.status,
+    "product_color": LeadDailyStat.product_color
+}
+
+
+def _by_period(rows, period_format: str, keys: List[str]) -> List[Dict]:
+    """
+    일별 합계 행 → 기간(+ keys)별 합계 (기간, keys 순 정렬, NULL 먼저)
+
+    날짜 포맷 함수는 DB마다 달라서 DB에서는 일별로만 묶고 기간 라벨은 여기서 붙임
+    (집계 테이블 조회라 일별 행 수가 작음)
+    """
+    buckets: Dict[Tuple, Dict] = {}
+    for row in rows:
+        item = dict(row._mapping)
+        period = item.pop("day").strftime(period_format)
+        group = (period, *(item[key] for key in keys))
+        bucket = buckets.get(group)
+        if bucket is None:
+            bucket = buckets[group] = {"period": period, **{key: item[key] for key in keys}}
+        for name, value in item.items():
+            if name not in keys:
+                bucket[name] = bucket.get(name, 0) + (value or 0)
+    return [
+        buckets[group]
+        for group in sorted(buckets, key=lambda group: [(value is not None, value) for value in group])
+    ]
+
+
+@router.get("/stats", response_model=StatsResponse)
+async def get_stats(
+    granularity: Literal["day", "week", "month"] = "week",
+    group_by: List[str] = Query(["consultation_type", "region"]),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    상담/대화 집계 (일별 집계 테이블만 조회)
+
+    - leads: 기간 × group_by 차원별 상담 수, 견적 수, 평균 견적 금액
+    - chat: 기간별 대화 세션 수와 상담 전환율
+    """
+    unknown = [name for name in group_by if name not in LEAD_DIMENSIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown group_by: {', '.join(unknown)}")
+
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=90)
+    period_format = PERIOD_FORMATS[granularity]
+
+    dimensions = [LEAD_DIMENSIONS[name].label(name) for name in group_by]
+    lead_rows = await db.execute(
+        select(
+            LeadDailyStat.day,
+            *dimensions,
+            func.sum(LeadDailyStat.consultations).label("consultations"),
+            func.sum(LeadDailyStat.quotes).label("quotes"),
+            func.sum(LeadDailyStat.quote_total).label("quote_total")
+        )
+        .where(LeadDailyStat.day >= date_from, LeadDailyStat.day <= date_to)
+        .group_by(LeadDailyStat.day, *dimensions)
+    )
+    leads: List[Dict] = []
+    for item in _by_period(lead_rows, period_format, group_by):
+        quote_total = item.pop("quote_total") or 0
+        item["avg_quote_total"] = round(quote_total / item["quotes"]) if item["quotes"] else None
+        leads.append(item)
+
+    chat_rows = await db.execute(
+        select(
+            ChatDailyStat.day,
+            func.sum(ChatDailyStat.messages).label("messages"),
+            func.sum(ChatDailyStat.sessions).label("sessions"),
+            func.sum(ChatDailyStat.converted_sessions).label("converted_sessions")
+        )
+        .where(ChatDailyStat.day >= date_from, ChatDailyStat.day <= date_to)
+        .group_by(ChatDailyStat.day)
+    )
+    chat = []
+    for item in _by_period(chat_rows, period_format, []):
+        item["conversion_rate"] = (
+            round(item["converted_sessions"] / item["sessions"], 4) if item["sessions"] else 0.0
+        )
+        chat.append(item)
+
+    # 갱신은 한 워커만 하므로 마지막 갱신 시각은 DB 기록을 사용
+    refreshed = await db.get(RollupState, REFRESHED_AT)
+
+    return {
+        "granularity": granularity,
+        "date_from": date_from,
+        "date_to": date_to,
+        "refreshed_at": datetime.fromisoformat(refreshed.value) if refreshed else None,
+        "leads": leads,
+        "chat": chat
+    }
+
+
+@router.post("/quotes/reissue")
+async def reissue_open_quotes(
+    status: str = "quoted",
+    render_pdfs: bool = True,
+    limit: Optional[int] = Query(None, ge=1)
+):
+    """
+    열린 견적 일괄 재발행 (가격/컬러 배수 변경 후)
+
+    진행 상황을 NDJSON으로 스트리밍 (loaded → priced → rendering → saving → done)
+    """
+    async def progress():
+        try:
+            async for event in reissue_quotes(status=status, render_pdfs=render_pdfs, limit=limit):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json.dumps({"phase": "error", "detail": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
+@router.get("/models")
+async def get_model_metrics():
+    """
+    AI 모델 상태 (로드 여부, 로드 시간, 모델/프로세스 메모리)
+
+    조회만으로는 모델을 로드하지 않음
+    """
+    return {"qwen": get_qwen_model_manager().metrics()}
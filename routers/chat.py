@@ -10,7 +10,7 @@ import time
 
 from chatbot.conversation_manager import conversation_manager
 from chatbot.content_filter import content_filter
-from services.kakao_notifier import get_kakao_notifier
+from services.notification_dispatcher import get_notification_dispatcher
 
 # Router 생성
 router = APIRouter(prefix="/api/chat", tags=["chat"])
@@ -91,20 +91,18 @@ async def send_message(chat_message: ChatMessage, request: Request):
             selected_option=chat_message.selected_option
         )
 
-        # 카카오톡 알림 전송 (비동기, 실패해도 응답에 영향 없음)
-        try:
-            kakao_notifier = get_kakao_notifier()
-            await kakao_notifier.send_consultation_alert(
-                session_id=session_id,
-                user_message=filtered_message,
-                bot_response=response.get("message", ""),
-                context={
-                    "intent": "chat",
-                    "product_name": "-"
-                }
-            )
-        except Exception as notification_error:
-            print(f"[WARN] 카카오톡 알림 실패: {notification_error}")
+        # 카카오톡 알림 (세션별 요약으로 모아 백그라운드 전송, 실패해도 응답에 영향 없음)
+        form_submitted = response.get("next_action") == "generate_quote"
+        get_notification_dispatcher().notify_consultation(
+            session_id=session_id,
+            user_message=filtered_message,
+            bot_response=response.get("message", ""),
+            context={
+                "intent": "form_submission" if form_submitted else "chat",
+                "product_name": "-"
+            },
+            flush=form_submitted
+        )
 
         return {
             "response": response.get("message"),
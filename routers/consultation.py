@@ -3,18 +3,33 @@ Consultation API Router
 상담 및 견적 관련 엔드포인트 모듈
 """
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Optional
+from datetime import datetime
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from database.connection import get_db
+from database.connection import get_db, write_session
 from database.models import Consultation, Installation, Cat
-from services.kakao_notifier import get_kakao_notifier
-from services.quote_generator import quote_generator
+from services.notification_dispatcher import get_notification_dispatcher
 
 # Router 생성
 router = APIRouter(prefix="/api/consultation", tags=["consultation"])
 
+# 요청의 cats 항목 중 저장할 필드
+CAT_FIELDS = (
+    "name", "age", "weight", "breed", "gender", "personality",
+    "health_issues", "problem_behavior", "incompatible_cats"
+)
+
+# 상담 조회 시 함께 적재할 관계 (지연 로딩 없이 관계당 쿼리 1회)
+CONSULTATION_LOAD_OPTIONS = (
+    selectinload(Consultation.installation),
+    selectinload(Consultation.cats),
+    selectinload(Consultation.quote)
+)
+
 
 class ConsultationData(BaseModel):
     session_id: str
@@ -31,117 +46,202 @@ class ConsultationData(BaseModel):
     contact_email: Optional[str] = None
 
 
-@router.post("/submit")
-async def submit_consultation(
-    consultation_data: ConsultationData,
-    db: AsyncSession = Depends(get_db)
-):
+class InstallationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    region: Optional[str] = None
+    location_type: Optional[str] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    ceiling_height: Optional[float] = None
+    wall_material: Optional[str] = None
+    product_color: Optional[str] = None
+    composite_image_path: Optional[str] = None
+    installation_date: Optional[datetime] = None
+
+
+class CatOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    age: Optional[str] = None
+    weight: Optional[float] = None
+    breed: Optional[str] = None
+    gender: Optional[str] = None
+    personality: Optional[str] = None
+    health_issues: Optional[str] = None
+    problem_behavior: Optional[str] = None
+    incompatible_cats: Optional[str] = None
+
+
+class QuoteOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    products: Optional[List[Dict]] = None
+    product_total: Optional[float] = None
+    installation_fee: Optional[float] = None
+    regional_surcharge: Optional[float] = None
+    color_surcharge: Optional[float] = None
+    discount_amount: Optional[float] = None
+    total_price: Optional[float] = None
+    pdf_path: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class ConsultationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    session_id: Optional[str] = None
+    customer_name: Optional[str] = None
+    contact: Optional[str] = None
+    contact_email: Optional[str] = None
+    channel: Optional[str] = None
+    consultation_type: Optional[str] = None
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    installation: Optional[InstallationOut] = None
+    cats: List[CatOut] = []
+    quote: Optional[QuoteOut] = None
+
+
+class SubmitResponse(BaseModel):
+    success: bool
+    message: str
+    consultation_id: int
+
+
+class ConsultationResponse(BaseModel):
+    consultation: ConsultationOut
+
+
+class ConsultationListResponse(BaseModel):
+    consultations: List[ConsultationOut]
+
+
+def _cat_row(consultation_id: int, cat_data: Dict) -> Dict:
+    """요청의 고양이 항목 → cats 테이블 행"""
+    row = {field: cat_data.get(field) for field in CAT_FIELDS}
+    row["consultation_id"] = consultation_id
+    
+    # weight는 숫자 컬럼 ("4.5kg" 같은 입력은 숫자만 사용)
+    weight = row["weight"]
+    if isinstance(weight, str):
+        try:
+            row["weight"] = float(weight.lower().replace("kg", "").strip())
+        except ValueError:
+            row["weight"] = None
+    if row["age"] is not None:
+        row["age"] = str(row["age"])
+    return row
+
+
+@router.post("/submit", response_model=SubmitResponse)
+async def submit_consultation(consultation_data: ConsultationData):
     """
     상담 정보 제출 및 저장
     
-    - 설치 정보
-    - 고양이 정보
-    - 연락처 정보
-    - 데이터베이스 저장
+    - 상담 / 설치 정보 / 고양이 정보를 단일 트랜잭션으로 저장
+      (상담 INSERT 1회 + 설치 INSERT 1회 + 고양이 일괄 INSERT 1회)
     - 카카오톡 알림 전송
     """
     try:
-        # Installation 레코드 생성
-        installation = Installation(
-            session_id=consultation_data.session_id,
-            installation_region=consultation_data.installation_region,
-            installation_location=consultation_data.installation_location,
-            cat_count=consultation_data.cat_count,
-            width=consultation_data.width,
-            height=consultation_data.height,
-            ceiling_height=consultation_data.ceiling_height,
-            product_color=consultation_data.product_color
-        )
-        db.add(installation)
-        await db.flush()  # ID 생성을 위해 flush
-        
-        # Cat 레코드 생성
-        for cat_data in consultation_data.cats:
-            cat = Cat(
-                installation_id=installation.id,
-                name=cat_data.get("name"),
-                age=cat_data.get("age"),
-                weight=cat_data.get("weight"),
-                personality=cat_data.get("personality"),
-                health_issues=cat_data.get("health_issues")
+        async with write_session() as db:
+            # Consultation 레코드 생성 (ID 확보)
+            consultation = Consultation(
+                session_id=consultation_data.session_id,
+                customer_name=consultation_data.contact_name,
+                contact=consultation_data.contact_phone,
+                contact_email=consultation_data.contact_email,
+                channel="web",
+                status="pending"
             )
-            db.add(cat)
-        
-        # Consultation 레코드 생성
-        consultation = Consultation(
-            session_id=consultation_data.session_id,
-            installation_id=installation.id,
-            contact_name=consultation_data.contact_name,
-            contact_phone=consultation_data.contact_phone,
-            contact_email=consultation_data.contact_email,
-            status="pending"
-        )
-        db.add(consultation)
-        
-        await db.commit()
-        
-        # 카카오톡 견적 요청 알림
-        if consultation_data.contact_name or consultation_data.contact_phone:
-            try:
-                kakao_notifier = get_kakao_notifier()
-                await kakao_notifier.send_quote_request_alert(
-                    user_info={
-                        "name": consultation_data.contact_name,
-                        "phone": consultation_data.contact_phone,
-                        "email": consultation_data.contact_email
-                    },
-                    quote_details={
-                        "product_name": f"캣워커 설치 ({consultation_data.installation_location})",
-                        "quantity": f"{consultation_data.cat_count}마리",
-                        "message": f"공간: {consultation_data.width}x{consultation_data.height}x{consultation_data.ceiling_height}cm"
-                    }
+            db.add(consultation)
+            await db.flush()
+            
+            # Installation 레코드 생성
+            db.add(Installation(
+                consultation_id=consultation.id,
+                region=consultation_data.installation_region,
+                location_type=consultation_data.installation_location,
+                width=consultation_data.width,
+                height=consultation_data.height,
+                ceiling_height=consultation_data.ceiling_height,
+                product_color=consultation_data.product_color
+            ))
+            
+            # Cat 레코드 일괄 생성
+            if consultation_data.cats:
+                await db.execute(
+                    insert(Cat),
+                    [_cat_row(consultation.id, cat_data) for cat_data in consultation_data.cats]
                 )
-            except Exception as notification_error:
-                print(f"[WARN] 카카오톡 알림 실패: {notification_error}")
-        
-        return {
-            "success": True,
-            "message": "상담 신청이 완료되었습니다!",
-            "consultation_id": consultation.id
-        }
-        
+            
+            consultation_id = consultation.id
     except Exception as e:
-        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    
+    # 카카오톡 견적 요청 알림 (해당 세션 대화 요약 포함, 백그라운드 전송)
+    if consultation_data.contact_name or consultation_data.contact_phone:
+        get_notification_dispatcher().notify_quote_request(
+            user_info={
+                "name": consultation_data.contact_name,
+                "phone": consultation_data.contact_phone,
+                "email": consultation_data.contact_email
+            },
+            quote_details={
+                "product_name": f"캣워커 설치 ({consultation_data.installation_location})",
+                "quantity": f"{consultation_data.cat_count}마리",
+                "message": f"공간: {consultation_data.width}x{consultation_data.height}x{consultation_data.ceiling_height}cm"
+            },
+            session_id=consultation_data.session_id
+        )
+    
+    return {
+        "success": True,
+        "message": "상담 신청이 완료되었습니다!",
+        "consultation_id": consultation_id
+    }
 
 
-@router.get("/{consultation_id}")
+@router.get("/{consultation_id}", response_model=ConsultationResponse)
 async def get_consultation(
     consultation_id: int,
     db: AsyncSession = Depends(get_db)
 ):
-    """특정 상담 정보 조회"""
+    """특정 상담 정보 조회 (설치/고양이/견적 포함)"""
     try:
-        consultation = await db.get(Consultation, consultation_id)
-        if not consultation:
-            raise HTTPException(status_code=404, detail="Consultation not found")
-        
-        return {"consultation": consultation}
+        result = await db.execute(
+            select(Consultation)
+            .options(*CONSULTATION_LOAD_OPTIONS)
+            .where(Consultation.id == consultation_id)
+        )
+        consultation = result.scalar_one_or_none()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if not consultation:
+        raise HTTPException(status_code=404, detail="Consultation not found")
+    
+    return {"consultation": consultation}
 
 
-@router.get("/session/{session_id}")
+@router.get("/session/{session_id}", response_model=ConsultationListResponse)
 async def get_consultations_by_session(
     session_id: str,
     db: AsyncSession = Depends(get_db)
 ):
     """세션별 상담 내역 조회"""
     try:
-        from sqlalchemy import select
-        
         result = await db.execute(
-            select(Consultation).where(Consultation.session_id == session_id)
+            select(Consultation)
+            .options(*CONSULTATION_LOAD_OPTIONS)
+            .where(Consultation.session_id == session_id)
+            .order_by(Consultation.created_at.desc(), Consultation.id.desc())
         )
         consultations = result.scalars().all()
         
@@ -6,22 +6,32 @@ from fastapi import APIRouter, UploadFile, File, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 from pathlib import Path
-import uuid
 
+from config.settings import get_settings
 from services.image_composer import image_composer
+from services.process_pool import get_image_pool, PoolBusyError
+from services.upload_store import save_upload, UploadError
+from services.image_normalizer import image_normalizer, normalize_upload
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Settings
+settings = get_settings()
 
 # Router 생성
 router = APIRouter(prefix="/api/image", tags=["image"])
 
 # 업로드 디렉토리
-UPLOAD_DIR = Path("static/uploads")
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
 class ImageCompositeRequest(BaseModel):
     background_url: str
     product_ids: List[str]
-    positions: List[dict]  # [{"x": 100, "y": 200, "scale": 1.0}, ...]
+    positions: List[dict]  # [{"x": 100, "y": 200, "scale": 1.0}, ...] (원본 해상도 기준)
+    preview: bool = False  # True: 축소본 미리보기, False: 최종(원본 해상도) 합성
 
 
 @router.post("/upload")
@@ -30,37 +40,55 @@ async def upload_image(file: UploadFile = File(...)):
     이미지 업로드
     
     - 사용자가 업로드한 공간 사진 저장
-    - UUID 기반 고유 파일명 생성
+    - 청크 단위 스트리밍 저장 (업로드당 메모리 사용량 고정)
+    - MAX_UPLOAD_SIZE 초과 시 즉시 중단 (413)
+    - SHA-256 해시 기반 파일명 (동일 사진 중복 저장 방지)
+    - EXIF 회전 적용 + 작업용/미리보기/썸네일/WebP 파생본 생성 (이미지 처리 풀)
     - 지원 형식: jpg, jpeg, png, webp
     """
     try:
-        # 파일 확장자 검증
-        allowed_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-        file_extension = Path(file.filename).suffix.lower()
-        
-        if file_extension not in allowed_extensions:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type. Allowed: {allowed_extensions}"
-            )
+        stored = await save_upload(
+            file,
+            upload_dir=UPLOAD_DIR,
+            max_size=settings.MAX_UPLOAD_SIZE,
+            allowed_extensions=settings.ALLOWED_UPLOAD_EXTENSIONS,
+            chunk_size=settings.UPLOAD_CHUNK_SIZE
+        )
         
-        # 고유 파일명 생성
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = UPLOAD_DIR / unique_filename
+        # 정규화 (풀이 바쁘면 건너뜀, 하위 서비스는 원본으로 폴백)
+        manifest = image_normalizer.get_manifest(stored["sha256"])
+        if manifest is None:
+            try:
+                manifest = await get_image_pool().run(
+                    normalize_upload, stored["path"], stored["sha256"]
+                )
+            except PoolBusyError:
+                logger.warning(f"Normalization skipped (pool busy): {stored['filename']}")
+            except Exception as e:
+                logger.warning(f"Normalization failed for {stored['filename']}: {e}")
         
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        variants = {}
+        if manifest:
+            variants = {
+                name: variant["url"]
+                for name, variant in manifest["variants"].items()
+            }
         
         return {
             "success": True,
-            "filename": unique_filename,
-            "url": f"/static/uploads/{unique_filename}"
+            "filename": stored["filename"],
+            "url": stored["url"],
+            "size": stored["size"],
+            "sha256": stored["sha256"],
+            "variants": variants
         }
         
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        await file.close()
 
 
 @router.post("/composite")
@@ -71,18 +99,23 @@ async def create_composite_image(request: ImageCompositeRequest):
     - 배경 이미지에 제품 이미지 합성
     - 사용자가 선택한 위치와 스케일로 배치
     - AI 기반 자연스러운 합성
+    - 합성은 이미지 처리 풀에서 실행 (대기열 초과 시 503)
+    - preview=true: 배치 조정 중 축소본으로 빠르게 미리보기
+    - 고객이 확정하면 같은 배치 JSON으로 preview=false 요청 → 원본 해상도 합성
     """
     try:
         result = await image_composer.compose_image(
             background_url=request.background_url,
             product_ids=request.product_ids,
-            positions=request.positions
+            positions=request.positions,
+            preview=request.preview
         )
         
         if result.get("success"):
             return {
                 "success": True,
                 "composite_url": result.get("composite_url"),
+                "preview": result.get("preview", False),
                 "message": "Image composition completed"
             }
         else:
@@ -91,5 +124,13 @@ async def create_composite_image(request: ImageCompositeRequest):
                 detail=result.get("error", "Composition failed")
             )
             
+    except PoolBusyError:
+        raise HTTPException(
+            status_code=503,
+            detail="Image composition is busy. Please retry shortly.",
+            headers={"Retry-After": "2"}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Composition error: {str(e)}")
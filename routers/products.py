@@ -2,86 +2,69 @@
 Products API Router
 제품 정보 관련 엔드포인트 모듈
 """
-from fastapi import APIRouter, HTTPException
-from pathlib import Path
-import json
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from services.product_catalog import get_product_catalog, CatalogSnapshot
 
 # Router 생성
 router = APIRouter(prefix="/api/products", tags=["products"])
 
-# 제품 데이터 경로
-PRODUCTS_FILE = Path("data/products.json")
+
+def _get_snapshot() -> CatalogSnapshot:
+    """현재 카탈로그 스냅샷 (없으면 404)"""
+    snapshot = get_product_catalog().snapshot
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Products data not found")
+    return snapshot
+
+
+def _catalog_response(request: Request, snapshot: CatalogSnapshot, body: bytes) -> Response:
+    """
+    카탈로그 응답 생성
+
+    If-None-Match가 현재 버전 ETag와 같으면 본문 없이 304
+    """
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": "no-cache"
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or snapshot.etag in tags:
+            return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("")
-async def get_products():
+async def get_products(request: Request):
     """
     전체 제품 목록 조회
-    
+
     - 플레이캣 제품 카탈로그 반환
     - 캣타워, 캣워커, 액세서리 등
+    - 메모리 스냅샷의 사전 직렬화된 응답 사용 (ETag / 304 지원)
     """
-    try:
-        if not PRODUCTS_FILE.exists():
-            raise HTTPException(status_code=404, detail="Products data not found")
-        
-        with open(PRODUCTS_FILE, "r", encoding="utf-8") as f:
-            products = json.load(f)
-        
-        return {"products": products}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading products: {str(e)}")
+    snapshot = _get_snapshot()
+    return _catalog_response(request, snapshot, snapshot.list_body)
 
 
 @router.get("/{product_id}")
-async def get_product_by_id(product_id: str):
+async def get_product_by_id(product_id: str, request: Request):
     """특정 제품 정보 조회"""
-    try:
-        if not PRODUCTS_FILE.exists():
-            raise HTTPException(status_code=404, detail="Products data not found")
-        
-        with open(PRODUCTS_FILE, "r", encoding="utf-8") as f:
-            products = json.load(f)
-        
-        # 제품 검색
-        product = next(
-            (p for p in products if p.get("id") == product_id),
-            None
-        )
-        
-        if not product:
-            raise HTTPException(status_code=404, detail="Product not found")
-        
-        return {"product": product}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+    snapshot = _get_snapshot()
+
+    body = snapshot.product_bodies.get(product_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    return _catalog_response(request, snapshot, body)
 
 
 @router.get("/category/{category}")
-async def get_products_by_category(category: str):
+async def get_products_by_category(category: str, request: Request):
     """카테고리별 제품 조회"""
-    try:
-        if not PRODUCTS_FILE.exists():
-            raise HTTPException(status_code=404, detail="Products data not found")
-        
-        with open(PRODUCTS_FILE, "r", encoding="utf-8") as f:
-            products = json.load(f)
-        
-        # 카테고리 필터링
-        filtered_products = [
-            p for p in products
-            if p.get("category", "").lower() == category.lower()
-        ]
-        
-        return {
-            "category": category,
-            "count": len(filtered_products),
-            "products": filtered_products
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+    snapshot = _get_snapshot()
+    return _catalog_response(request, snapshot, snapshot.category_body(category))
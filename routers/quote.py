@@ -0,0 +1,55 @@
+"""
+Quote API Router
+견적 계산 엔드포인트 모듈
+"""
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, Field
+
+from services.product_catalog import get_product_catalog
+from services.pricing_engine import get_pricing_engine
+
+# Router 생성
+router = APIRouter(prefix="/api/quote", tags=["quote"])
+
+
+class QuoteItem(BaseModel):
+    id: str
+    quantity: int = Field(1, ge=1)
+
+
+class QuoteEstimateRequest(BaseModel):
+    products: List[QuoteItem]
+    product_color: str = "wood"
+    installation_region: Optional[str] = None
+
+
+@router.post("/estimate")
+async def estimate_quote(request: QuoteEstimateRequest):
+    """
+    견적 금액 계산 (PDF 없이 JSON)
+
+    - 제품별 단가(컬러 배수 적용) / 금액
+    - 기본 설치비 + 제품별 설치비 + 지역 할증
+    - 사전 계산된 가격표 조회만 하므로 즉시 응답
+    """
+    if get_product_catalog().snapshot is None:
+        raise HTTPException(status_code=503, detail="Product catalog unavailable")
+
+    quote = get_pricing_engine().quote(
+        [item.model_dump() for item in request.products],
+        product_color=request.product_color,
+        installation_region=request.installation_region
+    )
+
+    if not quote["items"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No known products in request: {', '.join(map(str, quote['unknown_items']))}"
+        )
+
+    # 계산 결과는 기본 타입만 포함하므로 바로 직렬화
+    body = json.dumps(quote, ensure_ascii=False, separators=(",", ":"))
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,186 @@
+"""
+관리자 조회 쿼리 벤치마크
+
+합성 데이터(기본 상담 100만 건 + 설치 정보 + 대화 기록 100만 건)를 만든 뒤
+routers.admin의 목록 쿼리를 실제 비동기 엔진으로 실행해 지연 시간을 측정
+
+사용법:
+    python -m scripts.bench_admin_queries --rows 1000000 --budget-ms 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+STATUSES = ["pending", "processing", "quoted", "completed"]
+CHANNELS = ["web", "kakao", "instagram"]
+TYPES = ["detailed_quote", "rough_quote", "other_inquiry"]
+REGIONS = [
+    "서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종",
+    "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"
+]
+COLORS = ["wood", "wood_transparent", "white", "white_transparent"]
+CHUNK = 50000
+
+
+def _timestamp(value: datetime) -> str:
+    """SQLAlchemy SQLite DateTime 저장 형식과 동일하게"""
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def populate(db_path: str, rows: int, chat_rows: int, sessions: int):
+    """스키마 생성 후 sqlite3로 합성 데이터 대량 삽입"""
+    from database.connection import async_engine, init_db
+
+    async def create_schema():
+        await init_db()
+        await async_engine.dispose()
+
+    asyncio.run(create_schema())
+
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    span = 2 * 365 * 24 * 3600
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    def consultation_rows(offset, count):
+        for i in range(offset, offset + count):
+            created = _timestamp(start + timedelta(seconds=i * span // rows))
+            yield (
+                i + 1, f"session-{rng.randrange(sessions)}", f"고객{i}", "010-0000-0000",
+                rng.choice(CHANNELS), rng.choice(TYPES), rng.choice(STATUSES),
+                created, created
+            )
+
+    for offset in range(0, rows, CHUNK):
+        count = min(CHUNK, rows - offset)
+        conn.executemany(
+            "INSERT INTO consultations (id, session_id, customer_name, contact, channel, "
+            "consultation_type, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            consultation_rows(offset, count)
+        )
+        conn.executemany(
+            "INSERT INTO installations (consultation_id, region, location_type, product_color) "
+            "VALUES (?, ?, ?, ?)",
+            ((i + 1, rng.choice(REGIONS), "가정집", rng.choice(COLORS))
+             for i in range(offset, offset + count))
+        )
+        conn.commit()
+
+    for offset in range(0, chat_rows, CHUNK):
+        count = min(CHUNK, chat_rows - offset)
+        conn.executemany(
+            "INSERT INTO chat_history (session_id, role, message, created_at) VALUES (?, ?, ?, ?)",
+            ((f"session-{rng.randrange(sessions)}", rng.choice(["user", "assistant"]), "메시지",
+              _timestamp(start + timedelta(seconds=i * span // chat_rows)))
+             for i in range(offset, offset + count))
+        )
+        conn.commit()
+
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def run_queries(iterations: int, page_size: int):
+    """시나리오별 (p50, p95, max) 밀리초"""
+    from database.connection import AsyncSessionLocal, async_engine
+    from routers.admin import chat_history_query, consultation_list_query, decode_cursor, _page
+
+    async def deep_cursor(session, **filters):
+        # 중간 지점 커서 (깊은 페이지도 OFFSET 없이 같은 비용인지 확인)
+        cursor = None
+        for _ in range(20):
+            rows = (await session.execute(consultation_list_query(page_size, cursor, **filters))).all()
+            _, next_cursor = _page(rows, page_size)
+            cursor = decode_cursor(next_cursor)
+        return cursor
+
+    results = {}
+    async with AsyncSessionLocal() as session:
+        scenarios = {
+            "latest": lambda: consultation_list_query(page_size),
+            "status": lambda: consultation_list_query(page_size, status="pending"),
+            "channel": lambda: consultation_list_query(page_size, channel="kakao"),
+            "status+type": lambda: consultation_list_query(
+                page_size, status="quoted", consultation_type="detailed_quote"
+            ),
+            "region": lambda: consultation_list_query(page_size, region="제주"),
+            "period": lambda: consultation_list_query(
+                page_size, created_from=datetime(2025, 3, 1), created_to=datetime(2025, 4, 1)
+            ),
+            "chat session": lambda: chat_history_query(
+                f"session-{random.randrange(1000)}", page_size
+            ),
+        }
+
+        status_cursor = await deep_cursor(session, status="pending")
+        scenarios["status page 21"] = lambda: consultation_list_query(
+            page_size, status_cursor, status="pending"
+        )
+
+        for name, build in scenarios.items():
+            await session.execute(build())  # 워밍업
+            latencies = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                (await session.execute(build())).all()
+                latencies.append((time.perf_counter() - started) * 1000)
+            latencies.sort()
+            results[name] = (
+                latencies[len(latencies) // 2],
+                latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                latencies[-1]
+            )
+
+    await async_engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Admin query benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="상담 건수")
+    parser.add_argument("--chat-rows", type=int, default=1_000_000, help="대화 기록 건수")
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="p95 허용 지연")
+    parser.add_argument("--database", default=None, help="기존 벤치 DB 재사용 (없으면 생성)")
+    args = parser.parse_args()
+
+    db_path = args.database or os.path.join(tempfile.mkdtemp(), "bench_admin.db")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        started = time.perf_counter()
+        populate(db_path, args.rows, args.chat_rows, args.sessions)
+        print(f"populated {args.rows} consultations / {args.chat_rows} chat rows "
+              f"in {time.perf_counter() - started:.1f}s")
+
+    results = asyncio.run(run_queries(args.iterations, args.page_size))
+
+    print(f"database: {db_path}")
+    print(f"{'scenario':<16}{'p50':>10}{'p95':>10}{'max':>10}")
+    failed = []
+    for name, (p50, p95, worst) in results.items():
+        print(f"{name:<16}{p50:>9.2f}ms{p95:>9.2f}ms{worst:>9.2f}ms")
+        if p95 > args.budget_ms:
+            failed.append(name)
+
+    if failed:
+        print(f"over budget ({args.budget_ms}ms): {', '.join(failed)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
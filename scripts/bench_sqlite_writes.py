@@ -0,0 +1,109 @@
+"""
+SQLite 동시 쓰기 벤치마크
+
+여러 프로세스(= uvicorn 워커)가 같은 DB에 동시에 쓰는 상황을 재현해
+처리량과 'database is locked' 오류 수를 측정
+
+사용법:
+    python -m scripts.bench_sqlite_writes --workers 4 --transactions 500 --rows 5
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _worker(database_url: str, worker_id: int, transactions: int, rows: int, results):
+    """워커 프로세스: 트랜잭션마다 chat_history에 rows개 삽입"""
+    os.environ["DATABASE_URL"] = database_url
+
+    from sqlalchemy import insert
+    from database.connection import write_session, async_engine
+    from database.models import ChatHistory
+
+    async def run():
+        errors = 0
+        latencies = []
+        for i in range(transactions):
+            started = time.perf_counter()
+            try:
+                async with write_session() as session:
+                    await session.execute(
+                        insert(ChatHistory).values([
+                            {
+                                "session_id": f"bench-{worker_id}-{i}",
+                                "role": "user",
+                                "message": f"message {j}"
+                            }
+                            for j in range(rows)
+                        ])
+                    )
+            except Exception as e:
+                errors += 1
+                if errors <= 3:
+                    print(f"[worker {worker_id}] {type(e).__name__}: {e}")
+            latencies.append(time.perf_counter() - started)
+        await async_engine.dispose()
+        return errors, latencies
+
+    errors, latencies = asyncio.run(run())
+    results.put((worker_id, errors, latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite concurrent write benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--transactions", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--database", default=None, help="DB 파일 경로 (기본: 임시 파일)")
+    args = parser.parse_args()
+
+    db_path = args.database or os.path.join(tempfile.mkdtemp(), "bench.db")
+    database_url = f"sqlite+aiosqlite:///{db_path}"
+
+    os.environ["DATABASE_URL"] = database_url
+    from database.connection import init_db
+    asyncio.run(init_db())
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_worker, args=(database_url, w, args.transactions, args.rows, results))
+        for w in range(args.workers)
+    ]
+
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    total_errors = sum(errors for _, errors, _ in collected)
+    latencies = sorted(l for _, _, worker_latencies in collected for l in worker_latencies)
+    total_tx = len(latencies)
+
+    def percentile(p):
+        return latencies[min(total_tx - 1, int(total_tx * p))] * 1000
+
+    print(f"database:      {db_path}")
+    print(f"workers:       {args.workers}")
+    print(f"transactions:  {total_tx} ({args.rows} rows each)")
+    print(f"elapsed:       {elapsed:.2f}s")
+    print(f"throughput:    {total_tx / elapsed:.0f} tx/s, {total_tx * args.rows / elapsed:.0f} rows/s")
+    print(f"latency p50:   {percentile(0.50):.2f}ms")
+    print(f"latency p99:   {percentile(0.99):.2f}ms")
+    print(f"errors:        {total_errors}")
+
+    sys.exit(1 if total_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
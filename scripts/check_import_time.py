@@ -0,0 +1,119 @@
+"""
+콜드 스타트 import 시간 점검
+
+`python -X importtime -c "import main"`을 여러 번 실행해
+- main import 누적 시간(가장 빠른 실행 기준)이 예산 안인지
+- 첫 사용 시 로드해야 하는 무거운 모듈(AI SDK, OpenCV, reportlab 등)이 import되지 않는지
+확인하고, 가장 오래 걸린 모듈을 출력
+
+지연 로드 모듈이 import되면 항상 실패 (주 점검 항목)
+측정 잡음은 시간을 늘리기만 하므로 여러 번 실행해 가장 빠른 값을 비교
+(같은 환경에서 20회씩 번갈아 측정: 지연 로드 적용 전 최솟값 1.19~1.29초,
+ 적용 후 0.86~0.93초 → 기본 예산 1.1초, 지연 로드를 되돌리면 실패)
+잡음이 큰 환경에서는 예산 대신 --runs를 늘림
+
+사용법:
+    python -m scripts.check_import_time
+    python -m scripts.check_import_time --runs 15
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 시작 시 import되면 안 되는 모듈 (첫 사용 시 지연 로드)
+LAZY_MODULES = [
+    "torch",
+    "transformers",
+    "cv2",
+    "reportlab",
+    "google.generativeai",
+    "ollama",
+    "websocket",
+    "chatbot.ollama_client",
+    "chatbot.gemini_client",
+    "services.comfyui_client",
+    "services.qwen_image_edit",
+    "services.ai_generation_service",
+    "services.quote_generator",
+]
+
+# 기본 시간 예산 (지연 로드 적용 전/후 최솟값 사이)
+DEFAULT_BUDGET_MS = 1100
+
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def profile(module: str) -> list:
+    """
+    importtime 한 번 실행
+
+    Returns:
+        [(모듈명, self_us, cumulative_us, 깊이), ...]
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise SystemExit(f"import {module} failed:\n{tail}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start import time check")
+    parser.add_argument("--module", default="main", help="import할 모듈")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="누적 import 시간 예산 (가장 빠른 실행 기준)")
+    parser.add_argument("--runs", type=int, default=9, help="실행 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 느린 모듈 수")
+    args = parser.parse_args()
+
+    runs = [profile(args.module) for _ in range(max(1, args.runs))]
+    totals = [
+        next(cumulative for name, _, cumulative, depth in rows if name == args.module and depth == 0)
+        for rows in runs
+    ]
+    total_ms = min(totals) / 1000
+    median_ms = statistics.median(totals) / 1000
+
+    # 가장 빠른 실행 기준으로 상세 출력
+    rows = runs[totals.index(min(totals))]
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {'  ' * depth}{name}")
+
+    failures = []
+    imported = {name for run in runs for name, *_ in run}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    if eager:
+        failures.append(f"lazy modules imported at startup: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"import {args.module} took {total_ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+
+    print(
+        f"\nimport {args.module}: fastest {total_ms:.0f}ms, median {median_ms:.0f}ms "
+        f"over {len(runs)} runs (budget {args.budget_ms:.0f}ms)"
+    )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
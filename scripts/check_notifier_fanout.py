@@ -0,0 +1,256 @@
+"""
+알림 채널 fan-out 점검
+
+로컬 가짜 webhook 서버(정상 Kakao API / 응답 없는 webhook / 정상 Discord)를 띄우고
+KakaoNotifier와 NotificationDispatcher가
+- 응답 없는 채널을 채널 timeout에서 끊는지
+- 그동안 다른 채널 전송은 바로 끝나는지
+- 연속 실패한 채널은 회로 차단기로 호출 없이 건너뛰는지
+- 디스패처 기본 동시 전송 한도에서 속도 제한에 걸린 채널이 다른 채널 전송을 늦추지 않는지
+- 차단기 때문에 건너뛴 채널은 시도 횟수를 쓰지 않고 half-open 시점에 재전송되는지
+확인
+
+사용법:
+    python -m scripts.check_notifier_fanout --timeout 1.0 --budget-ms 300
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BREAKER_FAILURES = 2
+
+
+class FakeServer:
+    """채널별 수신 시각을 기록하는 가짜 알림 서버"""
+
+    def __init__(self):
+        self.received = defaultdict(list)
+        self.runner = None
+        self.base_url = None
+        self.released = asyncio.Event()
+
+    async def _ok(self, request: web.Request) -> web.Response:
+        self.received[request.path].append(time.perf_counter())
+        return web.Response(status=200 if request.path == "/kakao" else 204)
+
+    async def _hung(self, request: web.Request) -> web.Response:
+        self.received[request.path].append(time.perf_counter())
+        await self.released.wait()
+        return web.Response(status=204)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/kakao", self._ok)
+        app.router.add_post("/discord", self._ok)
+        app.router.add_post("/hung", self._hung)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self.runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+    async def stop(self):
+        # 응답 없는 핸들러를 풀어 줘야 종료 대기 없이 정리됨
+        self.released.set()
+        await self.runner.cleanup()
+
+
+def configure(base_url: str, timeout: float):
+    """설정은 환경 변수로 읽으므로 서비스 import 전에 지정"""
+    os.environ.update({
+        "KAKAO_API_KEY": "test",
+        "KAKAO_ADMIN_PHONE": "01000000000",
+        "KAKAO_WEBHOOK_URL": f"{base_url}/hung",
+        "DISCORD_WEBHOOK_URL": f"{base_url}/discord",
+        "NOTIFICATION_TIMEOUT_KAKAO_SECONDS": str(timeout),
+        "NOTIFICATION_TIMEOUT_WEBHOOK_SECONDS": str(timeout),
+        "NOTIFICATION_TIMEOUT_DISCORD_SECONDS": str(timeout),
+        "NOTIFICATION_BREAKER_FAILURES": str(BREAKER_FAILURES),
+        "NOTIFICATION_BREAKER_COOLDOWN_SECONDS": "600",
+        "NOTIFICATION_RATE_KAKAO_PER_MINUTE": "0",
+        "NOTIFICATION_RATE_WEBHOOK_PER_MINUTE": "0",
+        "NOTIFICATION_RATE_DISCORD_PER_MINUTE": "0",
+    })
+
+
+def new_notifier(base_url: str):
+    from services.kakao_notifier import KakaoNotifier
+
+    notifier = KakaoNotifier()
+    notifier.kakao_api_url = f"{base_url}/kakao"
+    return notifier
+
+
+async def check_fanout(server: FakeServer, timeout: float, budget: float) -> list:
+    """응답 없는 채널이 있어도 나머지 채널은 즉시 수신, 전체는 timeout에서 종료"""
+    notifier = new_notifier(server.base_url)
+    failures = []
+    try:
+        started = time.perf_counter()
+        results = await notifier.deliver("fan-out check")
+        elapsed = time.perf_counter() - started
+
+        expected = {"kakao": True, "webhook": False, "discord": True}
+        if results != expected:
+            failures.append(f"results {results} != {expected}")
+        for path in ("/kakao", "/discord"):
+            arrivals = server.received[path]
+            if not arrivals or arrivals[-1] - started > budget:
+                failures.append(f"{path} not received within {budget * 1000:.0f}ms")
+        if not timeout * 0.9 <= elapsed <= timeout + 1.0:
+            failures.append(f"deliver took {elapsed:.2f}s, expected about {timeout}s")
+        print(f"fan-out: {results} in {elapsed:.2f}s")
+
+        # 연속 실패로 차단된 채널은 호출 없이 바로 실패
+        for _ in range(BREAKER_FAILURES - 1):
+            await notifier.deliver("breaker check")
+        hung_calls = len(server.received["/hung"])
+        started = time.perf_counter()
+        results = await notifier.deliver("breaker open")
+        elapsed = time.perf_counter() - started
+
+        if results.get("webhook") is not None or len(server.received["/hung"]) != hung_calls:
+            failures.append("open circuit still called the hung channel")
+        if elapsed > budget:
+            failures.append(f"deliver with open circuit took {elapsed * 1000:.0f}ms")
+        print(f"breaker: webhook {notifier.channels['webhook']['breaker'].state}, deliver {elapsed * 1000:.0f}ms")
+    finally:
+        await notifier.close()
+    return failures
+
+
+async def check_dispatcher(server: FakeServer, timeout: float, budget: float, count: int) -> list:
+    """
+    디스패처 기본 동시 전송 한도에서 한도보다 많은 알림을 넣어도
+    정상 채널(Discord)은 응답 없는 채널(webhook)의 timeout이나
+    속도 제한에 걸린 채널(Kakao, 분당 1건)의 토큰을 기다리지 않음
+    """
+    from config.settings import get_settings
+    from services.kakao_notifier import RateLimiter
+    from services.notification_dispatcher import NotificationDispatcher
+
+    max_inflight = get_settings().NOTIFICATION_MAX_INFLIGHT
+    count = max(count, max_inflight * 2)
+
+    notifier = new_notifier(server.base_url)
+    notifier.channels["kakao"]["limiter"] = RateLimiter(1)
+    dispatcher = NotificationDispatcher(
+        notifier,
+        max_queue=100,
+        max_attempts=1,
+        retry_base=timeout,
+        retry_max=timeout,
+        use_outbox=False,
+        digest=False,
+        dedup_window=0,
+        max_inflight=max_inflight
+    )
+    failures = []
+    before = len(server.received["/discord"])
+    await dispatcher.start()
+    try:
+        started = time.perf_counter()
+        for i in range(count):
+            dispatcher.enqueue("check", f"dispatcher check {i}")
+
+        deadline = started + timeout
+        while len(server.received["/discord"]) - before < count and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        received = server.received["/discord"][before:]
+        elapsed = (received[-1] - started) if received else float("inf")
+
+        if len(received) < count:
+            failures.append(f"discord received {len(received)}/{count} before webhook timeout")
+        elif elapsed > budget:
+            failures.append(f"discord received {count} alerts in {elapsed * 1000:.0f}ms")
+        print(
+            f"dispatcher (max_inflight={max_inflight}, kakao 1/min): "
+            f"discord received {len(received)}/{count} in {elapsed * 1000:.0f}ms"
+        )
+    finally:
+        await dispatcher.stop(timeout=0.1)
+    return failures
+
+
+async def check_breaker_retry(server: FakeServer, cooldown: float) -> list:
+    """차단기가 열린 채널은 시도 횟수(1회)를 쓰지 않고 half-open 이후 전송됨"""
+    from services.notification_dispatcher import NotificationDispatcher
+
+    notifier = new_notifier(server.base_url)
+    # webhook을 정상 응답 경로로 바꾸고 차단기를 연 상태로 시작
+    notifier.webhook_url = f"{server.base_url}/discord"
+    breaker = notifier.channels["webhook"]["breaker"]
+    breaker.cooldown = cooldown
+    breaker.opened_at = time.monotonic()
+
+    dispatcher = NotificationDispatcher(
+        notifier,
+        max_queue=100,
+        max_attempts=1,
+        retry_base=0.05,
+        retry_max=0.05,
+        use_outbox=False,
+        digest=False,
+        dedup_window=0
+    )
+    failures = []
+    before = len(server.received["/discord"])
+    await dispatcher.start()
+    try:
+        started = time.perf_counter()
+        dispatcher.enqueue("check", "breaker retry check")
+        deadline = started + cooldown + 2.0
+        while (dispatcher.sent + dispatcher.failed) == 0 and time.perf_counter() < deadline:
+            await asyncio.sleep(0.02)
+        elapsed = time.perf_counter() - started
+
+        # discord 1건 + half-open 이후 webhook 1건
+        received = len(server.received["/discord"]) - before
+        if dispatcher.sent != 1 or dispatcher.failed:
+            failures.append(f"breaker retry: sent={dispatcher.sent} failed={dispatcher.failed}")
+        elif received != 2 or elapsed < cooldown * 0.9:
+            failures.append(f"breaker retry: {received} deliveries in {elapsed:.2f}s")
+        print(f"breaker retry: sent after {elapsed:.2f}s (cooldown {cooldown}s), webhook {breaker.state}")
+    finally:
+        await dispatcher.stop(timeout=0.1)
+    return failures
+
+
+async def run(timeout: float, budget: float, count: int) -> list:
+    server = FakeServer()
+    await server.start()
+    try:
+        configure(server.base_url, timeout)
+        failures = await check_fanout(server, timeout, budget)
+        failures += await check_dispatcher(server, timeout, budget, count)
+        failures += await check_breaker_retry(server, cooldown=timeout)
+    finally:
+        await server.stop()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notification fan-out check")
+    parser.add_argument("--timeout", type=float, default=1.0, help="채널 timeout (초)")
+    parser.add_argument("--budget-ms", type=float, default=300, help="정상 채널 수신 허용 지연")
+    parser.add_argument("--count", type=int, default=5, help="디스패처 점검 알림 수")
+    args = parser.parse_args()
+
+    failures = asyncio.run(run(args.timeout, args.budget_ms / 1000, args.count))
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("OK" if not failures else f"{len(failures)} check(s) failed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,14 @@ Phase 2: AI 이미지/영상 생성 통합 서비스
 """
 
 import asyncio
+import importlib.util
 import logging
 from typing import Dict, List, Optional
 from pathlib import Path
 
-from services.comfyui_client import comfyui_client
-try:
-    from services.qwen_image_edit import QwenImageEditor
-    QWEN_AVAILABLE = True
-except Exception as e:
-    logging.warning(f"Qwen2-VL not available: {e}")
-    QWEN_AVAILABLE = False
-
+from services.comfyui_client import get_comfyui_client
 from services.image_composer import image_composer
-from chatbot.ollama_client import ollama_client
+from chatbot.ollama_client import get_ollama_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +25,26 @@ class AIGenerationService:
     """AI 이미지/영상 생성 통합 서비스"""
 
     def __init__(self):
-        self.qwen_editor = QwenImageEditor() if QWEN_AVAILABLE else None
+        self._qwen_editor = None
+        self._qwen_checked = False
         self.use_advanced_pipeline = False  # ComfyUI 사용 여부
 
+    @property
+    def qwen_editor(self):
+        """
+        Qwen2-VL 편집기 (torch/transformers가 설치돼 있지 않으면 None)
+
+        모델은 공유 QwenModelManager가 첫 분석 시 로드
+        """
+        if not self._qwen_checked:
+            self._qwen_checked = True
+            if all(importlib.util.find_spec(name) for name in ("torch", "transformers")):
+                from services.qwen_image_edit import QwenImageEditor
+                self._qwen_editor = QwenImageEditor()
+            else:
+                logger.warning("Qwen2-VL not available: torch/transformers not installed")
+        return self._qwen_editor
+
     async def process_consultation_images(
         self,
         consultation_data: Dict
@@ -186,7 +197,7 @@ class AIGenerationService:
         """AI를 사용한 최적 제품 배치 계산"""
 
         # Ollama를 통해 제품 구성 추천
-        analysis = await ollama_client.analyze_consultation_data(
+        analysis = await get_ollama_client().analyze_consultation_data(
             consultation_data
         )
 
@@ -250,7 +261,7 @@ class AIGenerationService:
                     "🎨 AI 고급 합성 시작 (2-5분 소요)..."
                 )
 
-                composition = await comfyui_client.product_composition(
+                composition = await get_comfyui_client().product_composition(
                     room_image_path=room_image,
                     products=products
                 )
@@ -341,7 +352,7 @@ class AIGenerationService:
                 "🎬 동영상 생성 중 (3-10분 소요)..."
             )
 
-            animation = await comfyui_client.cat_animation(
+            animation = await get_comfyui_client().cat_animation(
                 base_image_path=base_image,
                 cat_image_path=cat_photo,
                 activity_prompt=activity_prompt
@@ -373,5 +384,20 @@ class AIGenerationService:
         )
 
 
-# 전역 인스턴스
-ai_generation_service = AIGenerationService()
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+_ai_generation_service: Optional[AIGenerationService] = None
+
+
+def get_ai_generation_service() -> AIGenerationService:
+    """AIGenerationService 싱글톤 인스턴스 반환"""
+    global _ai_generation_service
+    if _ai_generation_service is None:
+        _ai_generation_service = AIGenerationService()
+    return _ai_generation_service
+
+
+def __getattr__(name: str):
+    # 기존 `from services.ai_generation_service import ai_generation_service` 호환 (PEP 562)
+    if name == "ai_generation_service":
+        return get_ai_generation_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,268 @@
+"""
+견적 일괄 재발행 서비스
+가격/컬러 배수 변경 시 열린 견적(상담 상태 기준)을 한 번에 재계산 + PDF 재생성 + 저장
+
+1. 대상 견적을 한 번의 조인 쿼리로 적재 (필요한 컬럼만)
+2. PricingEngine.quote_many()로 벡터 재계산
+   (카탈로그에 없거나 비활성화된 제품이 있는 견적은 건너뛰고 "skipped"로 보고)
+3. 일괄 PDF 풀에서 청크 단위 병렬 렌더링
+   (Quote.pdf_path는 LRU 캐시가 아닌 issued_dir의 고정 사본을 가리킴)
+4. Quote 행을 배치 UPDATE (트랜잭션당 BULK_QUOTE_WRITE_BATCH행)
+   합계가 바뀐 견적은 같은 트랜잭션에서 상담 updated_at도 갱신 (일별 집계 delta 반영용)
+
+진행 상황은 비동기 제너레이터로 단계별 딕셔너리를 내보냄 (NDJSON 스트리밍용)
+"""
+import asyncio
+import logging
+import time
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import func, select, update
+
+from config.settings import get_settings
+from database.models import Cat, Consultation, Installation, Quote
+from services.pricing_engine import get_pricing_engine
+
+logger = logging.getLogger(__name__)
+
+async def load_quotes(session, status: str, limit: Optional[int] = None) -> List[Dict]:
+    """재발행 대상 견적 + PDF에 필요한 상담/설치 정보"""
+    cat_count = (
+        select(func.count(Cat.id))
+        .where(Cat.consultation_id == Consultation.id)
+        .scalar_subquery()
+    )
+    query = (
+        select(
+            Quote.id,
+            Quote.consultation_id,
+            Quote.products,
+            Quote.discount_amount,
+            Quote.total_price,
+            Installation.region,
+            Installation.location_type,
+            Installation.width,
+            Installation.height,
+            Installation.ceiling_height,
+            Installation.product_color,
+            cat_count.label("cat_count")
+        )
+        .join(Consultation, Consultation.id == Quote.consultation_id)
+        .outerjoin(Installation, Installation.consultation_id == Consultation.id)
+        .where(Consultation.status == status)
+        .order_by(Quote.id)
+    )
+    if limit:
+        query = query.limit(limit)
+
+    rows = (await session.execute(query)).all()
+    return [dict(row._mapping) for row in rows]
+
+
+def _consultation_data(row: Dict) -> Dict:
+    """PDF 고객 정보 섹션용 상담 데이터"""
+    return {
+        "installation_region": row["region"] or "-",
+        "installation_location": row["location_type"] or "-",
+        "cat_count": row["cat_count"] or 0,
+        "width": row["width"] or 0,
+        "height": row["height"] or 0,
+        "ceiling_height": row["ceiling_height"] or 0,
+        "product_color": row["product_color"] or "wood"
+    }
+
+
+def _repriced_products(row: Dict, quote: Dict) -> List[Dict]:
+    """
+    기존 products 목록에 재계산 가격 반영
+
+    "price"는 기존 행과 같은 라인 합계(단가 x 수량), 그 외 키와 수량 0 라인은 그대로 유지
+    quote_many()는 가격을 매긴 라인을 입력 순서대로 돌려주므로 순서대로 대응
+    """
+    items = iter(quote["items"])
+    products = []
+    for product in row["products"] or []:
+        if int(product.get("quantity", 1) or 0) <= 0:
+            products.append(product)
+            continue
+        item = next(items)
+        products.append({**product, "price": item["line_total"]})
+    return products
+
+
+def _quote_values(row: Dict, quote: Dict, base_prices: Dict[str, int], pdf_path: Optional[str]) -> Dict:
+    """재계산 결과 → quotes 테이블 UPDATE 값"""
+    base_total = sum(base_prices[item["id"]] * item["quantity"] for item in quote["items"])
+    installation = quote["installation"]
+    discount = row["discount_amount"] or 0.0
+
+    values = {
+        "id": row["id"],
+        "products": _repriced_products(row, quote),
+        "product_total": quote["product_total"],
+        "installation_fee": installation["base"] + installation["per_product_total"],
+        "regional_surcharge": installation["regional_surcharge"],
+        "color_surcharge": quote["product_total"] - base_total,
+        "total_price": quote["total"] - discount
+    }
+    if pdf_path:
+        values["pdf_path"] = pdf_path
+    return values
+
+
+async def reissue_quotes(
+    status: str = "quoted",
+    render_pdfs: bool = True,
+    limit: Optional[int] = None
+) -> AsyncIterator[Dict]:
+    """
+    열린 견적 일괄 재발행
+
+    Args:
+        status: 대상 상담 상태
+        render_pdfs: PDF 재생성 여부 (False면 가격만 갱신)
+        limit: 최대 처리 건수
+
+    Yields:
+        진행 상황 {"phase": ..., "done": n, "total": n, ...}
+    """
+    from database.connection import AsyncSessionLocal, write_session
+    from services.process_pool import get_bulk_pdf_pool
+    from services.quote_generator import quote_generator, render_quote_batch
+
+    settings = get_settings()
+    started = time.perf_counter()
+
+    # 1. 적재
+    async with AsyncSessionLocal() as session:
+        rows = await load_quotes(session, status, limit)
+    total = len(rows)
+    yield {"phase": "loaded", "done": total, "total": total}
+    if not total:
+        yield {"phase": "done", "total": 0, "changed": 0, "elapsed": 0.0}
+        return
+
+    # 2. 벡터 재계산
+    engine = get_pricing_engine()
+    quotes = engine.quote_many([
+        {
+            "products": row["products"] or [],
+            "product_color": row["product_color"],
+            "installation_region": row["region"]
+        }
+        for row in rows
+    ])
+    base_prices = {product_id: info["base_price"] for product_id, info in engine.table.products.items()}
+
+    # 가격을 매길 수 없는 라인이 있는 견적은 저장된 내용을 그대로 둠
+    skipped = [
+        {
+            "quote_id": row["id"],
+            "consultation_id": row["consultation_id"],
+            "unknown_items": quote["unknown_items"]
+        }
+        for row, quote in zip(rows, quotes)
+        if quote["unknown_items"]
+    ]
+    if skipped:
+        kept = [i for i, quote in enumerate(quotes) if not quote["unknown_items"]]
+        rows = [rows[i] for i in kept]
+        quotes = [quotes[i] for i in kept]
+        logger.warning(f"Bulk reissue skipped {len(skipped)} quotes with unpriceable products")
+        yield {"phase": "skipped", "count": len(skipped), "quotes": skipped}
+    total = len(rows)
+    yield {
+        "phase": "priced",
+        "done": total,
+        "total": total,
+        "skipped": len(skipped),
+        "price_version": engine.table.version
+    }
+
+    # 3. PDF 병렬 렌더링 (청크 단위, 풀 대기열 한도만큼만 동시 제출)
+    #    견적서 캐시에 같은 내용이 있으면 렌더링 생략
+    #    Quote 행에는 캐시 파일 대신 quote_generator.issue()로 고정한 경로를 저장
+    #    (캐시 파일은 LRU 정리로 지워질 수 있음)
+    pdf_paths: List[Optional[str]] = [None] * total
+    if render_pdfs:
+        pool = get_bulk_pdf_pool()
+        cache = quote_generator.quote_cache
+        issued_on = date.today()
+        chunk_size = max(1, settings.BULK_QUOTE_RENDER_CHUNK)
+        slots = asyncio.Semaphore(pool.max_pending)
+
+        async def render_chunk(start: int):
+            misses = []
+            for i in range(start, min(start + chunk_size, total)):
+                data = _consultation_data(rows[i])
+                key = quote_generator.cache_key(data, quotes[i], issued_on)
+                cached = cache.get(key)
+                if cached:
+                    pdf_paths[i] = str(await asyncio.to_thread(quote_generator.issue, key, cached))
+                else:
+                    misses.append((i, key, quote_generator.new_tmp_path(), data))
+
+            if misses:
+                jobs = [
+                    (data, quotes[i], str(tmp_path), issued_on.isoformat())
+                    for i, _, tmp_path, data in misses
+                ]
+                try:
+                    async with slots:
+                        await pool.run(render_quote_batch, jobs)
+                    for i, key, tmp_path, _ in misses:
+                        cached = await asyncio.to_thread(cache.put, key, tmp_path)
+                        pdf_paths[i] = str(await asyncio.to_thread(quote_generator.issue, key, cached))
+                finally:
+                    for _, _, tmp_path, _ in misses:
+                        if tmp_path.exists():
+                            tmp_path.unlink()
+            return min(chunk_size, total - start)
+
+        tasks = [asyncio.create_task(render_chunk(start)) for start in range(0, total, chunk_size)]
+        rendered = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                rendered += await finished
+                yield {"phase": "rendering", "done": rendered, "total": total}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # 4. 배치 저장
+    changed = sum(1 for row, quote in zip(rows, quotes) if _prices_changed(row, quote))
+    batch_size = max(1, settings.BULK_QUOTE_WRITE_BATCH)
+    saved = 0
+    for start in range(0, total, batch_size):
+        values = [
+            _quote_values(rows[i], quotes[i], base_prices, pdf_paths[i])
+            for i in range(start, min(start + batch_size, total))
+        ]
+        # 합계가 바뀐 견적의 상담만 (lead_rollups는 consultations.updated_at 워터마크로 변경 날짜를 찾음)
+        repriced = [
+            rows[start + offset]["consultation_id"]
+            for offset, value in enumerate(values)
+            if value["total_price"] != rows[start + offset]["total_price"]
+        ]
+        async with write_session() as session:
+            await session.execute(update(Quote), values)
+            if repriced:
+                await session.execute(
+                    update(Consultation)
+                    .where(Consultation.id.in_(repriced))
+                    .values(updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+        saved += len(values)
+        yield {"phase": "saving", "done": saved, "total": total}
+
+    elapsed = round(time.perf_counter() - started, 2)
+    logger.info(f"Reissued {total} quotes ({changed} price changes, {len(skipped)} skipped) in {elapsed}s")
+    yield {"phase": "done", "total": total, "changed": changed, "skipped": len(skipped), "elapsed": elapsed}
+
+
+def _prices_changed(row: Dict, quote: Dict) -> bool:
+    """기존 견적과 라인 합계가 달라졌는지 (저장 형식과 같은 기준으로 비교)"""
+    previous = row["products"] or []
+    return [p.get("price") for p in previous] != [p.get("price") for p in _repriced_products(row, quote)]
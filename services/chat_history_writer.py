@@ -0,0 +1,155 @@
+"""
+대화 기록 저장 서비스
+채팅 턴을 메모리 큐에 넣고 백그라운드에서 chat_history 테이블에 배치 삽입
+
+응답 경로에서는 큐에 넣기만 하므로 DB 지연이 채팅 응답에 더해지지 않음
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+
+from config.settings import get_settings
+from database.models import ChatHistory
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 실패 시 재시도 (잠금 경합 등 일시적 오류)
+WRITE_RETRIES = 3
+RETRY_DELAY = 0.5
+
+
+class ChatHistoryWriter:
+    """
+    write-behind 대화 기록기
+
+    - record(): 큐에 넣고 즉시 반환 (큐가 가득 차면 경고 후 누락)
+    - flush_interval_ms 또는 batch_size 중 먼저 도달한 시점에 한 번의 multi-row INSERT
+    - stop(): 남은 기록을 모두 저장한 뒤 종료 (lifespan 종료 시)
+    """
+
+    def __init__(self, flush_interval_ms: int, batch_size: int, max_queue: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = max(1, batch_size)
+        self.max_queue = max_queue
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Dict] = []
+        self._inflight: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """큐 지연 생성 (이벤트 루프 안에서)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        return self._queue
+
+    def record(
+        self,
+        session_id: str,
+        role: str,
+        message: str,
+        metadata: Optional[Dict] = None
+    ):
+        """대화 턴 기록 예약 (대기 없음)"""
+        row = {
+            "session_id": session_id,
+            "role": role,
+            "message": message,
+            "message_metadata": metadata,
+            "created_at": datetime.utcnow()
+        }
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Chat history queue full, {self.dropped} turns dropped")
+
+    def start(self):
+        """백그라운드 저장 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """저장 태스크 종료 후 남은 기록 모두 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+
+        remaining, self._batch = self._batch, []
+        while not self.queue.empty():
+            remaining.append(self.queue.get_nowait())
+
+        for start in range(0, len(remaining), self.batch_size):
+            await self._write(remaining[start:start + self.batch_size])
+
+    async def _run(self):
+        """큐에서 배치를 모아 저장하는 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch.append(await self.queue.get())
+            deadline = loop.time() + self.flush_interval
+
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch, self._batch = self._batch, []
+            # 종료 중 취소돼도 진행 중인 배치는 끝까지 저장
+            self._inflight = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._inflight)
+            self._inflight = None
+
+    async def _write(self, rows: List[Dict]):
+        """배치 한 번을 단일 트랜잭션으로 삽입"""
+        from database.connection import write_session
+
+        if not rows:
+            return
+
+        for attempt in range(1, WRITE_RETRIES + 1):
+            try:
+                async with write_session() as session:
+                    await session.execute(insert(ChatHistory).values(rows))
+                return
+            except Exception as e:
+                if attempt == WRITE_RETRIES:
+                    logger.error(f"Chat history write failed, {len(rows)} turns lost: {e}")
+                    return
+                logger.warning(f"Chat history write failed (attempt {attempt}): {e}")
+                await asyncio.sleep(RETRY_DELAY * attempt)
+
+
+# 싱글톤 인스턴스
+_chat_history_writer: Optional[ChatHistoryWriter] = None
+
+
+def get_chat_history_writer() -> ChatHistoryWriter:
+    """ChatHistoryWriter 싱글톤 인스턴스 반환"""
+    global _chat_history_writer
+    if _chat_history_writer is None:
+        settings = get_settings()
+        _chat_history_writer = ChatHistoryWriter(
+            flush_interval_ms=settings.CHAT_HISTORY_FLUSH_INTERVAL_MS,
+            batch_size=settings.CHAT_HISTORY_BATCH_SIZE,
+            max_queue=settings.CHAT_HISTORY_QUEUE_SIZE
+        )
+    return _chat_history_writer
@@ -1,18 +1,25 @@
 import aiohttp
 import asyncio
 import json
+import logging
 import uuid
 import os
 from typing import Dict, List, Optional
 from pathlib import Path
-import websocket
 import urllib.request
 import urllib.parse
 
+from services.image_normalizer import image_normalizer
+
+logger = logging.getLogger(__name__)
+
 
 class ComfyUIClient:
     """ComfyUI API 클라이언트 - Playcat 챗봇용"""
 
+    # 워크플로우 입력 이미지 긴 변 (SD 계열 1024px 기준)
+    UPLOAD_INPUT_EDGE = 1024
+
     def __init__(
         self,
         server_address: str = "127.0.0.1:8188",
@@ -41,6 +48,9 @@ class ComfyUIClient:
         """
         url = self._get_url("upload/image")
 
+        # 정규화된 업로드면 원본 대신 필요한 해상도의 파생본 전송
+        image_path = image_normalizer.pick_variant_path(image_path, self.UPLOAD_INPUT_EDGE)
+
         with open(image_path, "rb") as f:
             files = {"image": f}
             data = {"overwrite": "true"}
@@ -408,13 +418,14 @@ class ComfyUIClient:
 
         # 실행
         prompt_id = await self.queue_prompt(workflow)
-        print(f"🎬 비디오 생성 시작: {prompt_id}")
-        print(f"  📝 프롬프트: {text_prompt[:50]}...")
-        print(f"  ⏱️  비디오 길이: {video_duration}초 ({video_frames}프레임)")
+        logger.info(
+            f"비디오 생성 시작: {prompt_id} ({video_duration}초, {video_frames}프레임)",
+            extra={"prompt_id": prompt_id, "text_prompt": text_prompt[:50]}
+        )
 
         # 완료 대기 (비디오+오디오 생성은 시간이 오래 걸림)
         result = await self.wait_for_completion(prompt_id, timeout=1200)
-        print(f"✅ 비디오 생성 완료: {prompt_id}")
+        logger.info(f"비디오 생성 완료: {prompt_id}", extra={"prompt_id": prompt_id})
 
         # 결과 수집
         outputs = result.get("outputs", {})
@@ -442,7 +453,7 @@ class ComfyUIClient:
                 f.write(image_data)
 
             result_paths["image"] = str(image_path)
-            print(f"  🖼️  이미지: {image_path}")
+            logger.debug(f"비디오 생성 이미지: {image_path}")
 
         # 비디오 찾기 (node 3015 - VHS_VideoCombine)
         if "3015" in outputs:
@@ -473,7 +484,7 @@ class ComfyUIClient:
                     f.write(video_data)
 
                 result_paths["video"] = str(video_path)
-                print(f"  🎥 비디오: {video_path}")
+                logger.debug(f"비디오 생성 결과: {video_path}")
 
         return result_paths
 
@@ -518,5 +529,20 @@ class ComfyUIClient:
         }
 
 
-# 전역 인스턴스
-comfyui_client = ComfyUIClient()
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+_comfyui_client: Optional[ComfyUIClient] = None
+
+
+def get_comfyui_client() -> ComfyUIClient:
+    """ComfyUIClient 싱글톤 인스턴스 반환"""
+    global _comfyui_client
+    if _comfyui_client is None:
+        _comfyui_client = ComfyUIClient()
+    return _comfyui_client
+
+
+def __getattr__(name: str):
+    # 기존 `from services.comfyui_client import comfyui_client` 호환 (PEP 562)
+    if name == "comfyui_client":
+        return get_comfyui_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
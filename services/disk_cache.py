@@ -0,0 +1,189 @@
+"""
+디스크 캐시 서비스
+content hash 키 기반 파일 캐시 + 크기 기준 LRU 정리
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_hash(data: Any) -> str:
+    """JSON 정규화(키 정렬, 공백 제거) 후 SHA-256"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# (경로, 크기, mtime) → SHA-256
+_file_hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_sha256(path: str) -> str:
+    """
+    파일 content hash
+
+    업로드 파일은 파일명이 이미 SHA-256이므로 그대로 사용하고,
+    그 외 파일은 (크기, mtime) 기준으로 메모이즈
+    """
+    stem = Path(path).stem
+    if len(stem) == 64 and all(c in "0123456789abcdef" for c in stem):
+        return stem
+
+    stat = os.stat(path)
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    cached = _file_hash_memo.get(memo_key)
+    if cached:
+        return cached
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+
+    digest = hasher.hexdigest()
+    _file_hash_memo[memo_key] = digest
+    return digest
+
+
+class DiskLRUCache:
+    """
+    디렉토리 단위 파일 캐시
+
+    - 캐시 적중 시 mtime을 갱신해 최근 사용 순서를 파일시스템에 기록
+      (여러 프로세스가 같은 디렉토리를 공유해도 순서가 유지됨)
+    - 전체 크기가 max_bytes를 넘으면 오래된 파일부터 low_watermark까지 삭제
+    - "."으로 시작하는 하위 디렉토리(.tmp 등 작성 중인 임시 파일)는 크기 집계/정리에서 제외
+
+    put()/sweep()은 디렉토리 전체를 훑을 수 있으므로 비동기 코드에서는 asyncio.to_thread로 호출
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        suffix: str = "",
+        low_watermark: float = 0.9
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.low_watermark = low_watermark
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        """키에 해당하는 캐시 파일 경로"""
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        캐시 조회
+
+        Returns:
+            캐시 파일 경로 (없으면 None)
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, source: Path) -> Path:
+        """
+        생성된 파일을 캐시에 등록 (원자적 이동)
+
+        Args:
+            key: 캐시 키
+            source: 같은 파일시스템에 쓰인 임시 파일
+
+        Returns:
+            캐시 파일 경로
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            # 같은 키를 덮어쓰면 이전 파일 크기만큼 빼야 집계가 어긋나지 않음
+            try:
+                previous_size = path.stat().st_size
+            except FileNotFoundError:
+                previous_size = 0
+            os.replace(source, path)
+
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += path.stat().st_size - previous_size
+
+            if self._total_bytes > self.max_bytes:
+                self._sweep()
+
+        return path
+
+    def sweep(self) -> int:
+        """
+        크기 제한 초과분 정리 (오래 사용되지 않은 파일부터)
+
+        Returns:
+            삭제한 파일 수
+        """
+        with self._lock:
+            return self._sweep()
+
+    def _sweep(self) -> int:
+        entries = []
+        for path in self._cache_files():
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * self.low_watermark)
+        removed = 0
+
+        if total > self.max_bytes:
+            entries.sort(key=lambda e: e[0])
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+
+        self._total_bytes = total
+        if removed:
+            logger.info(f"Disk cache {self.directory}: evicted {removed} files")
+        return removed
+
+    def _cache_files(self):
+        """캐시 파일 목록 (임시 디렉토리 제외)"""
+        for path in self.directory.rglob("*"):
+            parents = path.relative_to(self.directory).parts[:-1]
+            if any(part.startswith(".") for part in parents):
+                continue
+            try:
+                if path.is_file():
+                    yield path
+            except OSError:
+                continue
+
+    def _scan_total(self) -> int:
+        """캐시 파일 전체 크기"""
+        total = 0
+        for path in self._cache_files():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
@@ -1,17 +1,116 @@
 from PIL import Image, ImageDraw, ImageFont
-import cv2
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 from pathlib import Path
+from collections import OrderedDict
+import asyncio
 import json
+import uuid
+
+from config.settings import get_settings
+from services.process_pool import get_image_pool
+from services.image_normalizer import image_normalizer
+from services.disk_cache import DiskLRUCache, canonical_hash, file_sha256
 
 
 class ImageComposer:
     """이미지 합성 서비스"""
 
-    def __init__(self, product_images_dir: str = "static/images/products"):
+    # 크기/회전이 적용된 스프라이트 캐시 최대 개수
+    SCALED_CACHE_SIZE = 128
+
+    def __init__(
+        self,
+        product_images_dir: str = "static/images/products",
+        composites_dir: str = "static/composites",
+        proxies_dir: str = "static/uploads/proxies"
+    ):
         self.product_images_dir = Path(product_images_dir)
+        self.composites_dir = Path(composites_dir)
+        self.proxies_dir = Path(proxies_dir)
         self.product_cache: Dict[str, Image.Image] = {}
+        self.scaled_cache: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+        self._result_cache: Optional[DiskLRUCache] = None
+
+    @property
+    def result_cache(self) -> DiskLRUCache:
+        """합성 결과 캐시 (static/composites, 크기 기준 LRU)"""
+        if self._result_cache is None:
+            self._result_cache = DiskLRUCache(
+                str(self.composites_dir),
+                max_bytes=get_settings().COMPOSITE_CACHE_MAX_BYTES,
+                suffix=".jpg"
+            )
+        return self._result_cache
+
+    async def compose_image(
+        self,
+        background_url: str,
+        product_ids: List[str],
+        positions: List[Dict],
+        preview: bool = False
+    ) -> Dict:
+        """
+        배경 이미지에 제품 합성 (이미지 처리 풀에서 실행)
+
+        배치 좌표는 항상 원본 해상도 기준이며, 미리보기도 같은 배치 JSON을
+        그대로 받아 축소본 비율에 맞춰 변환함
+
+        Args:
+            background_url: 업로드된 배경 이미지 URL (/static/uploads/...)
+            product_ids: 배치할 제품 ID 리스트
+            positions: 제품별 위치 [{"x": 100, "y": 200, "scale": 1.0}, ...]
+            preview: True면 축소본 배경으로 빠르게 미리보기 합성
+
+        Returns:
+            {"success": bool, "composite_url": str} 또는 {"success": False, "error": str}
+
+        Raises:
+            PoolBusyError: 이미지 처리 풀 대기열이 가득 찬 경우
+        """
+        background_path = resolve_static_path(background_url)
+        if background_path is None or not background_path.exists():
+            return {"success": False, "error": "Background image not found"}
+
+        products = build_placements(product_ids, positions)
+
+        settings = get_settings()
+        if preview:
+            render_fn = render_preview
+            render_args = (settings.PREVIEW_MAX_EDGE, settings.PREVIEW_JPEG_QUALITY)
+        else:
+            render_fn = render_composite
+            render_args = ()
+
+        # 캐시 키: 배경 content hash + 정규화된 배치 + 렌더 옵션
+        background_hash = await asyncio.to_thread(file_sha256, str(background_path))
+        cache_key = canonical_hash({
+            "background": background_hash,
+            "placements": products,
+            "preview": preview,
+            "render": list(render_args)
+        })
+
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            tmp_path = self.composites_dir / ".tmp" / f"{uuid.uuid4().hex}.jpg"
+            try:
+                await get_image_pool().run(
+                    render_fn,
+                    str(background_path),
+                    products,
+                    str(tmp_path),
+                    *render_args
+                )
+                cached = await asyncio.to_thread(self.result_cache.put, cache_key, tmp_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+        return {
+            "success": True,
+            "composite_url": "/" + cached.as_posix(),
+            "preview": preview
+        }
 
     def load_product_image(self, product_id: str) -> Optional[Image.Image]:
         """
@@ -34,11 +133,179 @@ class ImageComposer:
         self.product_cache[product_id] = img
         return img
 
-    def composite_simple(
+    def load_scaled_product_image(
+        self,
+        product_id: str,
+        scale: float = 1.0,
+        rotation: float = 0
+    ) -> Optional[Image.Image]:
+        """
+        크기/회전이 적용된 제품 이미지 로드 (LRU 캐시)
+
+        같은 배치를 반복 합성할 때 LANCZOS 리사이즈를 다시 하지 않도록
+        워커 프로세스 안에서 결과를 재사용
+
+        Args:
+            product_id: 제품 ID
+            scale: 배율
+            rotation: 회전 각도
+
+        Returns:
+            PIL Image 객체
+        """
+        key = (product_id, round(scale, 4), rotation)
+        cached = self.scaled_cache.get(key)
+        if cached is not None:
+            self.scaled_cache.move_to_end(key)
+            return cached
+
+        product_img = self.load_product_image(product_id)
+        if not product_img:
+            return None
+
+        new_size = (
+            max(1, int(product_img.width * scale)),
+            max(1, int(product_img.height * scale))
+        )
+        if new_size != product_img.size:
+            product_img = product_img.resize(new_size, Image.Resampling.LANCZOS)
+
+        if rotation != 0:
+            product_img = product_img.rotate(rotation, expand=True)
+
+        self.scaled_cache[key] = product_img
+        if len(self.scaled_cache) > self.SCALED_CACHE_SIZE:
+            self.scaled_cache.popitem(last=False)
+
+        return product_img
+
+    def get_background_proxy(self, background_path: str, max_edge: int) -> Path:
+        """
+        배경 이미지 축소본(프록시) 반환, 없으면 생성
+
+        JPEG은 draft 모드로 DCT 단계에서 축소 디코딩하므로
+        12MP 원본도 전체 해상도로 풀지 않음
+
+        Args:
+            background_path: 원본 배경 이미지
+            max_edge: 긴 변 최대 픽셀
+
+        Returns:
+            프록시 이미지 경로
+        """
+        source = Path(background_path)
+        proxy_path = self.proxies_dir / f"{source.stem}_{max_edge}.jpg"
+
+        if proxy_path.exists() and proxy_path.stat().st_mtime >= source.stat().st_mtime:
+            return proxy_path
+
+        img = Image.open(source)
+        img.draft("RGB", (max_edge, max_edge))
+        img = img.convert("RGB")
+        img.thumbnail((max_edge, max_edge), Image.Resampling.BILINEAR)
+
+        # 원자적 교체 (동시 요청이 반쯤 쓰인 파일을 읽지 않도록)
+        proxy_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = proxy_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        img.save(tmp_path, "JPEG", quality=90)
+        tmp_path.replace(proxy_path)
+
+        return proxy_path
+
+    def resolve_background(
+        self,
+        background_path: str,
+        max_edge: Optional[int] = None
+    ) -> Tuple[str, float]:
+        """
+        합성에 사용할 배경 파일과 좌표 변환 비율 결정
+
+        정규화된 업로드면 EXIF 회전이 적용된 파생본 중 max_edge를 만족하는
+        가장 작은 것을 사용 (None이면 작업용 사본), 아니면 원본 또는 축소 프록시
+
+        Args:
+            background_path: 업로드 원본 경로
+            max_edge: 필요한 긴 변 픽셀 (None이면 최대 해상도)
+
+        Returns:
+            (배경 경로, 원본 좌표 → 배경 좌표 비율)
+        """
+        variant = image_normalizer.pick_variant(background_path, max_edge)
+        if variant is not None:
+            return variant["path"], variant["width"] / variant["reference_width"]
+
+        if max_edge is None:
+            return background_path, 1.0
+
+        # 원본 크기는 헤더만 읽어서 확인
+        with Image.open(background_path) as original:
+            original_width = original.width
+
+        proxy_path = self.get_background_proxy(background_path, max_edge)
+        with Image.open(proxy_path) as proxy:
+            factor = proxy.width / original_width
+
+        return str(proxy_path), factor
+
+    def composite_full(
         self,
         background_path: str,
         products: List[Dict],
         output_path: str
+    ) -> str:
+        """
+        최종 합성 (작업용 해상도)
+
+        Args:
+            background_path: 업로드 원본 경로
+            products: 원본 해상도 기준 배치 정보
+            output_path: 출력 경로
+
+        Returns:
+            합성된 이미지 경로
+        """
+        background, factor = self.resolve_background(background_path)
+        return self.composite_simple(
+            background,
+            scale_placements(products, factor),
+            output_path
+        )
+
+    def composite_preview(
+        self,
+        background_path: str,
+        products: List[Dict],
+        output_path: str,
+        max_edge: int = 1280,
+        quality: int = 80
+    ) -> str:
+        """
+        축소본 배경으로 미리보기 합성
+
+        Args:
+            background_path: 원본 배경 이미지
+            products: 원본 해상도 기준 배치 정보
+            output_path: 출력 경로
+            max_edge: 프록시 긴 변 최대 픽셀
+            quality: JPEG 품질
+
+        Returns:
+            미리보기 이미지 경로
+        """
+        background, factor = self.resolve_background(background_path, max_edge)
+        return self.composite_simple(
+            background,
+            scale_placements(products, factor),
+            output_path,
+            quality=quality
+        )
+
+    def composite_simple(
+        self,
+        background_path: str,
+        products: List[Dict],
+        output_path: str,
+        quality: int = 95
     ) -> str:
         """
         간단한 2D 이미지 합성 (PIL 사용)
@@ -56,6 +323,7 @@ class ImageComposer:
                     ...
                 ]
             output_path: 출력 파일 경로
+            quality: JPEG 품질
 
         Returns:
             합성된 이미지 경로
@@ -65,25 +333,17 @@ class ImageComposer:
         composite = background.copy()
 
         for product in products:
-            product_img = self.load_product_image(product["id"])
+            # 크기 조정 + 회전 (캐시 사용)
+            product_img = self.load_scaled_product_image(
+                product["id"],
+                product.get("scale", 1.0),
+                product.get("rotation", 0)
+            )
             if not product_img:
                 continue
 
-            # 크기 조정
-            scale = product.get("scale", 1.0)
-            new_size = (
-                int(product_img.width * scale),
-                int(product_img.height * scale)
-            )
-            product_img = product_img.resize(new_size, Image.Resampling.LANCZOS)
-
-            # 회전
-            rotation = product.get("rotation", 0)
-            if rotation != 0:
-                product_img = product_img.rotate(rotation, expand=True)
-
             # 위치
-            position = product.get("position", (0, 0))
+            position = tuple(product.get("position", (0, 0)))
 
             # 합성 (알파 채널 고려)
             composite.paste(product_img, position, product_img)
@@ -91,7 +351,7 @@ class ImageComposer:
         # 저장
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
-        composite.convert("RGB").save(output, "JPEG", quality=95)
+        composite.convert("RGB").save(output, "JPEG", quality=quality)
 
         return str(output)
 
@@ -112,6 +372,9 @@ class ImageComposer:
         Returns:
             합성된 이미지 경로
         """
+        # OpenCV는 이 경로에서만 쓰므로 첫 호출 시 import (콜드 스타트 단축)
+        import cv2
+
         # 배경 이미지 로드
         background = cv2.imread(background_path)
         if background is None:
@@ -320,5 +583,97 @@ class ImageComposer:
         return str(output)
 
 
+def resolve_static_path(url: str) -> Optional[Path]:
+    """
+    /static/... URL을 로컬 파일 경로로 변환
+
+    static 디렉토리 밖을 가리키는 경로는 None 반환
+    """
+    if not url:
+        return None
+
+    relative = url.split("?", 1)[0].lstrip("/")
+    if not relative.startswith("static/"):
+        return None
+
+    static_root = Path("static").resolve()
+    path = Path(relative).resolve()
+    if static_root not in path.parents:
+        return None
+
+    return Path(relative)
+
+
+def build_placements(product_ids: List[str], positions: List[Dict]) -> List[Dict]:
+    """
+    API 요청(product_ids + positions)을 합성용 배치 정보로 변환
+
+    Returns:
+        [{"id": ..., "position": (x, y), "scale": 1.0, "rotation": 0}, ...]
+    """
+    placements = []
+    for i, product_id in enumerate(product_ids):
+        position = positions[i] if i < len(positions) else {}
+        placements.append({
+            "id": product_id,
+            "position": (int(position.get("x", 0)), int(position.get("y", 0))),
+            "scale": float(position.get("scale", 1.0)),
+            "rotation": float(position.get("rotation", 0))
+        })
+    return placements
+
+
+def scale_placements(products: List[Dict], factor: float) -> List[Dict]:
+    """배치 정보의 위치/배율을 축소 비율에 맞춰 변환"""
+    if factor == 1.0:
+        return products
+
+    scaled = []
+    for product in products:
+        x, y = product.get("position", (0, 0))
+        scaled.append({
+            **product,
+            "position": (int(round(x * factor)), int(round(y * factor))),
+            "scale": product.get("scale", 1.0) * factor
+        })
+    return scaled
+
+
+# ==================== 워커 프로세스 ====================
+
+# 워커별 합성기 (스프라이트 캐시가 작업 간 유지됨)
+_worker_composer: Optional[ImageComposer] = None
+
+
+def init_worker():
+    """이미지 처리 풀 워커 초기화"""
+    global _worker_composer
+    _worker_composer = ImageComposer()
+
+
+def render_composite(
+    background_path: str,
+    products: List[Dict],
+    output_path: str
+) -> str:
+    """워커 프로세스에서 합성 실행 (경로만 주고받음)"""
+    composer = _worker_composer or ImageComposer()
+    return composer.composite_full(background_path, products, output_path)
+
+
+def render_preview(
+    background_path: str,
+    products: List[Dict],
+    output_path: str,
+    max_edge: int,
+    quality: int
+) -> str:
+    """워커 프로세스에서 미리보기 합성 실행"""
+    composer = _worker_composer or ImageComposer()
+    return composer.composite_preview(
+        background_path, products, output_path, max_edge, quality
+    )
+
+
 # 전역 인스턴스
 image_composer = ImageComposer()
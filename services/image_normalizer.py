@@ -0,0 +1,228 @@
+"""
+업로드 이미지 정규화 서비스
+EXIF 회전 적용 + 작업용 축소본/미리보기/썸네일/최신 포맷 파생본 생성
+"""
+import json
+import logging
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps, features
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# EXIF Orientation 태그
+EXIF_ORIENTATION = 0x0112
+
+
+class ImageNormalizer:
+    """
+    업로드 사진 정규화
+
+    원본은 그대로 두고 content hash별 디렉토리에 파생본과 manifest.json을 기록
+    (static/uploads/variants/<sha256>/manifest.json)
+
+    모든 파생본은 EXIF 회전이 적용된 상태이며, manifest의 original 크기는
+    회전 적용 후 원본 크기 (배치 좌표의 기준 좌표계)
+    """
+
+    def __init__(
+        self,
+        variants_dir: str = "static/uploads/variants",
+        working_max_edge: int = 2560,
+        preview_max_edge: int = 1280,
+        thumbnail_edge: int = 320,
+        modern_format: str = "webp"
+    ):
+        self.variants_dir = Path(variants_dir)
+        self.working_max_edge = working_max_edge
+        self.preview_max_edge = preview_max_edge
+        self.thumbnail_edge = thumbnail_edge
+        self.modern_format = modern_format.lower()
+        self._manifests: Dict[str, Dict] = {}
+
+    def manifest_path(self, content_hash: str) -> Path:
+        """content hash별 manifest 경로"""
+        return self.variants_dir / content_hash / "manifest.json"
+
+    def get_manifest(self, content_hash: str) -> Optional[Dict]:
+        """manifest 조회 (프로세스 내 캐시)"""
+        manifest = self._manifests.get(content_hash)
+        if manifest is not None:
+            return manifest
+
+        path = self.manifest_path(content_hash)
+        if not path.exists():
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self._manifests[content_hash] = manifest
+        return manifest
+
+    def normalize(self, source_path: str, content_hash: str) -> Dict:
+        """
+        업로드 사진 정규화 (이미지 처리 풀 워커에서 실행)
+
+        Args:
+            source_path: 업로드 원본 경로
+            content_hash: 원본 SHA-256
+
+        Returns:
+            manifest 딕셔너리
+        """
+        existing = self.get_manifest(content_hash)
+        if existing is not None:
+            return existing
+
+        out_dir = self.variants_dir / content_hash
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        with Image.open(source_path) as img:
+            source_format = img.format
+            width, height = img.size
+            if img.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+                width, height = height, width
+
+            # JPEG은 DCT 단계에서 축소 디코딩
+            img.draft("RGB", (self.working_max_edge, self.working_max_edge))
+            working = ImageOps.exif_transpose(img).convert("RGB")
+
+        working.thumbnail(
+            (self.working_max_edge, self.working_max_edge),
+            Image.Resampling.LANCZOS
+        )
+
+        preview = working.copy()
+        preview.thumbnail(
+            (self.preview_max_edge, self.preview_max_edge),
+            Image.Resampling.LANCZOS
+        )
+
+        thumbnail = preview.copy()
+        thumbnail.thumbnail(
+            (self.thumbnail_edge, self.thumbnail_edge),
+            Image.Resampling.LANCZOS
+        )
+
+        modern_format = self.modern_format
+        if modern_format == "avif" and not features.check("avif"):
+            modern_format = "webp"
+
+        variants = {
+            "working": self._save(working, out_dir / "working.jpg", "JPEG", quality=90),
+            "preview": self._save(preview, out_dir / "preview.jpg", "JPEG", quality=85),
+            "thumbnail": self._save(thumbnail, out_dir / "thumbnail.jpg", "JPEG", quality=80),
+            "modern": self._save(
+                working,
+                out_dir / f"working.{modern_format}",
+                modern_format.upper(),
+                quality=80
+            )
+        }
+
+        manifest = {
+            "sha256": content_hash,
+            "source": str(source_path),
+            "source_format": source_format,
+            "original": {"width": width, "height": height},
+            "variants": variants
+        }
+
+        self._write_json(self.manifest_path(content_hash), manifest)
+        self._manifests[content_hash] = manifest
+
+        return manifest
+
+    def pick_variant(
+        self,
+        source_path: str,
+        min_edge: Optional[int] = None,
+        formats: tuple = ("JPEG",)
+    ) -> Optional[Dict]:
+        """
+        용도에 맞는 가장 작은 파생본 선택
+
+        Args:
+            source_path: 업로드 원본 경로 (파일명이 content hash)
+            min_edge: 필요한 긴 변 최소 픽셀 (None이면 가장 큰 작업용 사본)
+            formats: 허용 포맷
+
+        Returns:
+            {"name", "path", "width", "height", "reference_width", "reference_height"}
+            정규화되지 않은 파일이면 None
+        """
+        manifest = self.get_manifest(Path(source_path).stem)
+        if manifest is None:
+            return None
+
+        candidates = sorted(
+            (
+                dict(variant, name=name)
+                for name, variant in manifest["variants"].items()
+                if variant["format"] in formats
+            ),
+            key=lambda v: max(v["width"], v["height"])
+        )
+        if not candidates:
+            return None
+
+        selected = candidates[-1]
+        if min_edge is not None:
+            for candidate in candidates:
+                if max(candidate["width"], candidate["height"]) >= min_edge:
+                    selected = candidate
+                    break
+
+        return {
+            **selected,
+            "reference_width": manifest["original"]["width"],
+            "reference_height": manifest["original"]["height"]
+        }
+
+    def pick_variant_path(self, source_path: str, min_edge: Optional[int] = None) -> str:
+        """pick_variant의 경로만 반환 (정규화 전이면 원본 경로)"""
+        variant = self.pick_variant(source_path, min_edge)
+        return variant["path"] if variant else str(source_path)
+
+    def _save(self, img: Image.Image, path: Path, fmt: str, quality: int) -> Dict:
+        """파생본 저장 및 manifest 항목 생성"""
+        img.save(path, fmt, quality=quality)
+        return {
+            "path": str(path),
+            "url": "/" + path.as_posix(),
+            "format": fmt,
+            "width": img.width,
+            "height": img.height,
+            "bytes": path.stat().st_size
+        }
+
+    def _write_json(self, path: Path, data: Dict):
+        """JSON 원자적 기록"""
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+
+
+def _create_normalizer() -> ImageNormalizer:
+    settings = get_settings()
+    return ImageNormalizer(
+        variants_dir=f"{settings.UPLOAD_DIR}/variants",
+        working_max_edge=settings.UPLOAD_WORKING_MAX_EDGE,
+        preview_max_edge=settings.PREVIEW_MAX_EDGE,
+        thumbnail_edge=settings.UPLOAD_THUMBNAIL_EDGE,
+        modern_format=settings.UPLOAD_MODERN_FORMAT
+    )
+
+
+def normalize_upload(source_path: str, content_hash: str) -> Dict:
+    """워커 프로세스에서 정규화 실행"""
+    return image_normalizer.normalize(source_path, content_hash)
+
+
+# 전역 인스턴스
+image_normalizer = _create_normalizer()
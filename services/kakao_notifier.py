@@ -4,13 +4,98 @@
 """
 import os
 import json
+import time
+import asyncio
 import aiohttp
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from config.settings import get_settings
+
 logger = logging.getLogger(__name__)
 
+# 요약 알림에 싣는 대화 한 줄 최대 길이
+DIGEST_LINE_CHARS = 80
+
+KAKAO_MEMO_URL = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+
+
+class RateLimiter:
+    """채널별 전송 속도 제한 (토큰 버킷, 분당 per_minute건, 0이면 무제한)"""
+    
+    def __init__(self, per_minute: int):
+        self.capacity = max(1, per_minute)
+        self.rate = per_minute / 60
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰이 생길 때까지 대기 후 1개 소비"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    채널별 회로 차단기
+    
+    연속 failure_threshold회 실패하면 cooldown초 동안 호출 없이 바로 실패 처리,
+    cooldown이 지나면 한 번만 시험 호출(half-open)해서 성공하면 복구
+    """
+    
+    def __init__(self, name: str, failure_threshold: int, cooldown: float):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+    
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 (half-open이면 동시에 한 건만)"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+    
+    def record(self, ok: bool):
+        """호출 결과 반영"""
+        self._probing = False
+        if ok:
+            if self.opened_at is not None:
+                logger.info(f"{self.name} 알림 채널 복구")
+            self.failures = 0
+            self.opened_at = None
+            return
+        
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(f"{self.name} 알림 채널 {self.failures}회 연속 실패, {self.cooldown:.0f}초간 차단")
+            self.opened_at = time.monotonic()
+
 
 class KakaoNotifier:
     """
@@ -20,6 +105,9 @@ class KakaoNotifier:
     1. 카카오톡 비즈니스 API (추천)
     2. 카카오 알림톡 API
     3. Webhook 방식 (대체)
+    
+    설정된 채널 모두에 동시에 전송하며, 채널마다 요청 timeout / 전송 속도 제한 / 회로 차단기를 따로 둠
+    (한 채널이 느리거나 죽어도 다른 채널 전송은 기다리지 않음)
     """
     
     def __init__(self):
@@ -33,11 +121,96 @@ class KakaoNotifier:
         self.webhook_url = os.getenv("KAKAO_WEBHOOK_URL")
         self.discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")  # 개발/테스트용
         
-        self.enabled = bool(self.api_key or self.webhook_url or self.discord_webhook)
+        self.kakao_api_url = KAKAO_MEMO_URL
+        
+        # 채널 전송에 공유하는 HTTP 세션 (연결 재사용, 첫 전송 시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # 설정된 채널별 전송 함수 + timeout + 속도 제한 + 회로 차단기
+        # (속도 제한은 Discord webhook 분당 30건 등 외부 제한보다 낮게)
+        settings = get_settings()
+        configured = [
+            ("kakao", bool(self.api_key and self.admin_phone), self._send_via_kakao_api,
+             settings.NOTIFICATION_TIMEOUT_KAKAO_SECONDS, settings.NOTIFICATION_RATE_KAKAO_PER_MINUTE),
+            ("webhook", bool(self.webhook_url), self._send_via_webhook,
+             settings.NOTIFICATION_TIMEOUT_WEBHOOK_SECONDS, settings.NOTIFICATION_RATE_WEBHOOK_PER_MINUTE),
+            # 개발/테스트용 Discord webhook
+            ("discord", bool(self.discord_webhook), self._send_via_discord,
+             settings.NOTIFICATION_TIMEOUT_DISCORD_SECONDS, settings.NOTIFICATION_RATE_DISCORD_PER_MINUTE),
+        ]
+        self.channels: Dict[str, Dict[str, Any]] = {
+            name: {
+                "send": send,
+                "timeout": aiohttp.ClientTimeout(
+                    total=timeout,
+                    sock_connect=min(timeout, settings.NOTIFICATION_CONNECT_TIMEOUT_SECONDS)
+                ),
+                "limiter": RateLimiter(per_minute),
+                "breaker": CircuitBreaker(
+                    name,
+                    settings.NOTIFICATION_BREAKER_FAILURES,
+                    settings.NOTIFICATION_BREAKER_COOLDOWN_SECONDS
+                )
+            }
+            for name, enabled, send, timeout, per_minute in configured
+            if enabled
+        }
+        
+        self.enabled = bool(self.channels)
         
         if not self.enabled:
             logger.warning("카카오톡 알림이 비활성화되었습니다. 환경 변수를 설정하세요.")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 반환 (이벤트 루프 안에서 지연 생성)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def close(self):
+        """공유 HTTP 세션 종료 (lifespan 종료 시)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def deliver(self, message: str, channels: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        포맷된 메시지를 설정된 채널 모두에 동시 전송
+        
+        Args:
+            message: 전송할 메시지
+            channels: 보낼 채널 이름 (None이면 전체, 재시도 시 실패한 채널만)
+        
+        Returns:
+            채널별 전송 성공 여부 (회로 차단기가 열려 호출하지 않은 채널은 None)
+        """
+        names = [name for name in (channels or self.channels) if name in self.channels]
+        if not names:
+            return {}
+        
+        results = await asyncio.gather(*(self._send_channel(name, message) for name in names))
+        return dict(zip(names, results))
+    
+    async def _send_channel(self, name: str, message: str) -> Optional[bool]:
+        """채널 하나로 전송 (차단 중이면 호출 없이 None)"""
+        channel = self.channels[name]
+        breaker: CircuitBreaker = channel["breaker"]
+        if not breaker.allow():
+            logger.debug(f"{name} 알림 채널 차단 중, 전송 건너뜀")
+            return None
+        
+        await channel["limiter"].acquire()
+        ok = await channel["send"](message, channel["timeout"])
+        breaker.record(ok)
+        return ok
+    
+    def retry_after(self, name: str) -> float:
+        """채널 회로 차단기가 half-open이 될 때까지 남은 초 (닫혀 있으면 0)"""
+        breaker: CircuitBreaker = self.channels[name]["breaker"]
+        if breaker.opened_at is None:
+            return 0.0
+        return max(0.0, breaker.cooldown - (time.monotonic() - breaker.opened_at))
+    
     async def send_consultation_alert(
         self,
         session_id: str,
@@ -62,28 +235,17 @@ class KakaoNotifier:
             return False
         
         try:
-            # 메시지 포맷팅
-            message = self._format_consultation_message(
+            message = self.format_consultation_message(
                 session_id, user_message, bot_response, context
             )
+            results = await self.deliver(message)
+            return any(results.values())
             
-            # 전송 방법 선택
-            if self.api_key and self.admin_phone:
-                return await self._send_via_kakao_api(message)
-            elif self.webhook_url:
-                return await self._send_via_webhook(message)
-            elif self.discord_webhook:
-                # 개발/테스트용 Discord webhook
-                return await self._send_via_discord(message)
-            else:
-                logger.error("카카오톡 전송 방법이 설정되지 않았습니다.")
-                return False
-                
         except Exception as e:
             logger.error(f"카카오톡 알림 전송 실패: {e}", exc_info=True)
             return False
     
-    def _format_consultation_message(
+    def format_consultation_message(
         self,
         session_id: str,
         user_message: str,
@@ -117,10 +279,52 @@ class KakaoNotifier:
         
         return message
     
-    async def _send_via_kakao_api(self, message: str) -> bool:
+    def format_session_digest(
+        self,
+        session_id: str,
+        turns: List[Dict[str, Any]],
+        total_turns: int,
+        reason: str
+    ) -> str:
+        """세션 대화 여러 턴을 알림 한 건으로 요약"""
+        intents = sorted({turn["intent"] for turn in turns if turn.get("intent")})
+        products = sorted({turn["product"] for turn in turns if turn.get("product") not in (None, "-")})
+        
+        message = f"""
+[플레이캣 챗봇 상담 요약]
+
+⏰ 기간: {turns[0]["at"].strftime("%Y-%m-%d %H:%M")} ~ {turns[-1]["at"].strftime("%H:%M")} (대화 {total_turns}턴)
+📝 세션: {session_id[:12]}...
+🎯 의도: {", ".join(intents) or "알 수 없음"}
+📦 제품: {", ".join(products) or "-"}
+📌 알림 사유: {reason}
+
+{self._format_turns(turns, total_turns)}
+
+---
+💡 전체 대화 내용은 관리자 대시보드에서 확인하세요.
+        """.strip()
+        
+        return message
+    
+    def _format_turns(self, turns: List[Dict[str, Any]], total_turns: int) -> str:
+        """최근 대화 턴 목록 (한 줄씩 잘라서)"""
+        def clip(text: str) -> str:
+            text = " ".join((text or "").split())
+            return text[:DIGEST_LINE_CHARS] + ("..." if len(text) > DIGEST_LINE_CHARS else "")
+        
+        lines = ["💬 최근 대화:"]
+        if total_turns > len(turns):
+            lines.append(f"(앞선 {total_turns - len(turns)}턴 생략)")
+        for turn in turns:
+            lines.append(f"[{turn['at'].strftime('%H:%M')}] 👤 {clip(turn['user'])}")
+            lines.append(f"        🤖 {clip(turn['bot'])}")
+        return "\n".join(lines)
+    
+    async def _send_via_kakao_api(self, message: str, timeout: aiohttp.ClientTimeout) -> bool:
         """카카오톡 비즈니스 API를 통한 전송"""
         try:
-            url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+            url = self.kakao_api_url
             
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
@@ -140,80 +344,89 @@ class KakaoNotifier:
                 "template_object": json.dumps(template_object)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=data) as response:
-                    if response.status == 200:
-                        logger.info("카카오톡 알림 전송 성공")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"카카오톡 API 오류 ({response.status}): {error_text}")
-                        return False
+            session = await self._get_session()
+            async with session.post(url, headers=headers, data=data, timeout=timeout) as response:
+                if response.status == 200:
+                    logger.info("카카오톡 알림 전송 성공")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"카카오톡 API 오류 ({response.status}): {error_text}")
+                    return False
                         
+        except asyncio.TimeoutError:
+            logger.error(f"카카오톡 API 응답 시간 초과 ({timeout.total}초)")
+            return False
         except Exception as e:
             logger.error(f"카카오톡 API 전송 실패: {e}")
             return False
     
-    async def _send_via_webhook(self, message: str) -> bool:
+    async def _send_via_webhook(self, message: str, timeout: aiohttp.ClientTimeout) -> bool:
         """일반 Webhook을 통한 전송"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "text": message,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status in [200, 201, 204]:
-                        logger.info("Webhook 알림 전송 성공")
-                        return True
-                    else:
-                        logger.error(f"Webhook 오류: {response.status}")
-                        return False
+            session = await self._get_session()
+            payload = {
+                "text": message,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            async with session.post(
+                self.webhook_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout
+            ) as response:
+                if response.status in [200, 201, 204]:
+                    logger.info("Webhook 알림 전송 성공")
+                    return True
+                else:
+                    logger.error(f"Webhook 오류: {response.status}")
+                    return False
                         
+        except asyncio.TimeoutError:
+            logger.error(f"Webhook 응답 시간 초과 ({timeout.total}초)")
+            return False
         except Exception as e:
             logger.error(f"Webhook 전송 실패: {e}")
             return False
     
-    async def _send_via_discord(self, message: str) -> bool:
+    async def _send_via_discord(self, message: str, timeout: aiohttp.ClientTimeout) -> bool:
         """개발/테스트용 Discord webhook 전송"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "content": f"```\n{message}\n```",
-                    "username": "플레이캣 챗봇"
-                }
-                
-                async with session.post(
-                    self.discord_webhook,
-                    json=payload
-                ) as response:
-                    if response.status in [200, 204]:
-                        logger.info("Discord 알림 전송 성공 (테스트 모드)")
-                        return True
-                    else:
-                        logger.error(f"Discord webhook 오류: {response.status}")
-                        return False
+            session = await self._get_session()
+            payload = {
+                "content": f"```\n{message}\n```",
+                "username": "플레이캣 챗봇"
+            }
+            
+            async with session.post(
+                self.discord_webhook,
+                json=payload,
+                timeout=timeout
+            ) as response:
+                if response.status in [200, 204]:
+                    logger.info("Discord 알림 전송 성공 (테스트 모드)")
+                    return True
+                else:
+                    logger.error(f"Discord webhook 오류: {response.status}")
+                    return False
                         
+        except asyncio.TimeoutError:
+            logger.error(f"Discord webhook 응답 시간 초과 ({timeout.total}초)")
+            return False
         except Exception as e:
             logger.error(f"Discord webhook 전송 실패: {e}")
             return False
     
-    async def send_quote_request_alert(
+    def format_quote_request_message(
         self,
         user_info: Dict[str, str],
-        quote_details: Dict[str, Any]
-    ) -> bool:
-        """견적 요청 알림 전송"""
-        if not self.enabled:
-            return False
-        
-        try:
-            message = f"""
+        quote_details: Dict[str, Any],
+        turns: Optional[List[Dict[str, Any]]] = None,
+        total_turns: int = 0
+    ) -> str:
+        """견적 요청 알림 메시지 포맷팅 (turns가 있으면 해당 세션 대화 요약 포함)"""
+        message = f"""
 [플레이캣 견적 요청]
 
 ⏰ 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
@@ -229,17 +442,25 @@ class KakaoNotifier:
 - 메시지: {quote_details.get('message', '-')[:100]}
 
 🔗 빠른 응답: https://www.playcat.kr/admin/quotes
-            """.strip()
-            
-            # 동일한 전송 메커니즘 사용
-            if self.api_key:
-                return await self._send_via_kakao_api(message)
-            elif self.webhook_url:
-                return await self._send_via_webhook(message)
-            elif self.discord_webhook:
-                return await self._send_via_discord(message)
-            
+        """.strip()
+        
+        if turns:
+            message += "\n\n" + self._format_turns(turns, total_turns)
+        return message
+    
+    async def send_quote_request_alert(
+        self,
+        user_info: Dict[str, str],
+        quote_details: Dict[str, Any]
+    ) -> bool:
+        """견적 요청 알림 전송"""
+        if not self.enabled:
             return False
+        
+        try:
+            message = self.format_quote_request_message(user_info, quote_details)
+            results = await self.deliver(message)
+            return any(results.values())
             
         except Exception as e:
             logger.error(f"견적 요청 알림 전송 실패: {e}")
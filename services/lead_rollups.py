@@ -0,0 +1,301 @@
+"""
+상담 분석 집계 서비스
+consultations / installations / quotes / chat_history → 일별 집계 테이블
+
+- 워터마크 이후 변경분만 읽어 영향받은 날짜를 찾고, 그 날짜만 다시 집계 (delta scan)
+- 첫 실행이거나 변경된 날짜가 많으면 전체 재계산
+- /api/admin/stats는 작은 집계 테이블만 읽음
+- 여러 워커 중 잠금 파일(flock)을 얻은 한 프로세스만 주기 갱신 (BEGIN IMMEDIATE 경합 방지)
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, IO, Iterable, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 실행 (단일 프로세스 가정)
+    fcntl = None
+
+from sqlalchemy import case, delete, distinct, exists, func, insert, select
+
+from config.settings import get_settings
+from database.models import (
+    ChatDailyStat,
+    ChatHistory,
+    Consultation,
+    Installation,
+    LeadDailyStat,
+    Quote,
+    RollupState
+)
+
+logger = logging.getLogger(__name__)
+
+# 워터마크 이름
+CONSULTATION_WATERMARK = "consultations.updated_at"
+QUOTE_WATERMARK = "quotes.id"
+CHAT_WATERMARK = "chat_history.id"
+# 마지막 갱신 시각 (워커마다 갱신 여부가 다르므로 DB에 기록)
+REFRESHED_AT = "refreshed_at"
+
+
+def _as_date(value) -> date:
+    """SQLite date() 결과('YYYY-MM-DD') 또는 date → date"""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _day_range(day: date):
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+# ==================== 집계 쿼리 ====================
+
+def lead_rollup_select(day: Optional[date] = None):
+    """상담 일별 집계 SELECT (day가 없으면 전체 기간)"""
+    day_column = func.date(Consultation.created_at)
+    query = (
+        select(
+            day_column,
+            Consultation.consultation_type,
+            Installation.region,
+            Consultation.status,
+            Installation.product_color,
+            func.count(Consultation.id),
+            func.count(Quote.id),
+            func.coalesce(func.sum(Quote.total_price), 0.0)
+        )
+        .outerjoin(Installation, Installation.consultation_id == Consultation.id)
+        .outerjoin(Quote, Quote.consultation_id == Consultation.id)
+        .where(Consultation.created_at.is_not(None))
+        .group_by(
+            day_column,
+            Consultation.consultation_type,
+            Installation.region,
+            Consultation.status,
+            Installation.product_color
+        )
+    )
+    if day is not None:
+        start, end = _day_range(day)
+        query = query.where(Consultation.created_at >= start, Consultation.created_at < end)
+    return query
+
+
+def chat_rollup_select(day: Optional[date] = None):
+    """대화 일별 집계 SELECT (전환 = 같은 session_id의 상담이 있는 세션)"""
+    day_column = func.date(ChatHistory.created_at)
+    converted = exists().where(Consultation.session_id == ChatHistory.session_id)
+    query = (
+        select(
+            day_column,
+            func.count(ChatHistory.id),
+            func.count(distinct(ChatHistory.session_id)),
+            func.count(distinct(case((converted, ChatHistory.session_id))))
+        )
+        .where(ChatHistory.created_at.is_not(None))
+        .group_by(day_column)
+    )
+    if day is not None:
+        start, end = _day_range(day)
+        query = query.where(ChatHistory.created_at >= start, ChatHistory.created_at < end)
+    return query
+
+
+LEAD_COLUMNS = [
+    "day", "consultation_type", "region", "status", "product_color",
+    "consultations", "quotes", "quote_total"
+]
+CHAT_COLUMNS = ["day", "messages", "sessions", "converted_sessions"]
+
+
+class LeadRollups:
+    """
+    일별 집계 갱신 작업
+
+    한 번의 refresh()는 단일 쓰기 트랜잭션이므로 조회 측은 항상 일관된 집계를 봄
+    """
+
+    def __init__(self, interval: float, max_delta_days: int, lock_path: Optional[str] = None):
+        self.interval = interval
+        self.max_delta_days = max_delta_days
+        self.lock_path = lock_path
+        self.last_refresh: Optional[datetime] = None
+        self._lock_file: Optional[IO] = None
+
+    async def refresh(self) -> Dict:
+        """변경분 반영 (첫 실행은 전체 재계산)"""
+        from database.connection import write_session
+
+        async with write_session() as session:
+            state = {
+                row.name: row.value
+                for row in (await session.execute(select(RollupState))).scalars()
+            }
+
+            if not state:
+                stats = await self._rebuild(session)
+            else:
+                lead_days, chat_days = await self._changed_days(session, state)
+                if len(lead_days) + len(chat_days) > self.max_delta_days:
+                    stats = await self._rebuild(session)
+                else:
+                    stats = await self._refresh_days(session, lead_days, chat_days)
+
+            await self._save_watermarks(session, state)
+
+        self.last_refresh = datetime.utcnow()
+        return stats
+
+    async def _changed_days(self, session, state: Dict[str, str]):
+        """워터마크 이후 변경된 행이 속한 날짜"""
+        lead_days: Set[date] = set()
+        chat_days: Set[date] = set()
+        changed_sessions: Set[str] = set()
+
+        # 신규/수정 상담 (상태 변경 포함, 마지막 값은 다시 포함해도 무해)
+        since = datetime.fromisoformat(state.get(CONSULTATION_WATERMARK, datetime.min.isoformat()))
+        result = await session.execute(
+            select(func.date(Consultation.created_at), Consultation.session_id)
+            .where(Consultation.updated_at >= since)
+        )
+        for day, session_id in result:
+            if day:
+                lead_days.add(_as_date(day))
+            if session_id:
+                changed_sessions.add(session_id)
+
+        # 신규 견적 → 해당 상담 날짜
+        last_quote = int(state.get(QUOTE_WATERMARK, 0))
+        result = await session.execute(
+            select(func.date(Consultation.created_at)).distinct()
+            .join(Quote, Quote.consultation_id == Consultation.id)
+            .where(Quote.id > last_quote)
+        )
+        lead_days.update(_as_date(day) for (day,) in result if day)
+
+        # 신규 대화
+        last_chat = int(state.get(CHAT_WATERMARK, 0))
+        result = await session.execute(
+            select(func.date(ChatHistory.created_at)).distinct().where(ChatHistory.id > last_chat)
+        )
+        chat_days.update(_as_date(day) for (day,) in result if day)
+
+        # 상담이 새로 생긴 세션은 과거 대화 날짜의 전환 수도 바뀜
+        if changed_sessions:
+            result = await session.execute(
+                select(func.date(ChatHistory.created_at)).distinct()
+                .where(ChatHistory.session_id.in_(changed_sessions))
+            )
+            chat_days.update(_as_date(day) for (day,) in result if day)
+
+        return lead_days, chat_days
+
+    async def _refresh_days(self, session, lead_days: Iterable[date], chat_days: Iterable[date]) -> Dict:
+        """지정 날짜만 삭제 후 재집계"""
+        lead_days, chat_days = sorted(lead_days), sorted(chat_days)
+
+        for day in lead_days:
+            await session.execute(delete(LeadDailyStat).where(LeadDailyStat.day == day))
+            await session.execute(
+                insert(LeadDailyStat).from_select(LEAD_COLUMNS, lead_rollup_select(day))
+            )
+
+        for day in chat_days:
+            await session.execute(delete(ChatDailyStat).where(ChatDailyStat.day == day))
+            await session.execute(
+                insert(ChatDailyStat).from_select(CHAT_COLUMNS, chat_rollup_select(day))
+            )
+
+        return {"mode": "delta", "lead_days": len(lead_days), "chat_days": len(chat_days)}
+
+    async def _rebuild(self, session) -> Dict:
+        """전체 재계산"""
+        await session.execute(delete(LeadDailyStat))
+        await session.execute(delete(ChatDailyStat))
+        await session.execute(insert(LeadDailyStat).from_select(LEAD_COLUMNS, lead_rollup_select()))
+        await session.execute(insert(ChatDailyStat).from_select(CHAT_COLUMNS, chat_rollup_select()))
+        logger.info("Lead rollups rebuilt")
+        return {"mode": "rebuild"}
+
+    async def _save_watermarks(self, session, state: Dict[str, str]):
+        """현재 최대값을 워터마크로 저장 (같은 트랜잭션)"""
+        latest_update = (await session.execute(select(func.max(Consultation.updated_at)))).scalar()
+        latest_quote = (await session.execute(select(func.max(Quote.id)))).scalar()
+        latest_chat = (await session.execute(select(func.max(ChatHistory.id)))).scalar()
+
+        values = {
+            CONSULTATION_WATERMARK: (latest_update or datetime.min).isoformat(),
+            QUOTE_WATERMARK: str(latest_quote or 0),
+            CHAT_WATERMARK: str(latest_chat or 0),
+            REFRESHED_AT: datetime.utcnow().isoformat()
+        }
+        for name, value in values.items():
+            if name in state:
+                if state[name] != value:
+                    row = await session.get(RollupState, name)
+                    row.value = value
+            else:
+                session.add(RollupState(name=name, value=value))
+
+    def _acquire_leader(self) -> bool:
+        """
+        갱신 담당 프로세스 잠금 (비차단 flock, 얻으면 종료할 때까지 유지)
+
+        잠금을 못 얻은 워커는 다음 주기에 다시 시도 (담당 프로세스가 종료되면 이어받음)
+        """
+        if self._lock_file is not None or fcntl is None or not self.lock_path:
+            return True
+
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        logger.info(f"Lead rollups: this process refreshes ({self.lock_path})")
+        return True
+
+    def _release_leader(self):
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def run(self):
+        """주기 실행 루프 (lifespan 백그라운드 태스크, 잠금을 얻은 프로세스만 갱신)"""
+        try:
+            while True:
+                try:
+                    if self._acquire_leader():
+                        stats = await self.refresh()
+                        if stats.get("lead_days") or stats.get("chat_days") or stats["mode"] == "rebuild":
+                            logger.info(f"Lead rollups refreshed: {stats}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Lead rollup refresh failed: {e}")
+                await asyncio.sleep(self.interval)
+        finally:
+            self._release_leader()
+
+
+# 싱글톤 인스턴스
+_lead_rollups: Optional[LeadRollups] = None
+
+
+def get_lead_rollups() -> LeadRollups:
+    """LeadRollups 싱글톤 인스턴스 반환"""
+    global _lead_rollups
+    if _lead_rollups is None:
+        settings = get_settings()
+        _lead_rollups = LeadRollups(
+            interval=settings.ROLLUP_INTERVAL_SECONDS,
+            max_delta_days=settings.ROLLUP_MAX_DELTA_DAYS,
+            lock_path=settings.ROLLUP_LOCK_FILE
+        )
+    return _lead_rollups
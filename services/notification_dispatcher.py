@@ -0,0 +1,493 @@
+"""
+알림 발송 디스패처
+관리자 알림(카카오톡/Webhook/Discord)을 메모리 큐에 넣고 백그라운드에서 전송
+
+응답 경로에서는 메시지를 포맷해 큐에 넣기만 하므로 외부 HTTP 지연이 채팅 응답에 더해지지 않음
+채팅 알림은 세션별로 모았다가 조용해지거나 양식 제출/견적 요청 시 요약 한 건으로 전송
+NOTIFICATION_OUTBOX_ENABLED이면 전송 전 notification_outbox 테이블에 기록해 재시작 후에도 재전송
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import delete, select, update
+
+from config.settings import get_settings
+from database.models import NotificationOutbox
+from services.kakao_notifier import KakaoNotifier, get_kakao_notifier
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """
+    비차단 알림 발송기
+
+    - notify_*(): 메시지를 포맷해 큐에 넣고 즉시 반환 (큐가 가득 차면 경고 후 누락)
+    - 알림 한 건을 채널별 전송 태스크로 나눠 KakaoNotifier의 공유 HTTP 세션으로 전송
+      동시 전송 한도(max_inflight)도 채널별이라, 느리거나 속도 제한에 걸린 채널이
+      다른 채널 전송을 막지 않음
+    - 실패한 채널만 지수 백오프로 max_attempts까지 재시도 (대기 중에도 다른 알림은 계속 전송)
+    - 회로 차단기가 열려 시도하지 않은 채널은 시도 횟수를 쓰지 않고 half-open 시점에 재시도
+    - outbox 사용 시 전송 전 DB에 기록, 남은 채널 목록을 갱신하고 모두 끝나면 삭제,
+      시작 시 미전송분 재적재 (이미 성공한 채널에는 다시 보내지 않음)
+    - digest 사용 시 채팅 턴을 세션별로 모아 quiet초 무응답 / max_wait초 경과 / 주요 이벤트에 요약 전송
+    - dedup_window초 안에 같은 내용의 알림은 한 번만 전송
+    """
+
+    def __init__(
+        self,
+        notifier: KakaoNotifier,
+        max_queue: int,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+        use_outbox: bool,
+        digest: bool = False,
+        digest_quiet: float = 120.0,
+        digest_max_wait: float = 900.0,
+        digest_max_turns: int = 10,
+        dedup_window: float = 600.0,
+        max_inflight: int = 8
+    ):
+        self.notifier = notifier
+        self.max_queue = max_queue
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.use_outbox = use_outbox
+        self.digest = digest
+        self.digest_quiet = digest_quiet
+        self.digest_max_wait = digest_max_wait
+        self.digest_max_turns = max(1, digest_max_turns)
+        self.dedup_window = dedup_window
+        self.max_inflight = max(1, max_inflight)
+
+        self._digests: Dict[str, Dict] = {}
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._retrying: Set[asyncio.TimerHandle] = set()
+        self._inflight: Set[asyncio.Task] = set()
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        # 전송이 끝나지 않은 알림 (id(alert) → alert, 종료 시 남은 채널을 pending으로 처리)
+        self._open: Dict[int, Dict] = {}
+        # 큐에서 꺼냈지만 아직 전송 태스크로 넘기지 못한 알림 (종료 시 pending으로 처리)
+        self._held: List[Dict] = []
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.duplicates = 0
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """큐 지연 생성 (이벤트 루프 안에서)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        return self._queue
+
+    # ==================== 요청 경로 ====================
+
+    def notify_consultation(
+        self,
+        session_id: str,
+        user_message: str,
+        bot_response: str,
+        context: Dict[str, Any],
+        flush: bool = False
+    ):
+        """
+        상담 알림 예약 (대기 없음)
+
+        digest 사용 시 세션 요약에 턴을 추가만 하고, flush=True(양식 제출 등)면 즉시 요약 전송
+        """
+        if not self.notifier.enabled:
+            return
+        if self._is_duplicate("turn", session_id, user_message, bot_response):
+            return
+
+        if not self.digest:
+            message = self.notifier.format_consultation_message(
+                session_id, user_message, bot_response, context
+            )
+            self.enqueue("consultation", message)
+            return
+
+        loop = asyncio.get_running_loop()
+        digest = self._digests.get(session_id)
+        if digest is None:
+            digest = {"turns": [], "total": 0, "started": loop.time(), "timer": None}
+            self._digests[session_id] = digest
+
+        digest["turns"].append({
+            "at": datetime.now(),
+            "user": user_message,
+            "bot": bot_response,
+            "intent": context.get("intent"),
+            "product": context.get("product_name")
+        })
+        del digest["turns"][:-self.digest_max_turns]
+        digest["total"] += 1
+
+        if flush:
+            self.flush_session(session_id, "양식 제출")
+        elif loop.time() - digest["started"] >= self.digest_max_wait:
+            self.flush_session(session_id, "대화 진행 중")
+        else:
+            if digest["timer"] is not None:
+                digest["timer"].cancel()
+            digest["timer"] = loop.call_later(self.digest_quiet, self.flush_session, session_id, "대화 종료")
+
+    def notify_quote_request(
+        self,
+        user_info: Dict[str, str],
+        quote_details: Dict[str, Any],
+        session_id: Optional[str] = None
+    ):
+        """견적 요청 알림 예약 (대기 없음, 해당 세션의 대화 요약을 함께 실음)"""
+        if not self.notifier.enabled:
+            return
+        if self._is_duplicate("quote_request", user_info, quote_details):
+            return
+
+        digest = self._take_digest(session_id) if session_id else None
+        message = self.notifier.format_quote_request_message(
+            user_info,
+            quote_details,
+            turns=digest["turns"] if digest else None,
+            total_turns=digest["total"] if digest else 0
+        )
+        self.enqueue("quote_request", message)
+
+    def flush_session(self, session_id: str, reason: str):
+        """세션에 모인 대화를 요약 한 건으로 전송 예약"""
+        digest = self._take_digest(session_id)
+        if digest is None:
+            return
+        message = self.notifier.format_session_digest(
+            session_id, digest["turns"], digest["total"], reason
+        )
+        self.enqueue("digest", message)
+
+    def _take_digest(self, session_id: str) -> Optional[Dict]:
+        digest = self._digests.pop(session_id, None)
+        if digest is not None and digest["timer"] is not None:
+            digest["timer"].cancel()
+        return digest
+
+    def _is_duplicate(self, *parts) -> bool:
+        """dedup_window초 안에 같은 내용이 이미 예약됐는지 (아니면 기록)"""
+        if self.dedup_window <= 0:
+            return False
+
+        now = asyncio.get_running_loop().time()
+        # 만료 시각이 추가 순서와 같으므로 앞에서부터 정리
+        while self._recent:
+            key, expires = next(iter(self._recent.items()))
+            if expires > now:
+                break
+            self._recent.popitem(last=False)
+
+        key = hashlib.sha1(
+            json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        if key in self._recent:
+            self.duplicates += 1
+            return True
+        self._recent[key] = now + self.dedup_window
+        return False
+
+    def enqueue(self, kind: str, message: str):
+        """포맷된 메시지 전송 예약"""
+        self._put({"id": None, "kind": kind, "message": message, "attempts": 0, "channels": None})
+
+    def _put(self, item: Dict):
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # outbox에 기록된 알림은 다음 시작 시 재적재됨
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(f"Notification queue full, {self.dropped} alerts dropped")
+
+    # ==================== 수명 주기 ====================
+
+    async def start(self):
+        """백그라운드 전송 태스크 시작 (outbox 미전송분 재적재)"""
+        if self._task is not None:
+            return
+        if self.use_outbox:
+            try:
+                await self._load_outbox()
+            except Exception as e:
+                logger.error(f"Notification outbox load failed: {e}")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float):
+        """
+        전송 태스크 종료
+
+        모아 둔 세션 요약은 먼저 큐에 넣고,
+        outbox 사용 시 남은 알림은 DB에 남겨 다음 시작 때 전송,
+        아니면 timeout 안에서 한 번씩만 전송 시도
+        """
+        for session_id in list(self._digests):
+            self.flush_session(session_id, "서버 종료")
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # 전송 중인 알림은 timeout까지 기다리고 나머지는 취소
+        if self._inflight:
+            await asyncio.wait(self._inflight, timeout=timeout)
+            for task in self._inflight:
+                task.cancel()
+
+        for handle in self._retrying:
+            handle.cancel()
+        self._retrying.clear()
+
+        # 채널이 남은 알림 + 아직 전송 태스크로 넘기지 못한 알림 + 큐
+        pending = [alert for alert in self._open.values() if alert["channels"]]
+        self._open.clear()
+        pending.extend(self._held)
+        self._held = []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+
+        if self.use_outbox:
+            await self._persist([item for item in pending if item["id"] is None])
+        elif pending:
+            try:
+                await asyncio.wait_for(self._send_once(pending), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Notification shutdown timed out, undelivered alerts dropped")
+
+        await self.notifier.close()
+
+    # ==================== 전송 ====================
+
+    async def _run(self):
+        """큐에서 알림을 꺼내 채널별 전송 태스크로 넘기는 루프"""
+        while True:
+            batch = [await self.queue.get()]
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # 취소(stop)돼도 넘기지 못한 알림이 사라지지 않도록 _held에 두고 하나씩 꺼냄
+            self._held = batch
+            if self.use_outbox:
+                await self._persist([item for item in batch if item["id"] is None])
+
+            while batch:
+                await self._dispatch(batch.pop(0))
+
+    async def _dispatch(self, alert: Dict):
+        """남은 채널마다 전송 태스크 시작"""
+        alert["channels"] = [
+            name for name in (alert["channels"] or self.notifier.channels)
+            if name in self.notifier.channels
+        ]
+        alert.setdefault("tries", {})
+        alert.setdefault("failed", [])
+        self._open[id(alert)] = alert
+        if not alert["channels"]:
+            # outbox에 남은 채널이 더 이상 설정돼 있지 않음
+            await self._settle(alert)
+            return
+        for name in alert["channels"]:
+            self._spawn(alert, name)
+
+    def _spawn(self, alert: Dict, name: str):
+        task = asyncio.create_task(self._deliver(alert, name))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    def _slot(self, name: str) -> asyncio.Semaphore:
+        """채널별 동시 전송 한도"""
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self._slots[name] = asyncio.Semaphore(self.max_inflight)
+        return slot
+
+    async def _deliver(self, alert: Dict, name: str):
+        """알림 한 건을 채널 하나로 전송 (실패하면 백오프 후 재시도 예약)"""
+        async with self._slot(name):
+            try:
+                ok = (await self.notifier.deliver(alert["message"], [name])).get(name)
+            except Exception as e:
+                logger.warning(f"Notification send error ({alert['kind']} → {name}): {e}")
+                ok = False
+
+        if ok:
+            alert["channels"].remove(name)
+            await self._settle(alert)
+            return
+
+        if ok is None:
+            # 회로 차단기가 열려 호출하지 않음 → 시도 횟수는 그대로 두고 half-open 시점에 재시도
+            self._schedule_retry(alert, name, max(self.retry_base, self.notifier.retry_after(name)))
+            return
+
+        tries = alert["tries"][name] = alert["tries"].get(name, alert["attempts"]) + 1
+        alert["attempts"] = max(alert["attempts"], tries)
+        if tries >= self.max_attempts:
+            logger.error(f"Notification ({alert['kind']}) to {name} failed after {tries} attempts")
+            alert["channels"].remove(name)
+            alert["failed"].append(name)
+            await self._settle(alert)
+            return
+
+        if alert["id"] is not None:
+            await self._outbox_update(alert["id"], attempts=alert["attempts"])
+        self._schedule_retry(alert, name, min(self.retry_max, self.retry_base * 2 ** (tries - 1)))
+
+    async def _settle(self, alert: Dict):
+        """채널 하나가 끝났을 때 알림 상태 반영 (남은 채널 기록 / 완료 처리)"""
+        if alert["channels"]:
+            if alert["id"] is not None:
+                await self._outbox_update(
+                    alert["id"], attempts=alert["attempts"], channels=list(alert["channels"])
+                )
+            return
+
+        self._open.pop(id(alert), None)
+        if alert["failed"]:
+            self.failed += 1
+            if alert["id"] is not None:
+                await self._outbox_update(
+                    alert["id"],
+                    attempts=alert["attempts"],
+                    channels=list(alert["failed"]),
+                    failed_at=datetime.utcnow()
+                )
+            return
+
+        self.sent += 1
+        if alert["id"] is not None:
+            await self._outbox_delete(alert["id"])
+
+    def _schedule_retry(self, alert: Dict, name: str, delay: float):
+        """delay초 뒤 해당 채널만 다시 전송 (전송 루프는 막지 않음)"""
+        handle: Optional[asyncio.TimerHandle] = None
+
+        def retry():
+            self._retrying.discard(handle)
+            self._spawn(alert, name)
+
+        handle = asyncio.get_running_loop().call_later(delay, retry)
+        self._retrying.add(handle)
+
+    async def _send_once(self, items: List[Dict]):
+        """종료 시 남은 알림 한 번씩 전송"""
+        results = await asyncio.gather(
+            *(self.notifier.deliver(item["message"], item["channels"]) for item in items),
+            return_exceptions=True
+        )
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Notification send error ({item['kind']}): {result}")
+
+    # ==================== outbox ====================
+
+    async def _persist(self, items: List[Dict]):
+        """새 알림을 outbox에 기록하고 ID 부여 (실패하면 메모리 전송만)"""
+        from database.connection import write_session
+
+        if not items:
+            return
+        try:
+            async with write_session() as session:
+                rows = [
+                    NotificationOutbox(
+                        kind=item["kind"],
+                        message=item["message"],
+                        attempts=item["attempts"],
+                        channels=item["channels"] or None
+                    )
+                    for item in items
+                ]
+                session.add_all(rows)
+                await session.flush()
+                for item, row in zip(items, rows):
+                    item["id"] = row.id
+        except Exception as e:
+            logger.warning(f"Notification outbox write failed ({len(items)} alerts): {e}")
+
+    async def _outbox_update(self, outbox_id: int, **values):
+        from database.connection import write_session
+
+        try:
+            async with write_session() as session:
+                await session.execute(
+                    update(NotificationOutbox).where(NotificationOutbox.id == outbox_id).values(**values)
+                )
+        except Exception as e:
+            logger.warning(f"Notification outbox update failed: {e}")
+
+    async def _outbox_delete(self, outbox_id: int):
+        from database.connection import write_session
+
+        try:
+            async with write_session() as session:
+                await session.execute(delete(NotificationOutbox).where(NotificationOutbox.id == outbox_id))
+        except Exception as e:
+            logger.warning(f"Notification outbox delete failed: {e}")
+
+    async def _load_outbox(self):
+        """재시도가 남은 미전송 알림을 큐에 재적재 (큐 크기까지)"""
+        from database.connection import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(
+                select(NotificationOutbox)
+                .where(NotificationOutbox.failed_at.is_(None))
+                .order_by(NotificationOutbox.id)
+                .limit(self.max_queue)
+            )).scalars().all()
+
+        for row in rows:
+            self._put({
+                "id": row.id,
+                "kind": row.kind,
+                "message": row.message,
+                "attempts": row.attempts or 0,
+                "channels": row.channels or None
+            })
+        if rows:
+            logger.info(f"Requeued {len(rows)} undelivered notifications from outbox")
+
+
+# 싱글톤 인스턴스
+_notification_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """NotificationDispatcher 싱글톤 인스턴스 반환"""
+    global _notification_dispatcher
+    if _notification_dispatcher is None:
+        settings = get_settings()
+        _notification_dispatcher = NotificationDispatcher(
+            notifier=get_kakao_notifier(),
+            max_queue=settings.NOTIFICATION_QUEUE_SIZE,
+            max_attempts=settings.NOTIFICATION_MAX_ATTEMPTS,
+            retry_base=settings.NOTIFICATION_RETRY_BASE_SECONDS,
+            retry_max=settings.NOTIFICATION_RETRY_MAX_SECONDS,
+            use_outbox=settings.NOTIFICATION_OUTBOX_ENABLED,
+            digest=settings.NOTIFICATION_DIGEST_ENABLED,
+            digest_quiet=settings.NOTIFICATION_DIGEST_QUIET_SECONDS,
+            digest_max_wait=settings.NOTIFICATION_DIGEST_MAX_WAIT_SECONDS,
+            digest_max_turns=settings.NOTIFICATION_DIGEST_MAX_TURNS,
+            dedup_window=settings.NOTIFICATION_DEDUP_WINDOW_SECONDS,
+            max_inflight=settings.NOTIFICATION_MAX_INFLIGHT
+        )
+    return _notification_dispatcher
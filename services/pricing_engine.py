@@ -0,0 +1,293 @@
+"""
+가격 계산 엔진
+제품 구성 + 컬러 + 설치 지역 → 항목별 견적 (PDF/레이아웃과 무관한 순수 계산)
+
+카탈로그 스냅샷 버전마다 (제품, 컬러)별 단가와 지역 할증표를 한 번만 계산해 두므로
+견적 한 건은 딕셔너리 조회와 덧셈만으로 끝남
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.product_catalog import CatalogSnapshot, get_product_catalog
+
+# 지역 할증표에서 매칭되지 않는 지역의 키
+DEFAULT_REGION_KEY = "그 외"
+DEFAULT_COLOR = "wood"
+
+
+def format_size(size: Dict) -> str:
+    """규격 문자열 (원형은 지름, 그 외 가로×세로×높이)"""
+    if "diameter" in size:
+        return f"Ø{size['diameter']}cm"
+    return f"{size.get('width', '-')}×{size.get('depth', '-')}×{size.get('height', '-')}cm"
+
+
+class PriceTable:
+    """카탈로그 스냅샷 한 버전의 사전 계산된 가격표"""
+
+    def __init__(self, snapshot: CatalogSnapshot):
+        self.version = snapshot.version
+
+        fee = snapshot.installation_fee
+        self.base_fee = int(fee.get("base", 0))
+        self.per_product_fee = int(fee.get("per_product", 0))
+
+        # 지역 할증 (부분 문자열 매칭 순서 유지, '그 외'는 기본값)
+        surcharges = dict(fee.get("regional_surcharge", {}))
+        self.default_surcharge = int(surcharges.pop(DEFAULT_REGION_KEY, 0))
+        self.regional_surcharges: List[Tuple[str, int]] = [
+            (region, int(amount)) for region, amount in surcharges.items()
+        ]
+
+        # 컬러
+        self.colors: Dict[str, Dict] = {
+            color_id: {
+                "id": color_id,
+                "name": option.get("name"),
+                "multiplier": float(option.get("price_multiplier", 1.0))
+            }
+            for color_id, option in snapshot.color_options.items()
+        }
+
+        # 제품 정보 + (제품, 컬러)별 단가
+        self.products: Dict[str, Dict] = {}
+        self.unit_prices: Dict[Tuple[str, str], int] = {}
+        for product_id, product in snapshot.by_id.items():
+            base_price = product.get("base_price") or 0
+            self.products[product_id] = {
+                "id": product_id,
+                "name": product.get("name"),
+                "size": format_size(product.get("size", {})),
+                "base_price": int(base_price)
+            }
+            for color_id, color in self.colors.items():
+                self.unit_prices[(product_id, color_id)] = int(round(base_price * color["multiplier"]))
+
+        # 일괄 계산용 단가 행렬 [제품, 컬러] (마지막 열은 알 수 없는 컬러 = 기본가)
+        self.product_index = {product_id: i for i, product_id in enumerate(self.products)}
+        self.color_index = {color_id: j for j, color_id in enumerate(self.colors)}
+        self.price_matrix = np.zeros((len(self.products), len(self.colors) + 1), dtype=np.int64)
+        for product_id, i in self.product_index.items():
+            for color_id, j in self.color_index.items():
+                self.price_matrix[i, j] = self.unit_prices[(product_id, color_id)]
+            self.price_matrix[i, -1] = self.products[product_id]["base_price"]
+
+    def regional_surcharge(self, region: Optional[str]) -> int:
+        """설치 지역 할증 (지역명에 포함된 첫 키, 없으면 '그 외')"""
+        if region:
+            for key, amount in self.regional_surcharges:
+                if key in region:
+                    return amount
+        return self.default_surcharge
+
+    def unit_price(self, product_id: str, color: str) -> int:
+        """컬러 배수가 적용된 단가 (알 수 없는 컬러는 기본가)"""
+        price = self.unit_prices.get((product_id, color))
+        if price is None:
+            price = self.products[product_id]["base_price"]
+        return price
+
+
+class PricingEngine:
+    """
+    견적 계산기
+
+    카탈로그가 바뀌면(스냅샷 버전 변경) 가격표를 다시 만듦
+    """
+
+    def __init__(self):
+        self._table: Optional[PriceTable] = None
+
+    @property
+    def table(self) -> PriceTable:
+        snapshot = get_product_catalog().snapshot
+        if self._table is None or self._table.version != snapshot.version:
+            self._table = PriceTable(snapshot)
+        return self._table
+
+    def quote(
+        self,
+        products: List[Dict],
+        product_color: str = DEFAULT_COLOR,
+        installation_region: Optional[str] = None
+    ) -> Dict:
+        """
+        항목별 견적 계산
+
+        Args:
+            products: [{"id": 제품 ID, "quantity": 수량}, ...]
+            product_color: 컬러 옵션 ID
+            installation_region: 설치 지역 (예: "경기도 시흥시")
+
+        Returns:
+            items / product_total / installation / total 등을 담은 견적 딕셔너리
+        """
+        table = self.table
+        color = product_color or DEFAULT_COLOR
+
+        items = []
+        unknown_items = []
+        product_total = 0
+        product_count = 0
+
+        for product in products:
+            product_id = product.get("id")
+            quantity = int(product.get("quantity", 1) or 0)
+            info = table.products.get(product_id)
+            if info is None:
+                unknown_items.append(product_id)
+                continue
+            if quantity <= 0:
+                continue
+
+            unit_price = table.unit_price(product_id, color)
+            line_total = unit_price * quantity
+            product_total += line_total
+            product_count += quantity
+
+            items.append({
+                "id": product_id,
+                "name": info["name"],
+                "size": info["size"],
+                "quantity": quantity,
+                "unit_price": unit_price,
+                "line_total": line_total
+            })
+
+        regional_surcharge = table.regional_surcharge(installation_region)
+        per_product_total = table.per_product_fee * product_count
+        installation_total = table.base_fee + per_product_total + regional_surcharge
+
+        color_info = table.colors.get(color, {"id": color, "name": None, "multiplier": 1.0})
+
+        return {
+            "items": items,
+            "unknown_items": unknown_items,
+            "color": color_info,
+            "installation_region": installation_region,
+            "product_count": product_count,
+            "product_total": product_total,
+            "installation": {
+                "base": table.base_fee,
+                "per_product": table.per_product_fee,
+                "per_product_total": per_product_total,
+                "regional_surcharge": regional_surcharge,
+                "total": installation_total
+            },
+            "total": product_total + installation_total,
+            "price_version": table.version
+        }
+
+    def quote_many(self, requests: List[Dict]) -> List[Dict]:
+        """
+        여러 견적을 한 번에 계산 (numpy 벡터 연산)
+
+        Args:
+            requests: [{"products": [...], "product_color": ..., "installation_region": ...}, ...]
+
+        Returns:
+            quote()와 같은 형식의 견적 목록 (요청 순서 유지)
+        """
+        table = self.table
+        count = len(requests)
+        unknown_color = len(table.colors)
+
+        # 모든 견적의 제품 라인을 평탄화
+        line_quote, line_product, line_color, line_quantity = [], [], [], []
+        unknown_items: List[List[str]] = [[] for _ in range(count)]
+        colors = []
+        for q, request in enumerate(requests):
+            color = request.get("product_color") or DEFAULT_COLOR
+            colors.append(color)
+            color_index = table.color_index.get(color, unknown_color)
+            for product in request.get("products") or []:
+                product_index = table.product_index.get(product.get("id"))
+                quantity = int(product.get("quantity", 1) or 0)
+                if product_index is None:
+                    unknown_items[q].append(product.get("id"))
+                    continue
+                if quantity <= 0:
+                    continue
+                line_quote.append(q)
+                line_product.append(product_index)
+                line_color.append(color_index)
+                line_quantity.append(quantity)
+
+        line_quote = np.asarray(line_quote, dtype=np.int64)
+        line_quantity = np.asarray(line_quantity, dtype=np.int64)
+        unit_prices = table.price_matrix[
+            np.asarray(line_product, dtype=np.int64),
+            np.asarray(line_color, dtype=np.int64)
+        ]
+        line_totals = unit_prices * line_quantity
+
+        product_totals = np.bincount(line_quote, weights=line_totals, minlength=count).astype(np.int64)
+        product_counts = np.bincount(line_quote, weights=line_quantity, minlength=count).astype(np.int64)
+
+        # 지역 할증은 고유 지역 문자열별로 한 번만 매칭
+        region_cache: Dict[Optional[str], int] = {}
+        surcharges = np.empty(count, dtype=np.int64)
+        for q, request in enumerate(requests):
+            region = request.get("installation_region")
+            if region not in region_cache:
+                region_cache[region] = table.regional_surcharge(region)
+            surcharges[q] = region_cache[region]
+
+        per_product_totals = table.per_product_fee * product_counts
+        installation_totals = table.base_fee + per_product_totals + surcharges
+        totals = product_totals + installation_totals
+
+        # 견적별 항목 목록 조립 (PDF/저장용)
+        items: List[List[Dict]] = [[] for _ in range(count)]
+        product_ids = list(table.products)
+        for q, p, quantity, unit_price, line_total in zip(
+            line_quote.tolist(),
+            line_product,
+            line_quantity.tolist(),
+            unit_prices.tolist(),
+            line_totals.tolist()
+        ):
+            info = table.products[product_ids[p]]
+            items[q].append({
+                "id": info["id"],
+                "name": info["name"],
+                "size": info["size"],
+                "quantity": quantity,
+                "unit_price": unit_price,
+                "line_total": line_total
+            })
+
+        quotes = []
+        for q, request in enumerate(requests):
+            color = colors[q]
+            quotes.append({
+                "items": items[q],
+                "unknown_items": unknown_items[q],
+                "color": table.colors.get(color, {"id": color, "name": None, "multiplier": 1.0}),
+                "installation_region": request.get("installation_region"),
+                "product_count": int(product_counts[q]),
+                "product_total": int(product_totals[q]),
+                "installation": {
+                    "base": table.base_fee,
+                    "per_product": table.per_product_fee,
+                    "per_product_total": int(per_product_totals[q]),
+                    "regional_surcharge": int(surcharges[q]),
+                    "total": int(installation_totals[q])
+                },
+                "total": int(totals[q]),
+                "price_version": table.version
+            })
+        return quotes
+
+
+# 싱글톤 인스턴스
+_pricing_engine: Optional[PricingEngine] = None
+
+
+def get_pricing_engine() -> PricingEngine:
+    """PricingEngine 싱글톤 인스턴스 반환"""
+    global _pricing_engine
+    if _pricing_engine is None:
+        _pricing_engine = PricingEngine()
+    return _pricing_engine
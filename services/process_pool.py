@@ -0,0 +1,163 @@
+"""
+프로세스 풀 서비스
+CPU 집약 작업(이미지 합성 등)을 이벤트 루프 밖의 워커 프로세스에서 실행
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolBusyError(Exception):
+    """풀 대기열이 가득 참 (503으로 응답)"""
+
+
+class WorkerPool:
+    """
+    백프레셔를 지원하는 ProcessPoolExecutor 래퍼
+
+    - 워커 프로세스는 재사용되므로 initializer에서 만든 캐시가 유지됨
+    - 인자/결과는 파일 경로 등 작은 값만 주고받음 (배열 피클링 금지)
+    - 실행 중 + 대기 중 작업이 max_pending 이상이면 PoolBusyError
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_pending: int,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = ()
+    ):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self.initializer = initializer
+        self.initargs = initargs
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 중 또는 대기 중인 작업 수"""
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """실행기 지연 생성 (첫 작업 시 워커 기동)"""
+        if self._executor is None:
+            # fork는 이벤트 루프 스레드 상태를 복제하므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs
+            )
+            logger.info(f"{self.name} pool started ({self.max_workers} workers)")
+        return self._executor
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """
+        워커 프로세스에서 함수 실행
+
+        Args:
+            fn: 모듈 최상위 함수 (피클 가능해야 함)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            PoolBusyError: 대기열이 가득 찬 경우
+        """
+        if self._pending >= self.max_pending:
+            raise PoolBusyError(
+                f"{self.name} pool is busy ({self._pending} pending)"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """워커 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.info(f"{self.name} pool stopped")
+
+
+# ==================== 이미지 처리 풀 ====================
+
+_image_pool: Optional[WorkerPool] = None
+
+
+def get_image_pool() -> WorkerPool:
+    """이미지 처리 풀 싱글톤 반환"""
+    global _image_pool
+    if _image_pool is None:
+        settings = get_settings()
+        from services.image_composer import init_worker
+        _image_pool = WorkerPool(
+            name="image",
+            max_workers=settings.IMAGE_POOL_WORKERS,
+            max_pending=settings.IMAGE_POOL_MAX_PENDING,
+            initializer=init_worker
+        )
+    return _image_pool
+
+
+# ==================== PDF 렌더링 풀 ====================
+
+_pdf_pool: Optional[WorkerPool] = None
+
+
+def get_pdf_pool() -> WorkerPool:
+    """견적서 PDF 렌더링 풀 싱글톤 반환"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        settings = get_settings()
+        from services.quote_generator import init_worker
+        _pdf_pool = WorkerPool(
+            name="pdf",
+            max_workers=settings.PDF_POOL_WORKERS,
+            max_pending=settings.PDF_POOL_MAX_PENDING,
+            initializer=init_worker
+        )
+    return _pdf_pool
+
+
+# 일괄 재발행 전용 (대화형 견적 요청과 워커를 나눠 쓰지 않음)
+_bulk_pdf_pool: Optional[WorkerPool] = None
+
+
+def get_bulk_pdf_pool() -> WorkerPool:
+    """일괄 견적서 렌더링 풀 싱글톤 반환"""
+    global _bulk_pdf_pool
+    if _bulk_pdf_pool is None:
+        settings = get_settings()
+        from services.quote_generator import init_worker
+        workers = settings.BULK_QUOTE_WORKERS or os.cpu_count() or 1
+        _bulk_pdf_pool = WorkerPool(
+            name="pdf-bulk",
+            max_workers=workers,
+            max_pending=workers * 2,
+            initializer=init_worker
+        )
+    return _bulk_pdf_pool
+
+
+def shutdown_pools():
+    """모든 프로세스 풀 종료 (lifespan 종료 시)"""
+    for pool in (_image_pool, _pdf_pool, _bulk_pdf_pool):
+        if pool is not None:
+            pool.shutdown()
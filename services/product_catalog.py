@@ -0,0 +1,191 @@
+"""
+제품 카탈로그 서비스
+products 테이블 read-through 저장소 + 메모리 인덱스 + 사전 직렬화 응답
+
+라우터, QuoteGenerator, 챗봇 프롬프트가 모두 같은 스냅샷을 공유하므로
+프로세스당 한 번만 파싱/적재하고 가격이 항상 일치함
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from database.catalog_import import (
+    CatalogSources,
+    load_catalog_sources,
+    source_mtimes,
+    import_catalog,
+    fetch_active_products
+)
+from services.disk_cache import canonical_hash
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_category(category: str) -> str:
+    """카테고리 비교용 정규화"""
+    return (category or "").strip().casefold()
+
+
+def _dumps(data) -> bytes:
+    """FastAPI JSONResponse와 같은 형식으로 직렬화"""
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class CatalogSnapshot:
+    """
+    카탈로그 한 버전의 불변 스냅샷
+
+    요청 처리 중에는 스냅샷 하나만 참조하므로 리로드와 경쟁하지 않음
+    """
+
+    def __init__(self, products: List[Dict], pricing: Dict, document: Dict):
+        self.products = products
+        self.pricing = pricing
+        self.installation_fee: Dict = pricing["installation_fee"]
+        self.color_options: Dict = pricing["color_options"]
+
+        # 프롬프트 빌더용 문서 (products_real.json 형태)
+        # 제품/컬러 옵션/설치비는 견적과 같은 값 (활성 제품, 가격표)
+        services = dict(document.get("installation_services", {}))
+        services.update(
+            base_fee=self.installation_fee.get("base", 0),
+            per_product_fee=self.installation_fee.get("per_product", 0),
+            regional_surcharge=self.installation_fee.get("regional_surcharge", {})
+        )
+        self.document = {
+            **document,
+            "products": products,
+            "installation_services": services,
+            "color_options": self.color_options
+        }
+
+        # 버전별 strong ETag (각 응답은 버전의 결정적 함수이므로 버전 해시 하나로 충분)
+        self.version = canonical_hash({"products": products, "pricing": pricing})[:32]
+        self.etag = f'"{self.version}"'
+
+        # 인덱스
+        self.by_id: Dict[str, Dict] = {p["id"]: p for p in self.products}
+        by_category: Dict[str, List[Dict]] = defaultdict(list)
+        for product in self.products:
+            by_category[normalize_category(product.get("category", ""))].append(product)
+        self.by_category = dict(by_category)
+
+        # 사전 직렬화된 응답 본문
+        self.list_body = _dumps({"products": self.products})
+        self.product_bodies = {
+            product_id: _dumps({"product": product})
+            for product_id, product in self.by_id.items()
+        }
+        self.category_bodies = {
+            category: _dumps({
+                "category": category,
+                "count": len(products),
+                "products": products
+            })
+            for category, products in self.by_category.items()
+        }
+
+    def category_body(self, category: str) -> bytes:
+        """카테고리 응답 본문 (없는 카테고리는 빈 목록)"""
+        key = normalize_category(category)
+        body = self.category_bodies.get(key)
+        if body is None:
+            body = _dumps({"category": key, "count": 0, "products": []})
+        return body
+
+
+class ProductCatalog:
+    """
+    제품 카탈로그 저장소
+
+    - 시작 시 JSON 원본을 products 테이블로 import 후 테이블의 활성 제품만 적재
+      (기존 카탈로그 전용 ID는 비활성 행이라 목록/견적/프롬프트에 나오지 않음)
+    - ID / 정규화된 카테고리 인덱스
+    - 원본 파일 mtime이 바뀌면 watch()가 재import 후 스냅샷을 원자적으로 교체
+    - DB 적재 전(스크립트, 임포트 시점)에는 JSON 원본으로 스냅샷 생성
+    """
+
+    def __init__(self, reload_interval: float = 5.0):
+        self.reload_interval = reload_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._sources: Optional[CatalogSources] = None
+
+    @property
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        """현재 스냅샷 (아직 없으면 JSON 원본으로 생성)"""
+        if self._snapshot is None:
+            try:
+                self.load()
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Product catalog load failed: {e}")
+        return self._snapshot
+
+    def load(self) -> CatalogSnapshot:
+        """JSON 원본만으로 스냅샷 생성 (DB 없이)"""
+        sources = self._get_sources()
+        self._snapshot = CatalogSnapshot(sources.products, sources.pricing, sources.document)
+        return self._snapshot
+
+    async def refresh(self) -> CatalogSnapshot:
+        """products 테이블에서 스냅샷 재적재"""
+        from database.connection import AsyncSessionLocal
+
+        sources = self._get_sources()
+        async with AsyncSessionLocal() as session:
+            products = await fetch_active_products(session)
+
+        if not products:
+            products = sources.products
+
+        self._snapshot = CatalogSnapshot(products, sources.pricing, sources.document)
+        logger.info(
+            f"Product catalog loaded: {len(products)} products (version {self._snapshot.version[:8]})"
+        )
+        return self._snapshot
+
+    async def sync(self) -> Optional[CatalogSnapshot]:
+        """JSON 원본 → products 테이블 import 후 재적재 (실패 시 JSON 스냅샷)"""
+        from database.connection import AsyncSessionLocal
+
+        try:
+            sources = self._get_sources()
+            async with AsyncSessionLocal() as session:
+                stats = await import_catalog(session, sources)
+            logger.info(f"Product catalog imported: {stats}")
+            return await self.refresh()
+        except Exception as e:
+            logger.error(f"Product catalog sync failed, serving JSON sources: {e}")
+            return self.snapshot
+
+    async def watch(self):
+        """원본 파일 변경 감지 루프 (lifespan 백그라운드 태스크)"""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            if self._sources is not None and source_mtimes() != self._sources.mtimes:
+                logger.info("Product catalog source changed, reloading")
+                await self.sync()
+
+    def _get_sources(self) -> CatalogSources:
+        """파싱된 원본 (파일이 바뀌었을 때만 다시 파싱)"""
+        if self._sources is None or source_mtimes() != self._sources.mtimes:
+            self._sources = load_catalog_sources()
+        return self._sources
+
+
+# 싱글톤 인스턴스
+_product_catalog: Optional[ProductCatalog] = None
+
+
+def get_product_catalog() -> ProductCatalog:
+    """ProductCatalog 싱글톤 인스턴스 반환"""
+    global _product_catalog
+    if _product_catalog is None:
+        _product_catalog = ProductCatalog()
+    return _product_catalog
@@ -6,64 +6,397 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
-import json
+from typing import Dict, List, Optional
+import asyncio
+import os
+import shutil
+import uuid
+
+from config.settings import get_settings
+from services.disk_cache import DiskLRUCache, canonical_hash
+from services.pricing_engine import get_pricing_engine
+
+# 한글 폰트 후보 (Windows 기본 폰트, 리눅스 나눔고딕)
+FONT_CANDIDATES = [
+    ('Malgun', 'malgun.ttf'),
+    ('NanumGothic', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'),
+]
+
+# PDF 고객 정보 섹션에 표시되는 상담 필드 (캐시 키에 포함)
+CUSTOMER_FIELDS = (
+    'installation_region', 'installation_location', 'cat_count',
+    'width', 'height', 'ceiling_height'
+)
+
+# 견적서 유효 기간 / 최소 설치 가능일
+QUOTE_VALIDITY_DAYS = 30
+INSTALLATION_LEAD_DAYS = 14
+
+
+class QuoteResources:
+    """
+    프로세스당 한 번만 만드는 견적서 렌더링 자원
+
+    - 폰트 등록
+    - ParagraphStyle / TableStyle
+    - 날짜가 없는 고정 문단 (제목, 일정 안내, 회사 정보)
+    """
+
+    def __init__(self):
+        self.font_name = self._register_font()
+
+        base = getSampleStyleSheet()
+        self.styles = {
+            # 제목 스타일
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=base['Heading1'],
+                fontName=self.font_name,
+                fontSize=24,
+                textColor=colors.HexColor('#2C3E50'),
+                alignment=TA_CENTER,
+                spaceAfter=12
+            ),
+            # 소제목 스타일
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=base['Heading2'],
+                fontName=self.font_name,
+                fontSize=14,
+                textColor=colors.HexColor('#34495E'),
+                spaceAfter=6
+            ),
+            # 본문 스타일
+            'body': ParagraphStyle(
+                'CustomBody',
+                parent=base['Normal'],
+                fontName=self.font_name,
+                fontSize=10,
+                leading=14
+            ),
+            'normal': base['Normal']
+        }
+        self.styles['footer'] = ParagraphStyle(
+            'Footer',
+            parent=self.styles['body'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#7F8C8D')
+        )
+
+        self.info_table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ECF0F1')),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2C3E50')),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+        self.product_table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTNAME', (0, 0), (-1, 0), self.font_name),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ])
+        self.summary_table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -2), 10),
+            ('FONTSIZE', (0, -1), (-1, -1), 14),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -2), 0.5, colors.grey),
+            ('LINEABOVE', (0, -1), (-1, -1), 2, colors.HexColor('#2C3E50')),
+            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ECF0F1')),
+            ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#E74C3C')),
+            ('FONTNAME', (0, -1), (-1, -1), self.font_name),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+
+        # 고정 문단 (문서마다 재사용, 날짜 문단만 매번 생성)
+        styles = self.styles
+        self.title = Paragraph("PLAYCAT 고양이 행동풍부화<br/>설치 견적서", styles['title'])
+        self.customer_heading = Paragraph("상담 정보", styles['heading'])
+        self.product_heading = Paragraph("제품 구성", styles['heading'])
+        self.summary_heading = Paragraph("견적 금액", styles['heading'])
+        self.schedule_heading = Paragraph("설치 가능 일정", styles['heading'])
+        self.schedule_intro = Paragraph(
+            "선결제(완불) 확인 후 제작에 들어가며, 제작 기간은 약 7-10일 소요됩니다.",
+            styles['body']
+        )
+        self.schedule_notes = Paragraph(
+            "정확한 설치 일정은 결제 확인 후 개별 연락드립니다.<br/>"
+            "이사 예정이신 경우 이사 후 가구 배치가 끝난 다음 설치를 권장드립니다.",
+            styles['body']
+        )
+        self.footer_contact = Paragraph(
+            "<b>PLAYCAT - 플레이캣</b><br/>"
+            "경기도 시흥시 연성로 156번길 39<br/>"
+            "Tel: 1522-5092 / 010-5676-8282<br/>"
+            "Email: thebloomkr@naver.com<br/>"
+            "Web: www.playcat.kr<br/>"
+            "Instagram: @playcat.kr",
+            styles['footer']
+        )
+
+    @staticmethod
+    def _register_font() -> str:
+        """한글 폰트 등록 (없으면 기본 폰트, 한글 깨질 수 있음)"""
+        for name, path in FONT_CANDIDATES:
+            if name in pdfmetrics.getRegisteredFontNames():
+                return name
+            try:
+                pdfmetrics.registerFont(TTFont(name, path))
+                return name
+            except Exception:
+                continue
+        return 'Helvetica'
 
 
 class QuoteGenerator:
-    """견적서 생성 서비스"""
+    """
+    견적서 생성 서비스
+
+    - output_dir: 견적서 PDF 캐시 (크기 제한 LRU, 오래된 파일은 지워짐)
+    - issued_dir: Quote 행이 참조하는 PDF (issue()로 고정, LRU 정리 대상 아님)
+    """
 
-    def __init__(self, output_dir: str = "static/quotes"):
+    def __init__(self, output_dir: str = "static/quotes", issued_dir: str = "static/quotes_issued"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.issued_dir = Path(issued_dir)
+        self._resources: Optional[QuoteResources] = None
+        self._quote_cache: Optional[DiskLRUCache] = None
+
+    @property
+    def resources(self) -> QuoteResources:
+        """렌더링 자원 (첫 렌더링 시 생성, 이후 재사용)"""
+        if self._resources is None:
+            self._resources = QuoteResources()
+        return self._resources
+
+    @property
+    def font_name(self) -> str:
+        return self.resources.font_name
+
+    @property
+    def quote_cache(self) -> DiskLRUCache:
+        """견적서 PDF 캐시 (content hash 파일명, 크기 제한 LRU)"""
+        if self._quote_cache is None:
+            self._quote_cache = DiskLRUCache(
+                str(self.output_dir),
+                max_bytes=get_settings().QUOTE_CACHE_MAX_BYTES,
+                suffix=".pdf"
+            )
+        return self._quote_cache
+
+    @staticmethod
+    def cache_key(consultation_data: Dict, quote: Dict, issued_on: date) -> str:
+        """
+        견적서 내용 기준 캐시 키
+
+        PDF에 인쇄되는 값(고객 정보, 항목별 견적, 유효기간)만 정규화해 해시하므로
+        같은 견적을 같은 날 다시 요청하면 같은 파일을 재사용
+        """
+        return canonical_hash({
+            "customer": {field: consultation_data.get(field) for field in CUSTOMER_FIELDS},
+            "items": [
+                [item["id"], item["quantity"], item["unit_price"], item["line_total"]]
+                for item in quote["items"]
+            ],
+            "color": quote["color"].get("name"),
+            "product_total": quote["product_total"],
+            "installation": quote["installation"],
+            "total": quote["total"],
+            "valid_until": (issued_on + timedelta(days=QUOTE_VALIDITY_DAYS)).isoformat()
+        })
+
+    def issue(self, key: str, cached_path: Path) -> Path:
+        """
+        Quote 행에 저장할 PDF를 캐시 밖(issued_dir)에 고정
+
+        캐시 파일은 LRU 정리로 지워질 수 있으므로 하드 링크(안 되면 복사)로 보관
+        키가 같으면 내용도 같으므로 이미 있으면 그대로 사용
+        (디렉토리를 훑을 수 있는 파일 I/O이므로 비동기 코드에서는 asyncio.to_thread로 호출)
+        """
+        path = self.issued_dir / f"{key}.pdf"
+        if path.exists():
+            return path
 
-        # 한글 폰트 등록 (Windows 기본 폰트 사용)
+        self.issued_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.issued_dir / f".{uuid.uuid4().hex}.pdf"
         try:
-            pdfmetrics.registerFont(TTFont('Malgun', 'malgun.ttf'))
-            self.font_name = 'Malgun'
-        except:
-            # 폰트가 없으면 기본 폰트 사용 (한글 깨질 수 있음)
-            self.font_name = 'Helvetica'
-
-        self._load_product_data()
-
-    def _load_product_data(self):
-        """제품 데이터 로드"""
-        products_path = Path(__file__).parent.parent / "data" / "products.json"
-        with open(products_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.products = {p["id"]: p for p in data["products"]}
-            self.installation_fee = data["installation_fee"]
-            self.color_options = data["color_options"]
+            os.link(cached_path, tmp_path)
+        except OSError:
+            shutil.copyfile(cached_path, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def new_tmp_path(self) -> Path:
+        """렌더링용 임시 파일 경로 (캐시와 같은 파일시스템)"""
+        tmp_dir = self.output_dir / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir / f"{uuid.uuid4().hex}.pdf"
+
+    def price(self, consultation_data: Dict, recommended_products: List[Dict]) -> Dict:
+        """상담 데이터 기준 견적 계산"""
+        return get_pricing_engine().quote(
+            recommended_products,
+            product_color=consultation_data.get("product_color", "wood"),
+            installation_region=consultation_data.get("installation_region")
+        )
 
     def generate_quote(
         self,
         consultation_data: Dict,
         recommended_products: List[Dict],
-        output_filename: str = None
+        output_filename: str = None,
+        quote: Optional[Dict] = None
     ) -> str:
         """
-        견적서 PDF 생성
+        견적서 PDF 생성 (동기, 현재 프로세스에서 렌더링)
 
         Args:
             consultation_data: 상담 데이터
             recommended_products: 추천 제품 리스트
-            output_filename: 출력 파일명
+            output_filename: 출력 파일명 (지정 시 캐시를 거치지 않음)
+            quote: PricingEngine.quote() 결과 (없으면 여기서 계산)
 
         Returns:
             생성된 PDF 파일 경로
         """
-        if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"quote_{timestamp}.pdf"
+        if quote is None:
+            quote = self.price(consultation_data, recommended_products)
+
+        issued_on = date.today()
+        if output_filename:
+            return self.render_to_path(
+                consultation_data, quote, str(self.output_dir / output_filename), issued_on.isoformat()
+            )
+
+        key = self.cache_key(consultation_data, quote, issued_on)
+        cached = self.quote_cache.get(key)
+        if cached:
+            return str(cached)
+
+        tmp_path = self.new_tmp_path()
+        self.render(consultation_data, quote, str(tmp_path), issued_on.isoformat())
+        return str(self.quote_cache.put(key, tmp_path))
+
+    async def generate_quote_async(
+        self,
+        consultation_data: Dict,
+        recommended_products: List[Dict],
+        output_filename: str = None,
+        quote: Optional[Dict] = None
+    ) -> str:
+        """
+        견적서 PDF 생성 (PDF 워커 풀에서 렌더링, 이벤트 루프 비차단)
+
+        같은 내용/유효기간의 견적서는 캐시에서 바로 반환
 
-        output_path = self.output_dir / output_filename
+        Returns:
+            생성된 PDF 파일 경로
+
+        Raises:
+            PoolBusyError: PDF 풀 대기열이 가득 찬 경우
+        """
+        from services.process_pool import get_pdf_pool
+
+        if quote is None:
+            quote = self.price(consultation_data, recommended_products)
+
+        issued_on = date.today()
+        if output_filename:
+            return await get_pdf_pool().run(
+                render_quote_pdf, consultation_data, quote,
+                str(self.output_dir / output_filename), issued_on.isoformat()
+            )
+
+        key = self.cache_key(consultation_data, quote, issued_on)
+        cached = self.quote_cache.get(key)
+        if cached:
+            return str(cached)
+
+        tmp_path = self.new_tmp_path()
+        try:
+            await get_pdf_pool().run(
+                render_quote_file, consultation_data, quote, str(tmp_path), issued_on.isoformat()
+            )
+            return str(await asyncio.to_thread(self.quote_cache.put, key, tmp_path))
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    async def render_quote_bytes(
+        self,
+        consultation_data: Dict,
+        recommended_products: List[Dict],
+        quote: Optional[Dict] = None
+    ) -> bytes:
+        """견적서 PDF 바이트 (캐시 파일을 읽어 반환, 없으면 워커 풀에서 렌더링)"""
+        path = await self.generate_quote_async(consultation_data, recommended_products, quote=quote)
+        return await asyncio.to_thread(Path(path).read_bytes)
+
+    def render_to_path(
+        self,
+        consultation_data: Dict,
+        quote: Dict,
+        output_path: str,
+        issued_on: Optional[str] = None
+    ) -> str:
+        """PDF를 임시 파일에 렌더링 후 원자적으로 교체"""
+        target = Path(output_path)
+        tmp_dir = target.parent / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = tmp_dir / f"{uuid.uuid4().hex}.pdf"
+        try:
+            self.render(consultation_data, quote, str(tmp_path), issued_on)
+            os.replace(tmp_path, target)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return str(target)
+
+    def render(
+        self,
+        consultation_data: Dict,
+        quote: Dict,
+        output,
+        issued_on: Optional[str] = None
+    ) -> None:
+        """
+        견적서 렌더링
+
+        Args:
+            consultation_data: 상담 데이터
+            quote: PricingEngine.quote() 결과
+            output: 파일 경로 또는 파일 객체
+            issued_on: 견적일자 (ISO, 없으면 오늘) - 설치 가능일/유효기간 기준
+        """
+        resources = self.resources
+        now = datetime.fromisoformat(issued_on) if issued_on else datetime.now()
 
         # PDF 문서 생성
         doc = SimpleDocTemplate(
-            str(output_path),
+            output,
             pagesize=A4,
             rightMargin=2*cm,
             leftMargin=2*cm,
@@ -71,333 +404,175 @@ class QuoteGenerator:
             bottomMargin=2*cm
         )
 
-        # 스타일 설정
-        styles = self._create_styles()
-
         # 문서 요소 리스트
         elements = []
 
         # 헤더
-        elements.extend(self._create_header(styles))
+        elements.extend(self._create_header(resources, now))
         elements.append(Spacer(1, 0.5*cm))
 
         # 고객 정보
-        elements.extend(self._create_customer_info(consultation_data, styles))
+        elements.extend(self._create_customer_info(resources, consultation_data, quote))
         elements.append(Spacer(1, 0.5*cm))
 
         # 제품 목록
-        product_total = self._create_product_table(
-            recommended_products,
-            elements,
-            styles,
-            consultation_data.get("product_color", "wood")
-        )
+        elements.extend(self._create_product_table(resources, quote))
         elements.append(Spacer(1, 0.5*cm))
 
-        # 금액 계산
-        elements.extend(self._create_price_summary(
-            product_total,
-            consultation_data,
-            styles
-        ))
+        # 금액 요약
+        elements.extend(self._create_price_summary(resources, quote))
         elements.append(Spacer(1, 0.5*cm))
 
         # 설치 일정 안내
-        elements.extend(self._create_installation_schedule(styles))
+        elements.extend(self._create_installation_schedule(resources, now))
         elements.append(Spacer(1, 0.5*cm))
 
         # 푸터
-        elements.extend(self._create_footer(styles))
+        elements.extend(self._create_footer(resources, now))
 
         # PDF 빌드
         doc.build(elements)
 
-        return str(output_path)
-
-    def _create_styles(self) -> Dict:
-        """스타일 생성"""
-        styles = getSampleStyleSheet()
-
-        # 제목 스타일
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontName=self.font_name,
-            fontSize=24,
-            textColor=colors.HexColor('#2C3E50'),
-            alignment=TA_CENTER,
-            spaceAfter=12
-        )
-
-        # 소제목 스타일
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontName=self.font_name,
-            fontSize=14,
-            textColor=colors.HexColor('#34495E'),
-            spaceAfter=6
-        )
-
-        # 본문 스타일
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontName=self.font_name,
-            fontSize=10,
-            leading=14
-        )
-
-        return {
-            'title': title_style,
-            'heading': heading_style,
-            'body': body_style,
-            'normal': styles['Normal']
-        }
-
-    def _create_header(self, styles: Dict) -> List:
+    def _create_header(self, resources: QuoteResources, now: datetime) -> List:
         """헤더 생성"""
-        elements = []
-
         # 회사 로고 (있다면)
         # logo_path = Path("static/images/logo.png")
         # if logo_path.exists():
         #     logo = Image(str(logo_path), width=3*cm, height=3*cm)
         #     elements.append(logo)
 
-        # 제목
-        title = Paragraph("PLAYCAT 고양이 행동풍부화<br/>설치 견적서", styles['title'])
-        elements.append(title)
-
-        # 날짜
-        date_text = f"견적일자: {datetime.now().strftime('%Y년 %m월 %d일')}"
-        date_para = Paragraph(date_text, styles['body'])
-        elements.append(date_para)
+        date_text = f"견적일자: {now.strftime('%Y년 %m월 %d일')}"
+        return [resources.title, Paragraph(date_text, resources.styles['body'])]
 
-        return elements
-
-    def _create_customer_info(self, data: Dict, styles: Dict) -> List:
+    def _create_customer_info(self, resources: QuoteResources, data: Dict, quote: Dict) -> List:
         """고객 정보 섹션"""
-        elements = []
-
-        heading = Paragraph("상담 정보", styles['heading'])
-        elements.append(heading)
-
         info_data = [
             ['설치 지역', data.get('installation_region', '-')],
             ['설치 장소', data.get('installation_location', '-')],
             ['고양이 수', f"{data.get('cat_count', 0)}마리"],
             ['공간 크기', f"가로 {data.get('width', 0)}cm × 세로 {data.get('height', 0)}cm × 높이 {data.get('ceiling_height', 0)}cm"],
-            ['제품 컬러', self.color_options.get(data.get('product_color', 'wood'), {}).get('name', '-')]
+            ['제품 컬러', quote['color'].get('name') or '-']
         ]
 
         table = Table(info_data, colWidths=[4*cm, 12*cm])
-        table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ECF0F1')),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2C3E50')),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
-
-        elements.append(table)
-        return elements
-
-    def _create_product_table(
-        self,
-        products: List[Dict],
-        elements: List,
-        styles: Dict,
-        color_option: str
-    ) -> float:
-        """제품 목록 테이블 생성"""
-        heading = Paragraph("제품 구성", styles['heading'])
-        elements.append(heading)
+        table.setStyle(resources.info_table_style)
+        return [resources.customer_heading, table]
 
+    def _create_product_table(self, resources: QuoteResources, quote: Dict) -> List:
+        """제품 목록 테이블"""
         # 테이블 헤더
         table_data = [
             ['제품명', '규격', '수량', '단가', '금액']
         ]
 
-        total = 0.0
-        color_multiplier = self.color_options.get(color_option, {}).get('price_multiplier', 1.0)
-
-        for product in products:
-            product_id = product.get('id')
-            quantity = product.get('quantity', 1)
-
-            product_info = self.products.get(product_id)
-            if not product_info:
-                continue
-
-            name = product_info['name']
-            size = product_info['size']
-
-            # 규격 문자열
-            if 'diameter' in size:
-                size_str = f"Ø{size['diameter']}cm"
-            else:
-                size_str = f"{size['width']}×{size['depth']}×{size['height']}cm"
-
-            # 가격 계산
-            unit_price = product_info['base_price'] * color_multiplier
-            line_total = unit_price * quantity
-            total += line_total
-
+        for item in quote['items']:
             table_data.append([
-                name,
-                size_str,
-                f"{quantity}개",
-                f"{int(unit_price):,}원",
-                f"{int(line_total):,}원"
+                item['name'],
+                item['size'],
+                f"{item['quantity']}개",
+                f"{item['unit_price']:,}원",
+                f"{item['line_total']:,}원"
             ])
 
-        # 테이블 생성
         table = Table(table_data, colWidths=[6*cm, 3*cm, 2*cm, 3*cm, 3*cm])
-        table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTNAME', (0, 0), (-1, 0), self.font_name),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        table.setStyle(resources.product_table_style)
+        return [resources.product_heading, table]
 
-        elements.append(table)
-        return total
-
-    def _create_price_summary(
-        self,
-        product_total: float,
-        data: Dict,
-        styles: Dict
-    ) -> List:
+    def _create_price_summary(self, resources: QuoteResources, quote: Dict) -> List:
         """금액 요약"""
-        elements = []
+        installation = quote['installation']
+        summary_data = [
+            ['제품 금액', f"{quote['product_total']:,}원"],
+            ['기본 설치비', f"{installation['base']:,}원"],
+            ['제품별 설치비', f"{installation['per_product_total']:,}원"],
+            ['지역 할증', f"{installation['regional_surcharge']:,}원"],
+            ['', ''],
+            ['총 견적 금액', f"{quote['total']:,}원"]
+        ]
 
-        heading = Paragraph("견적 금액", styles['heading'])
-        elements.append(heading)
+        table = Table(summary_data, colWidths=[12*cm, 5*cm])
+        table.setStyle(resources.summary_table_style)
+        return [resources.summary_heading, table]
 
-        # 지역별 할증 계산
-        region = data.get('installation_region', '')
-        regional_surcharge = 0
+    def _create_installation_schedule(self, resources: QuoteResources, now: datetime) -> List:
+        """설치 일정 안내"""
+        # 오늘 기준 가능한 날짜 (예: 2주 후부터)
+        earliest_date = now + timedelta(days=INSTALLATION_LEAD_DAYS)
+        earliest = Paragraph(
+            f"<b>최소 설치 가능일:</b> {earliest_date.strftime('%Y년 %m월 %d일')} 이후",
+            resources.styles['body']
+        )
 
-        for key, value in self.installation_fee['regional_surcharge'].items():
-            if key in region:
-                regional_surcharge = value
-                break
+        return [
+            resources.schedule_heading,
+            resources.schedule_intro,
+            Spacer(1, 0.3*cm),
+            earliest,
+            Spacer(1, 0.3*cm),
+            resources.schedule_notes
+        ]
 
-        # 설치비
-        product_count = sum(p.get('quantity', 1) for p in data.get('products', []))
-        installation_fee = (
-            self.installation_fee['base'] +
-            self.installation_fee['per_product'] * product_count +
-            regional_surcharge
+    def _create_footer(self, resources: QuoteResources, now: datetime) -> List:
+        """푸터"""
+        validity = (now + timedelta(days=QUOTE_VALIDITY_DAYS)).strftime('%Y년 %m월 %d일')
+        validity_para = Paragraph(
+            f"본 견적서는 {validity}까지 유효합니다.<br/>"
+            "견적 문의사항은 언제든지 연락 주시기 바랍니다.",
+            resources.styles['footer']
         )
 
-        # 총액
-        total = product_total + installation_fee
-
-        summary_data = [
-            ['제품 금액', f"{int(product_total):,}원"],
-            ['기본 설치비', f"{self.installation_fee['base']:,}원"],
-            ['제품별 설치비', f"{self.installation_fee['per_product'] * product_count:,}원"],
-            ['지역 할증', f"{regional_surcharge:,}원"],
-            ['', ''],
-            ['총 견적 금액', f"{int(total):,}원"]
+        return [
+            Spacer(1, 1*cm),
+            resources.footer_contact,
+            Spacer(1, 0.3*cm),
+            validity_para
         ]
 
-        table = Table(summary_data, colWidths=[12*cm, 5*cm])
-        table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-            ('FONTSIZE', (0, 0), (-1, -2), 10),
-            ('FONTSIZE', (0, -1), (-1, -1), 14),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -2), 0.5, colors.grey),
-            ('LINEABOVE', (0, -1), (-1, -1), 2, colors.HexColor('#2C3E50')),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ECF0F1')),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#E74C3C')),
-            ('FONTNAME', (0, -1), (-1, -1), self.font_name),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
 
-        elements.append(table)
-        return elements
+# ==================== PDF 워커 프로세스 ====================
 
-    def _create_installation_schedule(self, styles: Dict) -> List:
-        """설치 일정 안내"""
-        elements = []
+# 워커 프로세스별 견적서 생성기 (init_worker에서 생성)
+_worker_generator: Optional[QuoteGenerator] = None
 
-        heading = Paragraph("설치 가능 일정", styles['heading'])
-        elements.append(heading)
 
-        # 오늘 기준 가능한 날짜 (예: 2주 후부터)
-        today = datetime.now()
-        earliest_date = today + timedelta(days=14)
-
-        schedule_text = f"""
-        선결제(완불) 확인 후 제작에 들어가며, 제작 기간은 약 7-10일 소요됩니다.<br/>
-        <br/>
-        <b>최소 설치 가능일:</b> {earliest_date.strftime('%Y년 %m월 %d일')} 이후<br/>
-        <br/>
-        정확한 설치 일정은 결제 확인 후 개별 연락드립니다.<br/>
-        이사 예정이신 경우 이사 후 가구 배치가 끝난 다음 설치를 권장드립니다.
-        """
+def init_worker():
+    """PDF 풀 워커 초기화 (폰트 등록 / 스타일 / 고정 문단을 한 번만 생성)"""
+    global _worker_generator
+    _worker_generator = QuoteGenerator()
+    _worker_generator.resources
 
-        para = Paragraph(schedule_text, styles['body'])
-        elements.append(para)
 
-        return elements
+def render_quote_pdf(
+    consultation_data: Dict,
+    quote: Dict,
+    output_path: str,
+    issued_on: Optional[str] = None
+) -> str:
+    """워커 프로세스에서 견적서 파일 렌더링 (원자적 교체)"""
+    generator = _worker_generator or QuoteGenerator()
+    return generator.render_to_path(consultation_data, quote, output_path, issued_on)
 
-    def _create_footer(self, styles: Dict) -> List:
-        """푸터"""
-        elements = []
 
-        elements.append(Spacer(1, 1*cm))
-
-        footer_text = """
-        <b>PLAYCAT - 플레이캣</b><br/>
-        경기도 시흥시 연성로 156번길 39<br/>
-        Tel: 1522-5092 / 010-5676-8282<br/>
-        Email: thebloomkr@naver.com<br/>
-        Web: www.playcat.kr<br/>
-        Instagram: @playcat.kr<br/>
-        <br/>
-        본 견적서는 {validity}까지 유효합니다.<br/>
-        견적 문의사항은 언제든지 연락 주시기 바랍니다.
-        """.format(
-            validity=(datetime.now() + timedelta(days=30)).strftime('%Y년 %m월 %d일')
-        )
+def render_quote_file(
+    consultation_data: Dict,
+    quote: Dict,
+    output_path: str,
+    issued_on: Optional[str] = None
+) -> str:
+    """워커 프로세스에서 임시 파일로 렌더링 (캐시 등록은 호출 측에서)"""
+    generator = _worker_generator or QuoteGenerator()
+    generator.render(consultation_data, quote, output_path, issued_on)
+    return output_path
 
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['body'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#7F8C8D')
-        )
 
-        para = Paragraph(footer_text, footer_style)
-        elements.append(para)
+def render_quote_batch(jobs: List[tuple]) -> List[str]:
+    """
+    워커 프로세스에서 견적서 여러 장 렌더링 (일괄 재발행, IPC 왕복 절감)
 
-        return elements
+    jobs: [(consultation_data, quote, output_path, issued_on), ...]
+    """
+    return [render_quote_file(*job) for job in jobs]
 
 
-# 전역 인스턴스
+# 전역 인스턴스 (폰트/스타일은 첫 렌더링 시 지연 생성)
 quote_generator = QuoteGenerator()
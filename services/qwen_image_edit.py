@@ -1,36 +1,137 @@
-from transformers import Qwen2VLForConditionalGeneration, AutoProcessor
 from PIL import Image
-import torch
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
+import asyncio
+import hashlib
+import json
 import logging
+import uuid
+
+from services.disk_cache import file_sha256
+from services.image_normalizer import image_normalizer
+from services.qwen_model_manager import QwenModelManager, get_qwen_model_manager
 
 logger = logging.getLogger(__name__)
 
 
 class QwenImageEditor:
-    """Qwen2-VL을 사용한 이미지 편집 및 변환"""
+    """
+    Qwen2-VL을 사용한 이미지 편집 및 변환
+
+    모델은 QwenModelManager가 첫 추론 시 로드해 프로세스 안에서 공유하므로 생성 비용 없음
+
+    추론 결과는 사진 content hash + 작업 + 프롬프트 기준으로 캐시
+    (static/uploads/variants/<sha256>/analysis/<작업>-<프롬프트 해시>.json)
+    같은 사진으로 상담을 다시 돌려도 재추론하지 않음 (샘플링 생성은 제외)
+    """
+
+    # 분석용 입력 이미지 긴 변 (정규화된 미리보기 파생본 사용)
+    ANALYSIS_INPUT_EDGE = 1280
 
     def __init__(
         self,
-        model_name: str = "Qwen/Qwen2-VL-7B-Instruct",
-        device: str = "cuda" if torch.cuda.is_available() else "cpu"
+        model_manager: Optional[QwenModelManager] = None,
+        cache_dir: Optional[Path] = None
     ):
-        self.device = device
-        self.model_name = model_name
+        self.model_manager = model_manager or get_qwen_model_manager()
+        self.cache_dir = Path(cache_dir) if cache_dir else image_normalizer.variants_dir
+        # 같은 사진/작업의 동시 요청은 추론 태스크 하나를 공유
+        self._inflight: Dict[Path, asyncio.Task] = {}
+
+    def _cache_path(self, content_hash: str, task: str, prompt: str, generate_kwargs: Dict) -> Path:
+        """프롬프트/생성 인자가 바뀌면 키도 바뀌도록 함께 해시"""
+        signature = hashlib.sha256(
+            json.dumps([prompt, generate_kwargs], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        return self.cache_dir / content_hash / "analysis" / f"{task}-{signature}.json"
+
+    async def _infer(
+        self,
+        image_path: str,
+        task: str,
+        prompt: str,
+        min_edge: Optional[int] = None,
+        **generate_kwargs
+    ) -> str:
+        """
+        캐시 조회 후 없으면 모델 추론
 
-        logger.info(f"Loading Qwen2-VL model on {device}...")
+        추론은 호출과 분리된 태스크로 실행하고 각 호출은 shield로 기다림
+        (한 호출이 취소돼도 같은 사진을 기다리는 다른 호출은 영향 없음)
+        샘플링(do_sample) 생성은 호출마다 결과가 달라야 하므로 캐시/공유하지 않음
 
-        # 모델 로드
-        self.model = Qwen2VLForConditionalGeneration.from_pretrained(
-            model_name,
-            torch_dtype=torch.float16 if device == "cuda" else torch.float32,
-            device_map="auto"
-        )
+        Args:
+            image_path: 원본 이미지 경로 (업로드 파일은 파일명이 content hash)
+            task: 작업 이름 (캐시 파일명)
+            prompt: 프롬프트
+            min_edge: 입력으로 쓸 파생본 최소 긴 변 (None이면 가장 큰 작업용 사본)
+            generate_kwargs: model.generate() 인자
 
-        self.processor = AutoProcessor.from_pretrained(model_name)
+        Returns:
+            생성 텍스트
+        """
+        if generate_kwargs.get("do_sample"):
+            image = Image.open(image_normalizer.pick_variant_path(image_path, min_edge))
+            return await self.model_manager.generate(prompt, image, **generate_kwargs)
+
+        content_hash = await asyncio.to_thread(file_sha256, image_path)
+        cache_path = self._cache_path(content_hash, task, prompt, generate_kwargs)
+
+        inference = self._inflight.get(cache_path)
+        if inference is None:
+            inference = asyncio.create_task(
+                self._infer_cached(cache_path, image_path, task, prompt, min_edge, generate_kwargs)
+            )
+            self._inflight[cache_path] = inference
+            inference.add_done_callback(lambda done: self._finish_inference(cache_path, done))
 
-        logger.info("Qwen2-VL model loaded successfully")
+        return await asyncio.shield(inference)
+
+    def _finish_inference(self, cache_path: Path, inference: asyncio.Task):
+        if self._inflight.get(cache_path) is inference:
+            del self._inflight[cache_path]
+        # 기다리던 호출이 모두 취소됐어도 "exception was never retrieved" 경고 방지
+        if not inference.cancelled():
+            inference.exception()
+
+    async def _infer_cached(
+        self,
+        cache_path: Path,
+        image_path: str,
+        task: str,
+        prompt: str,
+        min_edge: Optional[int],
+        generate_kwargs: Dict
+    ) -> str:
+        """캐시 파일이 있으면 읽고, 없으면 추론 후 기록"""
+        cached = await asyncio.to_thread(self._read_cache, cache_path)
+        if cached is not None:
+            return cached
+
+        image = Image.open(image_normalizer.pick_variant_path(image_path, min_edge))
+        response = await self.model_manager.generate(prompt, image, **generate_kwargs)
+        await asyncio.to_thread(self._write_cache, cache_path, task, response)
+        return response
+
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[str]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cache(self, path: Path, task: str, response: str):
+        """원자적 기록 (임시 파일 → 이동)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"task": task, "model": self.model_manager.model_name, "response": response},
+                f,
+                ensure_ascii=False
+            )
+        tmp_path.replace(path)
 
     async def analyze_image_quality(self, image_path: str) -> Dict:
         """
@@ -48,8 +149,6 @@ class QwenImageEditor:
                 "recommendation": "convert_to_front_view"
             }
         """
-        image = Image.open(image_path)
-
         prompt = """Analyze this room photo and provide:
 1. Is it a front-facing view? (yes/no)
 2. Image quality score (0-100)
@@ -59,22 +158,13 @@ class QwenImageEditor:
 
 Respond in JSON format."""
 
-        inputs = self.processor(
-            text=[prompt],
-            images=[image],
-            return_tensors="pt"
-        ).to(self.device)
-
-        with torch.no_grad():
-            output_ids = self.model.generate(
-                **inputs,
-                max_new_tokens=256
-            )
-
-        response = self.processor.batch_decode(
-            output_ids,
-            skip_special_tokens=True
-        )[0]
+        response = await self._infer(
+            image_path,
+            "quality",
+            prompt,
+            min_edge=self.ANALYSIS_INPUT_EDGE,
+            max_new_tokens=256
+        )
 
         # JSON 파싱 시도
         try:
@@ -107,42 +197,13 @@ Respond in JSON format."""
         Returns:
             변환된 이미지 경로
         """
-        image = Image.open(image_path)
-
-        prompt = """Convert this room photo to a perfect front-facing view.
-Requirements:
-- Straighten the perspective
-- Make walls parallel and vertical
-- Keep all furniture and features in their positions
-- Maintain realistic proportions
-- Professional architectural photography style
-- High quality, sharp details
-
-Generate a corrected front-facing view of this room."""
-
-        inputs = self.processor(
-            text=[prompt],
-            images=[image],
-            return_tensors="pt"
-        ).to(self.device)
-
-        with torch.no_grad():
-            # 이미지 생성
-            output_ids = self.model.generate(
-                **inputs,
-                max_new_tokens=1024,
-                do_sample=True,
-                temperature=0.7
-            )
+        image = Image.open(image_normalizer.pick_variant_path(image_path))
 
-        # 결과 디코딩
-        # 참고: Qwen2-VL의 이미지 생성 기능은 제한적일 수 있음
-        # 실제로는 ControlNet + Stable Diffusion이 더 효과적
-
-        # 임시 구현: 원본 이미지 반환
-        # TODO: ComfyUI의 ControlNet 워크플로우 사용
+        # Qwen2-VL은 이미지를 생성하지 못하고 텍스트만 돌려주므로 (1024토큰 샘플링 생성)
+        # 결과를 쓰지 않는 동안에는 추론을 호출하지 않음
+        # TODO: ComfyUI의 ControlNet 워크플로우 사용 (그 전까지는 원본 반환)
         logger.warning(
-            "Front view conversion via Qwen2-VL is experimental. "
+            "Front view conversion is not implemented yet, returning the original photo. "
             "Consider using ControlNet for better results."
         )
 
@@ -173,7 +234,7 @@ Generate a corrected front-facing view of this room."""
         Returns:
             개선된 이미지 경로
         """
-        image = Image.open(image_path)
+        image = Image.open(image_normalizer.pick_variant_path(image_path))
 
         prompts = {
             "lighting": "Enhance the lighting of this room photo. Make it brighter and more evenly lit, while maintaining natural appearance.",
@@ -183,17 +244,7 @@ Generate a corrected front-facing view of this room."""
 
         prompt = prompts.get(enhancement_type, prompts["lighting"])
 
-        inputs = self.processor(
-            text=[prompt],
-            images=[image],
-            return_tensors="pt"
-        ).to(self.device)
-
-        with torch.no_grad():
-            output_ids = self.model.generate(
-                **inputs,
-                max_new_tokens=512
-            )
+        await self._infer(image_path, "enhance", prompt, max_new_tokens=512)
 
         if not output_path:
             output_dir = Path("static/processed")
@@ -215,8 +266,6 @@ Generate a corrected front-facing view of this room."""
         Returns:
             텍스트 설명
         """
-        image = Image.open(image_path)
-
         prompt = """Describe this room in detail:
 - Room type (living room, bedroom, etc.)
 - Wall color and material
@@ -229,24 +278,13 @@ Generate a corrected front-facing view of this room."""
 
 Provide a detailed description."""
 
-        inputs = self.processor(
-            text=[prompt],
-            images=[image],
-            return_tensors="pt"
-        ).to(self.device)
-
-        with torch.no_grad():
-            output_ids = self.model.generate(
-                **inputs,
-                max_new_tokens=512
-            )
-
-        description = self.processor.batch_decode(
-            output_ids,
-            skip_special_tokens=True
-        )[0]
-
-        return description
+        return await self._infer(
+            image_path,
+            "describe",
+            prompt,
+            min_edge=self.ANALYSIS_INPUT_EDGE,
+            max_new_tokens=512
+        )
 
 
 # 전역 인스턴스 (필요시 사용)
@@ -0,0 +1,423 @@
+"""
+Qwen2-VL 모델 관리자
+사진 분석용 Qwen2-VL 모델을 프로세스당 하나만 첫 사용 시 로드하고, 오래 쓰지 않으면 언로드
+
+- GPU: QWEN_MODEL_NAME (기본 7B) float16
+- CPU: QWEN_CPU_MODEL_NAME (기본 2B) bfloat16 또는 int8 (Linear 동적 양자화)
+- 로드/추론은 스레드에서 실행 (이벤트 루프를 막지 않음)
+- 동시 요청은 batch_wait_ms 동안 모아 한 번의 generate()로 처리 (마이크로 배치)
+- 입력 이미지는 모델 기본 해상도(max_pixels, 28px 격자)로 축소 후 처리
+- 로드 시간, 모델/프로세스 메모리를 metrics()로 노출
+
+torch/transformers는 로드 시점에만 import하므로 웹 서버 시작과 무관
+"""
+import asyncio
+import gc
+import logging
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+CPU_DTYPES = ("bfloat16", "int8", "float32")
+
+# Qwen2-VL 비전 인코더 단위 (14px 패치 x 2x2 병합)
+IMAGE_FACTOR = 28
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """현재 프로세스 RSS (리눅스 /proc 기준, 그 외 플랫폼은 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class QwenModelManager:
+    """
+    Qwen2-VL 모델 지연 로드 + 공유 + 유휴 언로드
+
+    - generate(): 필요하면 모델을 로드한 뒤 프롬프트+이미지로 텍스트 생성
+    - 동시 요청이 와도 로드는 한 번만 (asyncio.Lock)
+    - 사용 중이 아닐 때 idle_timeout초가 지나면 언로드 (0이면 유지)
+    - 같은 생성 인자의 요청은 최대 batch_size개까지 한 배치로 묶음
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cpu_model_name: str,
+        device: str = "auto",
+        cpu_dtype: str = "bfloat16",
+        idle_timeout: float = 900,
+        max_pixels: int = 1280 * IMAGE_FACTOR * IMAGE_FACTOR,
+        batch_size: int = 4,
+        batch_wait_ms: float = 50
+    ):
+        if cpu_dtype not in CPU_DTYPES:
+            raise ValueError(f"QWEN_CPU_DTYPE must be one of {CPU_DTYPES}: {cpu_dtype}")
+
+        self.gpu_model_name = model_name
+        self.cpu_model_name = cpu_model_name
+        self.requested_device = device
+        self.cpu_dtype = cpu_dtype
+        self.idle_timeout = idle_timeout
+        self.max_pixels = max_pixels
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait_ms / 1000
+
+        self.model = None
+        self.processor = None
+        self.device: Optional[str] = None
+        self.model_name: Optional[str] = None
+        self.dtype: Optional[str] = None
+
+        self._lock: Optional[asyncio.Lock] = None
+        self._idle_task: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._in_use = 0
+        self._last_used = 0.0
+
+        # 메트릭
+        self.loads = 0
+        self.unloads = 0
+        self.load_seconds: Optional[float] = None
+        self.model_bytes: Optional[int] = None
+        self.generations = 0
+        self.batches = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """로드/언로드 잠금 지연 생성 (이벤트 루프 안에서)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    # ==================== 로드 / 언로드 ====================
+
+    async def ensure_loaded(self):
+        """모델이 없으면 로드 (동시 호출 시 한 번만)"""
+        if self.loaded:
+            return
+        async with self.lock:
+            if self.loaded:
+                return
+            await asyncio.to_thread(self._load)
+            self._last_used = time.monotonic()
+            if self.idle_timeout > 0 and self._idle_task is None:
+                self._idle_task = asyncio.create_task(self._watch_idle())
+
+    def _load(self):
+        """모델/프로세서 로드 (스레드에서 실행)"""
+        import torch
+        from transformers import AutoProcessor, Qwen2VLForConditionalGeneration
+
+        device = self.requested_device
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        if device == "cuda":
+            model_name, dtype = self.gpu_model_name, "float16"
+        else:
+            model_name, dtype = self.cpu_model_name, self.cpu_dtype
+
+        logger.info(f"Loading {model_name} on {device} ({dtype})...")
+        started = time.perf_counter()
+
+        if device == "cuda":
+            model = Qwen2VLForConditionalGeneration.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16,
+                device_map="auto"
+            )
+        else:
+            # int8은 float32로 읽은 뒤 Linear 가중치만 동적 양자화
+            model = Qwen2VLForConditionalGeneration.from_pretrained(
+                model_name,
+                torch_dtype=torch.bfloat16 if dtype == "bfloat16" else torch.float32,
+                low_cpu_mem_usage=True
+            )
+            if dtype == "int8":
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+        model.eval()
+
+        processor = AutoProcessor.from_pretrained(model_name)
+        # 배치 생성 시 프롬프트 끝이 맞도록 왼쪽 패딩
+        processor.tokenizer.padding_side = "left"
+
+        self.processor = processor
+        self.model = model
+        self.device = device
+        self.model_name = model_name
+        self.dtype = dtype
+        self.load_seconds = round(time.perf_counter() - started, 2)
+        self.model_bytes = self._measure_model_bytes(model)
+        self.loads += 1
+
+        logger.info(
+            f"Loaded {model_name} in {self.load_seconds}s "
+            f"({(self.model_bytes or 0) / 1024 ** 3:.1f} GB)"
+        )
+
+    @staticmethod
+    def _measure_model_bytes(model) -> Optional[int]:
+        """
+        파라미터 + 버퍼 크기 (state_dict 기준)
+
+        동적 양자화 Linear의 가중치는 state_dict에 (int8 weight, bias) 튜플
+        (_packed_params)로 들어 있으므로 풀어서 합산 (bias는 None일 수 있음)
+        """
+        try:
+            total = 0
+            for value in model.state_dict().values():
+                tensors = value if isinstance(value, (tuple, list)) else (value,)
+                for tensor in tensors:
+                    if hasattr(tensor, "element_size"):
+                        total += tensor.numel() * tensor.element_size()
+            return total
+        except Exception:
+            return None
+
+    async def unload(self):
+        """모델 해제 (사용 중이면 건너뜀)"""
+        async with self.lock:
+            if not self.loaded or self._in_use:
+                return
+            await asyncio.to_thread(self._unload)
+
+    def _unload(self):
+        device = self.device
+        self.model = None
+        self.processor = None
+        gc.collect()
+        if device == "cuda":
+            import torch
+            torch.cuda.empty_cache()
+        self.unloads += 1
+        logger.info(f"Unloaded {self.model_name}")
+
+    async def _watch_idle(self):
+        """유휴 시간이 지나면 언로드하는 루프"""
+        interval = max(1.0, min(60.0, self.idle_timeout / 4))
+        try:
+            while self.loaded:
+                await asyncio.sleep(interval)
+                if not self._in_use and time.monotonic() - self._last_used >= self.idle_timeout:
+                    await self.unload()
+        finally:
+            self._idle_task = None
+
+    async def close(self):
+        """배치 처리/유휴 감시 중지 후 언로드 (lifespan 종료 시)"""
+        for task in (self._batch_task, self._idle_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        # 대기 중이던 요청은 실패 처리
+        while self._queue is not None and not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Qwen model manager closed"))
+
+        await self.unload()
+
+    # ==================== 추론 ====================
+
+    async def generate(self, prompt: str, image, **generate_kwargs) -> str:
+        """
+        프롬프트 + 이미지 → 생성 텍스트 (배치 큐를 거쳐 처리)
+
+        Args:
+            prompt: 텍스트 프롬프트
+            image: PIL 이미지 (모델 해상도로 축소는 추론 스레드에서)
+            generate_kwargs: model.generate() 인자 (max_new_tokens 등)
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._run_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_use += 1
+        try:
+            await self._queue.put((prompt, image, generate_kwargs, future))
+            return await future
+        finally:
+            self._in_use -= 1
+            self._last_used = time.monotonic()
+
+    async def _run_batches(self):
+        """큐에서 요청을 모아 배치 단위로 추론"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # 생성 인자가 같은 요청끼리만 한 번의 generate()로 묶을 수 있음
+            groups: Dict[Tuple, List] = {}
+            for item in batch:
+                key = tuple(sorted(item[2].items()))
+                groups.setdefault(key, []).append(item)
+
+            for items in groups.values():
+                await self._run_batch(items)
+
+    async def _run_batch(self, items: List):
+        """한 배치 추론 후 각 요청의 future에 결과 전달"""
+        items = [item for item in items if not item[3].cancelled()]
+        if not items:
+            return
+
+        try:
+            await self.ensure_loaded()
+            outputs = await asyncio.to_thread(
+                self._generate_batch,
+                [prompt for prompt, *_ in items],
+                [image for _, image, *_ in items],
+                items[0][2]
+            )
+        except asyncio.CancelledError:
+            for *_, future in items:
+                future.cancel()
+            raise
+        except Exception as e:
+            for *_, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), output in zip(items, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    def fit_image(self, image):
+        """
+        모델 기본 해상도로 축소
+
+        픽셀 수가 max_pixels 이하가 되도록 비율을 유지해 줄이고 28px 격자에 맞춤
+        (프로세서가 어차피 이 크기로 줄이므로 원본 해상도로 넘기는 건 낭비)
+        """
+        image = image.convert("RGB")
+        width, height = image.size
+        if width * height <= self.max_pixels:
+            return image
+
+        scale = math.sqrt(self.max_pixels / (width * height))
+        size = (
+            max(IMAGE_FACTOR, int(width * scale) // IMAGE_FACTOR * IMAGE_FACTOR),
+            max(IMAGE_FACTOR, int(height * scale) // IMAGE_FACTOR * IMAGE_FACTOR)
+        )
+        from PIL import Image
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    def _generate_batch(self, prompts: List[str], images: List, generate_kwargs: Dict[str, Any]) -> List[str]:
+        """배치 추론 (스레드에서 실행)"""
+        import torch
+
+        texts = [
+            self.processor.apply_chat_template(
+                [{"role": "user", "content": [{"type": "image"}, {"type": "text", "text": prompt}]}],
+                tokenize=False,
+                add_generation_prompt=True
+            )
+            for prompt in prompts
+        ]
+        inputs = self.processor(
+            text=texts,
+            images=[self.fit_image(image) for image in images],
+            padding=True,
+            return_tensors="pt"
+        ).to(self.device)
+
+        with torch.no_grad():
+            output_ids = self.model.generate(**inputs, **generate_kwargs)
+
+        # 프롬프트 부분을 잘라 생성된 토큰만 디코딩
+        generated = output_ids[:, inputs["input_ids"].shape[1]:]
+
+        self.generations += len(prompts)
+        self.batches += 1
+        return self.processor.batch_decode(generated, skip_special_tokens=True)
+
+    # ==================== 메트릭 ====================
+
+    def metrics(self) -> Dict[str, Any]:
+        """로드 상태 / 로드 시간 / 메모리 (torch가 로드되지 않았으면 import하지 않음)"""
+        gpu_allocated = None
+        if self.loaded and self.device == "cuda":
+            import torch
+            gpu_allocated = torch.cuda.memory_allocated()
+
+        return {
+            "loaded": self.loaded,
+            "model_name": self.model_name or (
+                self.cpu_model_name if self.requested_device == "cpu" else self.gpu_model_name
+            ),
+            "device": self.device or self.requested_device,
+            "dtype": self.dtype,
+            "load_seconds": self.load_seconds,
+            "model_bytes": self.model_bytes if self.loaded else None,
+            "gpu_allocated_bytes": gpu_allocated,
+            "process_rss_bytes": _process_rss_bytes(),
+            "in_use": self._in_use,
+            "idle_seconds": round(time.monotonic() - self._last_used, 1) if self.loaded else None,
+            "idle_timeout": self.idle_timeout,
+            "loads": self.loads,
+            "unloads": self.unloads,
+            "generations": self.generations,
+            "batches": self.batches,
+            "avg_batch_size": round(self.generations / self.batches, 2) if self.batches else None,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_pixels": self.max_pixels
+        }
+
+
+# 싱글톤 인스턴스
+_qwen_model_manager: Optional[QwenModelManager] = None
+
+
+def get_qwen_model_manager() -> QwenModelManager:
+    """QwenModelManager 싱글톤 인스턴스 반환"""
+    global _qwen_model_manager
+    if _qwen_model_manager is None:
+        settings = get_settings()
+        _qwen_model_manager = QwenModelManager(
+            model_name=settings.QWEN_MODEL_NAME,
+            cpu_model_name=settings.QWEN_CPU_MODEL_NAME,
+            device=settings.QWEN_DEVICE,
+            cpu_dtype=settings.QWEN_CPU_DTYPE,
+            idle_timeout=settings.QWEN_IDLE_UNLOAD_SECONDS,
+            max_pixels=settings.QWEN_MAX_PIXELS,
+            batch_size=settings.QWEN_BATCH_SIZE,
+            batch_wait_ms=settings.QWEN_BATCH_WAIT_MS
+        )
+    return _qwen_model_manager
+
+
+async def shutdown_qwen_model_manager():
+    """모델이 만들어졌으면 해제 (lifespan 종료 시)"""
+    if _qwen_model_manager is not None:
+        await _qwen_model_manager.close()
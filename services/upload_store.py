@@ -0,0 +1,109 @@
+"""
+업로드 저장 서비스
+청크 단위 스트리밍 저장 + 크기 제한 + SHA-256 기반 중복 제거
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable
+
+import aiofiles
+from fastapi import UploadFile
+
+
+class UploadError(Exception):
+    """업로드 처리 에러"""
+    status_code = 400
+
+
+class UnsupportedUploadError(UploadError):
+    """허용되지 않은 파일 형식"""
+    status_code = 400
+
+
+class UploadTooLargeError(UploadError):
+    """업로드 크기 제한 초과"""
+    status_code = 413
+
+
+async def save_upload(
+    file: UploadFile,
+    upload_dir: Path,
+    max_size: int,
+    allowed_extensions: Iterable[str],
+    chunk_size: int = 64 * 1024
+) -> Dict:
+    """
+    업로드 파일을 청크 단위로 임시 파일에 쓰고 원자적으로 이동
+
+    - 메모리 사용량은 청크 크기로 고정
+    - max_size를 넘는 순간 중단하고 임시 파일 삭제
+    - 쓰는 동안 SHA-256 계산, 해시를 파일명으로 사용 (같은 사진은 한 번만 저장)
+
+    Args:
+        file: FastAPI UploadFile
+        upload_dir: 최종 저장 디렉토리
+        max_size: 최대 바이트 수
+        allowed_extensions: 허용 확장자 (".jpg" 등)
+        chunk_size: 읽기/쓰기 청크 크기
+
+    Returns:
+        {"filename", "path", "url", "size", "sha256", "deduplicated"}
+
+    Raises:
+        UnsupportedUploadError: 허용되지 않은 확장자
+        UploadTooLargeError: 크기 제한 초과
+    """
+    file_extension = Path(file.filename or "").suffix.lower()
+    if file_extension not in allowed_extensions:
+        raise UnsupportedUploadError(
+            f"Unsupported file type. Allowed: {sorted(allowed_extensions)}"
+        )
+
+    # 같은 파일시스템에 임시 파일을 둬야 os.replace가 원자적
+    tmp_dir = upload_dir / ".tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = tmp_dir / f"{uuid.uuid4().hex}.part"
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(
+                        f"File too large. Maximum size is {max_size // (1024 * 1024)}MB"
+                    )
+
+                hasher.update(chunk)
+                await out.write(chunk)
+
+        content_hash = hasher.hexdigest()
+        filename = f"{content_hash}{file_extension}"
+        final_path = upload_dir / filename
+
+        deduplicated = final_path.exists()
+        if deduplicated:
+            tmp_path.unlink()
+        else:
+            os.replace(tmp_path, final_path)
+
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return {
+        "filename": filename,
+        "path": str(final_path),
+        "url": "/" + final_path.as_posix(),
+        "size": size,
+        "sha256": content_hash,
+        "deduplicated": deduplicated
+    }
@@ -2,7 +2,7 @@
 Utilities module for Playcat Chatbot
 Logging, error handling, and helper functions
 """
-from .logger import setup_logger, get_logger
+from .logger import setup_logger, get_logger, log_sampled
 from .error_handler import handle_api_error
 
-__all__ = ["setup_logger", "get_logger", "handle_api_error"]
+__all__ = ["setup_logger", "get_logger", "log_sampled", "handle_api_error"]
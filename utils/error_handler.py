@@ -6,17 +6,25 @@ from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from typing import Union
 import traceback
-from .logger import get_logger
+from .logger import get_logger, request_id_var
 
 logger = get_logger(__name__)
 
 
+def _request_id(request: Request) -> str:
+    """요청 ID (미들웨어가 request.state에 남긴 값, 없으면 contextvar)"""
+    return getattr(request.state, "request_id", None) or request_id_var.get()
+
+
 async def handle_api_error(request: Request, exc: Exception) -> JSONResponse:
     """
     전역 API 에러 핸들러
     
-    모든 예외를 잡아서 일관된 형식으로 응답
+    모든 예외를 잡아서 일관된 형식으로 응답 (로그와 X-Request-ID 헤더에 요청 ID 포함)
     """
+    request_id = _request_id(request)
+    headers = {"X-Request-ID": request_id} if request_id != "-" else None
+
     # HTTPException은 FastAPI가 기본 처리
     if isinstance(exc, HTTPException):
         return JSONResponse(
@@ -25,13 +33,15 @@ async def handle_api_error(request: Request, exc: Exception) -> JSONResponse:
                 "error": True,
                 "message": exc.detail,
                 "status_code": exc.status_code
-            }
+            },
+            headers=headers
         )
     
     # 일반 예외 처리
     logger.error(
         f"Unhandled exception on {request.method} {request.url.path}",
-        exc_info=True
+        exc_info=True,
+        extra={"request_id": request_id}
     )
     
     # 디버그 모드에서는 상세 트레이스백 제공
@@ -50,7 +60,8 @@ async def handle_api_error(request: Request, exc: Exception) -> JSONResponse:
     
     return JSONResponse(
         status_code=500,
-        content=error_detail
+        content=error_detail,
+        headers=headers
     )
 
 
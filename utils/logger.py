@@ -1,16 +1,199 @@
 """
 Centralized Logging System
 구조화된 로깅 유틸리티
+
+- 요청 경로에서는 QueueHandler로 큐에 넣기만 하고, 콘솔/파일 쓰기는
+  QueueListener 전용 스레드가 처리 (디스크 I/O가 응답 지연에 섞이지 않음)
+- JSON Lines 출력 + 요청 ID (미들웨어가 contextvar에 설정)
+- 파일은 크기 기준 회전 (RotatingFileHandler)
+- 반복되는 같은 에러/경고는 log_sampled()로 키별 간격 샘플링 (작업별 이벤트 로그에는 사용하지 않음)
 """
+import copy
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from datetime import datetime
+from typing import Dict, Optional, Tuple
+
 from config.settings import get_settings
 
-# 로그 디렉토리 생성
+# 로그 디렉토리
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
+
+# 현재 요청 ID (요청 밖에서는 "-")
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# LogRecord 기본 속성 (나머지는 extra로 넘어온 필드)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+_TRACEBACK_FORMATTER = logging.Formatter()
+_setup_lock = threading.Lock()
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    로그를 남긴 시점의 요청 ID를 레코드에 기록
+
+    contextvar는 호출한 쪽 컨텍스트에서만 보이므로 큐에 넣기 전(QueueHandler)에 적용
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷 (extra 필드, 트레이스백은 exc_info 필드로 분리)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 버림 (로그 때문에 요청이 막히지 않도록)
+
+    버린 개수는 dropped에 누적하고 다음 레코드에 함께 기록
+
+    기본 prepare()는 트레이스백을 message에 합치고 exc_info를 지우므로,
+    message는 본문만 두고 트레이스백은 exc_text로 따로 넘김
+    (exc_info의 traceback 객체는 다른 스레드로 넘기지 않음)
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        if self.dropped:
+            record.dropped_logs, self.dropped = self.dropped, 0
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _build_formatter(settings) -> logging.Formatter:
+    if settings.LOG_JSON:
+        return JsonFormatter()
+    return logging.Formatter(
+        settings.LOG_FORMAT.replace("%(name)s", "%(name)s [%(request_id)s]"),
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _rotating_handler(filename: str, level: int, formatter: logging.Formatter, settings) -> RotatingFileHandler:
+    handler = RotatingFileHandler(
+        LOG_DIR / filename,
+        maxBytes=settings.LOG_FILE_MAX_BYTES,
+        backupCount=settings.LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True
+    )
+    handler.setLevel(level)
+    handler.setFormatter(formatter)
+    return handler
+
+
+def setup_logging(level: str = None, log_file: str = None) -> QueueListener:
+    """
+    루트 로거에 QueueHandler 연결 + QueueListener 시작 (한 번만)
+
+    모든 모듈 로거(logging.getLogger(__name__))는 루트로 전파되므로 같은 경로를 탐
+
+    Args:
+        level: 로그 레벨 (None이면 설정에서 가져옴)
+        log_file: 전체 로그 파일명 (None이면 playcat.log, 프로덕션에서만 기록)
+
+    Returns:
+        실행 중인 QueueListener
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+
+        settings = get_settings()
+        LOG_DIR.mkdir(exist_ok=True)
+        formatter = _build_formatter(settings)
+
+        # 콘솔 핸들러
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
+
+        # 파일 핸들러 (프로덕션 환경, 파일은 항상 JSON)
+        file_formatter = JsonFormatter()
+        if settings.ENV == "production":
+            handlers.append(
+                _rotating_handler(log_file or "playcat.log", logging.DEBUG, file_formatter, settings)
+            )
+
+        # 에러 전용 파일 핸들러
+        handlers.append(_rotating_handler("error.log", logging.ERROR, file_formatter, settings))
+
+        log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.addFilter(RequestIdFilter())
+
+        root = logging.getLogger()
+        root.setLevel(getattr(logging, (level or settings.LOG_LEVEL).upper()))
+        root.addHandler(queue_handler)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 쓰고 writer 스레드 종료 (lifespan 종료 시)"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            for handler in logging.getLogger().handlers[:]:
+                if isinstance(handler, QueueHandler):
+                    logging.getLogger().removeHandler(handler)
 
 
 def setup_logger(
@@ -20,81 +203,80 @@ def setup_logger(
 ) -> logging.Logger:
     """
     로거 설정 및 생성
-    
+
     Args:
         name: 로거 이름
-        log_file: 로그 파일 경로 (None이면 날짜 기반 자동 생성)
+        log_file: 전체 로그 파일명 (첫 설정 시에만 적용)
         level: 로그 레벨 (None이면 설정에서 가져옴)
-    
+
     Returns:
-        설정된 Logger 인스턴스
+        루트 큐 핸들러로 전파되는 Logger 인스턴스
     """
-    settings = get_settings()
-    
-    # 로거 생성
-    logger = logging.getLogger(name)
-    
-    # 이미 핸들러가 있으면 재사용
-    if logger.handlers:
-        return logger
-    
-    # 로그 레벨 설정
-    log_level = level or settings.LOG_LEVEL
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # 포맷터 생성
-    formatter = logging.Formatter(
-        settings.LOG_FORMAT,
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # 파일 핸들러 (프로덕션 환경)
-    if settings.ENV == "production":
-        if log_file is None:
-            log_file = f"playcat_{datetime.now().strftime('%Y%m%d')}.log"
-        
-        file_handler = logging.FileHandler(
-            LOG_DIR / log_file,
-            encoding="utf-8"
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    # 에러 전용 파일 핸들러
-    error_file_handler = logging.FileHandler(
-        LOG_DIR / f"error_{datetime.now().strftime('%Y%m%d')}.log",
-        encoding="utf-8"
-    )
-    error_file_handler.setLevel(logging.ERROR)
-    error_file_handler.setFormatter(formatter)
-    logger.addHandler(error_file_handler)
-    
-    return logger
+    setup_logging(level=level, log_file=log_file)
+    return logging.getLogger(name)
 
 
 def get_logger(name: str = None) -> logging.Logger:
     """
     기존 로거 가져오기 또는 새로 생성
-    
+
     Args:
-        name: 로거 이름 (None이면 루트 로거)
-    
+        name: 로거 이름 (None이면 playcat_chatbot)
+
     Returns:
         Logger 인스턴스
     """
-    if name is None:
-        name = "playcat_chatbot"
-    
-    logger = logging.getLogger(name)
-    
-    if not logger.handlers:
-        return setup_logger(name)
-    
-    return logger
+    return setup_logger(name or "playcat_chatbot")
+
+
+# ==================== 샘플링 ====================
+
+# (로거명, 키) → (마지막 기록 시각, 그 뒤로 생략된 횟수)
+_sample_state: Dict[Tuple[str, str], Tuple[float, int]] = {}
+_sample_lock = threading.Lock()
+
+
+def log_sampled(
+    logger: logging.Logger,
+    level: int,
+    key: str,
+    msg: str,
+    *args,
+    interval: float = None,
+    **kwargs
+) -> bool:
+    """
+    같은 키의 로그는 interval초에 한 번만 기록 (생략된 횟수는 다음 기록에 포함)
+
+    장애 중 요청마다 반복되는 경고가 로그를 덮지 않도록 사용
+
+    Args:
+        logger: 대상 로거
+        level: logging.INFO 등
+        key: 샘플링 단위 (호출 위치별 고정 문자열)
+        msg, args, kwargs: logger.log()에 그대로 전달
+        interval: 최소 간격 (None이면 LOG_SAMPLE_INTERVAL_SECONDS)
+
+    Returns:
+        실제로 기록했으면 True
+    """
+    if not logger.isEnabledFor(level):
+        return False
+
+    if interval is None:
+        interval = get_settings().LOG_SAMPLE_INTERVAL_SECONDS
+
+    now = time.monotonic()
+    state_key = (logger.name, key)
+    with _sample_lock:
+        last, suppressed = _sample_state.get(state_key, (None, 0))
+        if last is not None and now - last < interval:
+            _sample_state[state_key] = (last, suppressed + 1)
+            return False
+        _sample_state[state_key] = (now, 0)
+
+    if suppressed:
+        extra = dict(kwargs.pop("extra", None) or {}, suppressed=suppressed)
+        kwargs["extra"] = extra
+    logger.log(level, msg, *args, stacklevel=2, **kwargs)
+    return True
@@ -0,0 +1,263 @@
+"""
+Static Asset Utilities
+정적 파일 캐시 헤더, content hash URL, 사전 압축(gzip/brotli) 처리
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip만 사용)
+    brotli = None
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+STATIC_DIR = Path("static")
+
+# 사전 압축 대상 (텍스트 자산)
+COMPRESSIBLE_EXTENSIONS = {".html", ".js", ".css", ".svg", ".json"}
+
+# 런타임 생성 파일 디렉토리 (사전 압축 제외)
+GENERATED_DIRS = {"uploads", "composites", "quotes", "processed"}
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# 상대 경로 → (mtime_ns, 버전 해시)
+_version_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def asset_version(relative_path: str) -> Optional[str]:
+    """
+    정적 파일 content hash (앞 12자리)
+
+    mtime이 바뀌지 않으면 다시 계산하지 않음
+    """
+    path = STATIC_DIR / relative_path
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _version_cache.get(relative_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    version = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+    _version_cache[relative_path] = (mtime_ns, version)
+    return version
+
+
+def asset_url(relative_path: str) -> str:
+    """content hash가 붙은 정적 파일 URL (/static/js/chat.js?v=...)"""
+    version = asset_version(relative_path)
+    url = f"/static/{relative_path}"
+    return f"{url}?v={version}" if version else url
+
+
+_STATIC_REF_PATTERN = re.compile(r'((?:href|src)=")/static/([^"?#]+)(")')
+
+
+def fingerprint_html(html: str) -> str:
+    """HTML 안의 /static/... 참조를 content hash URL로 교체"""
+    return _STATIC_REF_PATTERN.sub(
+        lambda m: f"{m.group(1)}{asset_url(m.group(2))}{m.group(3)}",
+        html
+    )
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """본문의 사전 압축 본 (encoding → bytes)"""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def choose_encoding(accept_encoding: str, available) -> Optional[str]:
+    """Accept-Encoding 기준 사용할 압축 방식 (br 우선)"""
+    accepted = {
+        part.split(";")[0].strip().lower()
+        for part in (accept_encoding or "").split(",")
+        if not part.strip().endswith("q=0")
+    }
+    for encoding in ("br", "gzip"):
+        if encoding in accepted and encoding in available:
+            return encoding
+    return None
+
+
+class RenderedPage:
+    """
+    시작 시 한 번 렌더링한 HTML 페이지
+
+    정적 자산 참조를 content hash URL로 바꾸고 압축본을 미리 만들어 둠
+    """
+
+    def __init__(self, path: Path):
+        html = fingerprint_html(path.read_text(encoding="utf-8"))
+        self.body = html.encode("utf-8")
+        self.variants = compress_variants(self.body)
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    def response(self, request_headers: Headers) -> Response:
+        """요청 헤더에 맞는 응답 (304 / 압축본 / 원본)"""
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": REVALIDATE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding"
+        }
+
+        if request_headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""), self.variants)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            return Response(self.variants[encoding], media_type="text/html", headers=headers)
+
+        return Response(self.body, media_type="text/html", headers=headers)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    캐시 친화적인 StaticFiles
+
+    - ?v=<content hash>가 현재 파일 해시와 일치하면 immutable 1년 캐시
+    - 그 외에는 no-cache (ETag/Last-Modified로 재검증)
+    - .br / .gz 사전 압축본이 있으면 Accept-Encoding에 맞춰 대신 전송
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = Path(full_path)
+
+        response = None
+        if full_path.suffix in COMPRESSIBLE_EXTENSIONS:
+            response = self._precompressed_response(
+                full_path, stat_result, request_headers, status_code
+            )
+
+        if response is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+
+        if full_path.suffix in COMPRESSIBLE_EXTENSIONS:
+            response.headers["Vary"] = "Accept-Encoding"
+
+        response.headers["Cache-Control"] = self._cache_control(full_path, scope)
+        return response
+
+    def _precompressed_response(
+        self,
+        full_path: Path,
+        stat_result: os.stat_result,
+        request_headers: Headers,
+        status_code: int
+    ) -> Optional[Response]:
+        """최신 사전 압축본 응답 (없으면 None)"""
+        available = {}
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            variant = full_path.with_name(full_path.name + suffix)
+            try:
+                variant_stat = variant.stat()
+            except FileNotFoundError:
+                continue
+            if variant_stat.st_mtime >= stat_result.st_mtime:
+                available[encoding] = (variant, variant_stat)
+
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""), available)
+        if encoding is None:
+            return None
+
+        variant, variant_stat = available[encoding]
+        media_type = mimetypes.guess_type(full_path.name)[0] or "text/plain"
+        response = FileResponse(
+            variant,
+            status_code=status_code,
+            stat_result=variant_stat,
+            media_type=media_type,
+            headers={"Content-Encoding": encoding}
+        )
+
+        if self.is_not_modified(response.headers, request_headers):
+            return Response(status_code=304, headers={
+                "ETag": response.headers["etag"],
+                "Content-Encoding": encoding
+            })
+
+        return response
+
+    def _cache_control(self, full_path: Path, scope: Scope) -> str:
+        """버전 쿼리가 현재 content hash와 일치할 때만 immutable"""
+        query = scope.get("query_string", b"").decode("latin-1")
+        match = re.search(r"(?:^|&)v=([0-9a-f]+)", query)
+        if match:
+            try:
+                relative = full_path.resolve().relative_to(Path(self.directory).resolve())
+            except ValueError:
+                return REVALIDATE_CACHE_CONTROL
+            if match.group(1) == asset_version(relative.as_posix()):
+                return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+
+def precompress_static(root: Path = STATIC_DIR) -> int:
+    """
+    정적 텍스트 자산의 .gz / .br 사전 압축본 생성
+
+    원본보다 오래된 압축본만 다시 만듦 (배포 빌드 또는 시작 시 실행)
+
+    Returns:
+        생성한 파일 수
+    """
+    written = 0
+    for path in root.rglob("*"):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_EXTENSIONS:
+            continue
+        if GENERATED_DIRS.intersection(path.relative_to(root).parts):
+            continue
+
+        source_mtime = path.stat().st_mtime
+        pending = {}
+        for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+            if encoding == "br" and brotli is None:
+                continue
+            target = path.with_name(path.name + suffix)
+            if not target.exists() or target.stat().st_mtime < source_mtime:
+                pending[encoding] = target
+
+        if not pending:
+            continue
+
+        variants = compress_variants(path.read_bytes())
+        for encoding, target in pending.items():
+            tmp = target.with_name(target.name + ".tmp")
+            tmp.write_bytes(variants[encoding])
+            tmp.replace(target)
+            written += 1
+
+    if written:
+        logger.info(f"Precompressed {written} static assets")
+    return written
+
+
+if __name__ == "__main__":
+    precompress_static()